@@ -12,6 +12,10 @@ from src.grpc.servicer import ContainerMakerAPIServicerImpl
 from container_maker_spec.service_pb2_grpc import add_ContainerMakerAPIServicer_to_server
 from src.common.utils import read_certs
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.resources.namespace_reaper import NamespaceReaper
+from src.resources.image_prepull import ImagePrePuller
+from src.common.config import METRICS_PORT
+from src.common import metrics
 
 
 # logger setup
@@ -61,6 +65,12 @@ def serve(
             server.add_secure_port(server_bind, credentials)
 
         server.start()
+        # delete empty namespaces in the background (also cleans up after a restart).
+        NamespaceReaper.start()
+        # keep sidecar and popular images pulled on every node, if enabled.
+        ImagePrePuller.start()
+        if METRICS_PORT and metrics.start_server(METRICS_PORT):
+            logger.info(f"Metrics served at: {address}:{METRICS_PORT}")
         logger.info(f"Server started {'with SSL' if use_ssl else ''} at: {address}:{port}")
         server.wait_for_termination()
     except TimeoutError as te:
@@ -4,3 +4,17 @@ INGRESS_HOST: str = os.getenv('INGRESS_HOST', 'localhost')
 
 REPO_NAME: str = os.getenv('REPO_NAME')
 REPO_PASSWORD: str = os.getenv('REPO_PASSWORD')
+
+# Metrics. 0 disables the /metrics endpoint (it also needs prometheus_client).
+METRICS_PORT: int = int(os.getenv('METRICS_PORT', '0'))
+
+# Image pre-pull DaemonSet. Disabled unless IMAGE_PREPULL_ENABLED is set.
+IMAGE_PREPULL_ENABLED: bool = os.getenv('IMAGE_PREPULL_ENABLED', 'false').lower() == 'true'
+IMAGE_PREPULL_NAMESPACE: str = os.getenv('IMAGE_PREPULL_NAMESPACE', 'default')  # namespace of the DaemonSet
+IMAGE_PREPULL_TOP_K: int = int(os.getenv('IMAGE_PREPULL_TOP_K', '5'))  # most created user images to keep on every node
+IMAGE_PREPULL_IMAGES: list[str] = [image for image in os.getenv('IMAGE_PREPULL_IMAGES', '').split(',') if image]  # user images that may be pre-pulled
+
+# Warm pod pool. Disabled unless WARM_POOL_SIZE is set.
+WARM_POOL_SIZE: int = int(os.getenv('WARM_POOL_SIZE', '0'))  # warm pods kept per namespace, image and resource profile
+WARM_POOL_IMAGES: list[str] = [image for image in os.getenv('WARM_POOL_IMAGES', '').split(',') if image]  # images to keep warm, empty means all
+WARM_POOL_NAMESPACES: list[str] = [namespace for namespace in os.getenv('WARM_POOL_NAMESPACES', '').split(',') if namespace]  # namespaces with a pool, empty means none
@@ -0,0 +1,55 @@
+'''
+Optional prometheus metrics.
+
+prometheus_client is not a hard dependency: without it, every metric helper returns None
+and callers skip the update. The numbers callers keep for themselves stay available either way.
+'''
+
+# builtins
+from typing import Sequence
+
+try:
+    import prometheus_client
+except ImportError:  # metrics are optional
+    prometheus_client = None
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> object | None:
+    '''
+    Create a prometheus Gauge.
+    :params: name: str
+    :params: documentation: str
+    :params: labelnames: Sequence[str]
+    :returns: prometheus_client.Gauge | None: None if prometheus_client is not installed
+    '''
+    if prometheus_client is None:
+        return None
+    return prometheus_client.Gauge(name, documentation, labelnames)
+
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] | None = None) -> object | None:
+    '''
+    Create a prometheus Histogram.
+    :params: name: str
+    :params: documentation: str
+    :params: labelnames: Sequence[str]
+    :params: buckets: Sequence[float] | None - Upper bounds in seconds, prometheus_client defaults if None
+    :returns: prometheus_client.Histogram | None: None if prometheus_client is not installed
+    '''
+    if prometheus_client is None:
+        return None
+    if buckets is None:
+        return prometheus_client.Histogram(name, documentation, labelnames)
+    return prometheus_client.Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+def start_server(port: int) -> bool:
+    '''
+    Serve /metrics over HTTP.
+    :params: port: int
+    :returns: bool: False if prometheus_client is not installed
+    '''
+    if prometheus_client is None:
+        return False
+    prometheus_client.start_http_server(port)
+    return True
@@ -0,0 +1,68 @@
+'''
+Coalesce concurrent identical operations.
+
+Client retries and double clicks send the same create twice. Without coalescing, both requests do
+the get-then-create and both do the full wait. With single flight, the first request runs the operation
+and the duplicates wait on its result, sharing its return value or its error.
+'''
+
+# builtins
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+
+class SingleFlight:
+    '''
+    Run at most one call per key at a time. Callers that arrive while a call is in flight join it.
+    '''
+    calls: dict[tuple, Future] = {}
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def do(cls, key: tuple, function: Callable) -> object:
+        '''
+        Run function, or join the call with the same key that is already running.
+        :params: key: tuple - e.g. ('create', 'pod', namespace_name, pod_name)
+        :params: function: Callable - Zero argument function
+        :returns: object: Result of the call
+        '''
+        with cls.lock:
+            future: Future | None = cls.calls.get(key)
+            leader: bool = future is None
+            if leader:
+                future = Future()
+                cls.calls[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result: object = function()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with cls.lock:
+                cls.calls.pop(key, None)
+
+
+def single_flight(key: Callable) -> Callable:
+    '''
+    Decorate a manager method so that concurrent calls with the same key run once.
+    Goes below @classmethod:
+
+        @classmethod
+        @single_flight(lambda cls, data: ('create', 'pod', data.namespace_name, data.pod_name))
+        def create(cls, data: CreatePodDataClass) -> dict:
+
+    :params: key: Callable - Gets the arguments of the method, returns the key
+    :returns: Callable: Decorator
+    '''
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs) -> object:
+            return SingleFlight.do(key(*args, **kwargs), lambda: method(*args, **kwargs))
+        return wrapper
+    return decorator
@@ -0,0 +1,117 @@
+'''
+Per-phase latency timeline of one long operation (create, save, delete).
+
+Managers wrap their slow steps in Timeline.phase('pod.poll_status') and friends. Inside a Timeline
+(one per servicer call) the phases are collected, with their start offsets since phases of a pipelined
+create overlap, and sent back to the client as gRPC trailing metadata. Every phase is also observed in the
+container_maker_phase_seconds histogram, inside a Timeline or not.
+'''
+
+# builtins
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# modules
+from src.common.metrics import histogram
+
+PHASE_HISTOGRAM = histogram(
+    'container_maker_phase_seconds',
+    'Duration of one phase of an operation',
+    ['operation', 'phase'],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0, 320.0),
+)
+TIMELINE_METADATA_KEY: str = 'x-container-maker-timeline'
+
+
+class Timeline:
+    '''
+    Collect the phases of one operation.
+
+    Usage:
+        with Timeline('createContainer', context):
+            KubernetesContainerManager.create(data)
+    '''
+    current: ContextVar = ContextVar('operation_timeline', default=None)
+
+    def __init__(self, operation: str, context: object | None = None) -> None:
+        '''
+        :params: operation: str - e.g. 'createContainer'
+        :params: context: grpc.ServicerContext | None - Gets the timeline as trailing metadata on exit
+        '''
+        self.operation: str = operation
+        self.context: object | None = context
+        self.started: float = time.monotonic()
+        self.phases: list[dict] = []
+        self.lock: threading.Lock = threading.Lock()
+        self.token = None
+
+    def __enter__(self) -> 'Timeline':
+        self.token = Timeline.current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        Timeline.current.reset(self.token)
+        self.record('total', self.started, time.monotonic())
+        # failed operations get their timeline too, that is where it helps the most.
+        if self.context is not None:
+            self.context.set_trailing_metadata(self.to_metadata())
+
+    def record(self, phase: str, started: float, ended: float) -> None:
+        '''
+        Record a phase.
+        :params: phase: str
+        :params: started: float - time.monotonic() at the start of the phase
+        :params: ended: float - time.monotonic() at the end of the phase
+        :returns: None
+        '''
+        with self.lock:
+            self.phases.append({
+                'phase': phase,
+                'start_ms': round((started - self.started) * 1000),
+                'duration_ms': round((ended - started) * 1000),
+            })
+        if PHASE_HISTOGRAM is not None:
+            PHASE_HISTOGRAM.labels(self.operation, phase).observe(ended - started)
+
+    def to_metadata(self) -> tuple[tuple[str, str], ...]:
+        '''
+        Get the timeline as gRPC metadata.
+        :params: None
+        :returns: tuple[tuple[str, str], ...]: ((TIMELINE_METADATA_KEY, json list of phases),)
+        '''
+        with self.lock:
+            phases: list[dict] = sorted(self.phases, key=lambda phase: phase['start_ms'])
+        return ((TIMELINE_METADATA_KEY, json.dumps(phases, separators=(',', ':'))),)
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        '''
+        Time a phase of the current operation.
+        :params: name: str - '<kind>.<step>', e.g. 'service.wait_for_endpoints'
+        :returns: Iterator[None]
+        '''
+        started: float = time.monotonic()
+        try:
+            yield
+        finally:
+            cls.observe(name, started, time.monotonic())
+
+    @classmethod
+    def observe(cls, name: str, started: float, ended: float) -> None:
+        '''
+        Record a phase measured some other way, e.g. from the condition timestamps of a pod.
+        :params: name: str
+        :params: started: float - time.monotonic() based
+        :params: ended: float - time.monotonic() based
+        :returns: None
+        '''
+        timeline: Timeline | None = cls.current.get()
+        if timeline is not None:
+            timeline.record(name, started, ended)
+        elif PHASE_HISTOGRAM is not None:
+            PHASE_HISTOGRAM.labels('none', name).observe(ended - started)
@@ -13,6 +13,7 @@ import src.common.config as config
 
 # dataclasses
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.single_flight import single_flight
 from src.containers.dataclasses.list_container_dataclass import ListContainerDataClass
 from src.containers.dataclasses.get_container_dataclass import GetContainerDataClass
 from src.containers.dataclasses.create_container_dataclass import CreateContainerDataClass, ExposureLevel
@@ -23,23 +24,28 @@ from src.containers.dataclasses.save_container_dataclass import SaveContainerDat
 from src.resources.dataclasses.ingress.create_ingress_dataclass import CreateIngressDataClass
 from src.resources.dataclasses.ingress.delete_ingress_dataclass import DeleteIngressDataClass
 from src.resources.dataclasses.ingress.get_ingress_dataclass import GetIngressDataClass
-from src.resources.dataclasses.ingress.list_ingress_dataclass import ListIngressDataClass
 from src.resources.dataclasses.namespace.create_namespace_dataclass import CreateNamespaceDataClass
-from src.resources.dataclasses.namespace.delete_namespace_dataclass import DeleteNamespaceDataClass
 from src.resources.dataclasses.namespace.get_namespace_dataclass import GetNamespaceDataClass
 from src.resources.dataclasses.pod.create_pod_dataclass import CreatePodDataClass, ResourceRequirementsDataClass
 from src.resources.dataclasses.pod.delete_pod_dataclass import DeletePodDataClass
-from src.resources.dataclasses.pod.list_pod_dataclass import ListPodDataClass
+from src.resources.dataclasses.pod.get_pod_dataclass import GetPodDataClass
 from src.resources.dataclasses.pod.save_pod_dataclass import SavePodDataClass
 from src.resources.dataclasses.service.create_service_dataclass import CreateServiceDataClass, PublishInformationDataClass, ServiceType
 from src.resources.dataclasses.service.delete_service_dataclass import DeleteServiceDataClass
 from src.resources.dataclasses.service.get_service_dataclass import GetServiceDataClass
-from src.resources.dataclasses.service.list_service_dataclass import ListServiceDataClass
 from src.resources.namespace_manager import NamespaceManager
 from src.resources.pod_manager import PodManager
 from src.resources.resource_config import SNAPSHOT_SIDECAR_NAME
+from src.resources.resource_config import POD_UPTIME_TIMEOUT, SERVICE_ENDPOINTS_TIMEOUT_SECONDS
 from src.resources.service_manager import ServiceManager
 from src.resources.ingress_manager import IngressManager
+from src.resources.namespace_snapshot import NamespaceSnapshot
+from src.resources.namespace_reaper import NamespaceReaper
+from src.resources.warm_pod_pool import WarmPodPool
+from src.resources.image_prepull import ImagePrePuller
+from src.resources.fan_out import FanOut
+from src.resources.create_stages import CreateStages
+from src.resources.informer import InformerCache
 from src.containers import ContainerManager
 
 # kubernetes
@@ -51,105 +57,160 @@ class KubernetesContainerHelper:
     Helper class for Kubernetes Container Manager.
     '''
 
+    @classmethod
+    def resolve_container(cls, namespace_name: str, container_id: str) -> tuple[str, str] | None:
+        '''
+        Resolve the id of a container to the kind and name of the resource behind it.
+        Uses the UID index of the pod, service and ingress informers, so no resource is listed.
+        Returns None if no pod, service or ingress has this id.
+        '''
+        for kind, manager in (('pod', PodManager), ('service', ServiceManager), ('ingress', IngressManager)):
+            manager.check_kubernetes_client()
+            name: str | None = manager.informer(namespace_name).get_name_by_uid(container_id)
+            if name is not None:
+                return kind, name
+        return None
+
+    @classmethod
+    def get_resource(cls, namespace_name: str, kind: str, name: str) -> dict:
+        '''
+        Get the pod, service or ingress response of a resolved container.
+        '''
+        if kind == 'pod':
+            return PodManager.get(GetPodDataClass(namespace_name=namespace_name, pod_name=name))
+        if kind == 'service':
+            return ServiceManager.get(GetServiceDataClass(namespace_name=namespace_name, service_name=name))
+        return IngressManager.get(GetIngressDataClass(namespace_name=namespace_name, ingress_name=name))
+
+    @classmethod
+    def check_resource(cls, namespace_name: str, container_id: str, kind: str) -> dict | None:
+        '''
+        Check if id of the container is a resource of the given kind.
+        '''
+        resolved: tuple[str, str] | None = cls.resolve_container(namespace_name, container_id)
+        if resolved is None or resolved[0] != kind:
+            return None
+        return cls.get_resource(namespace_name, kind, resolved[1]) or None
+
     @classmethod
     def check_pod(cls, namespace_name: str, container_id: str) -> dict | None:
         '''
         Check if id of the container is pod.
         '''
-        pods: list = PodManager.list(ListPodDataClass(**{'namespace_name': namespace_name}))
-        for pod in pods:
-            if container_id == pod['pod_id']:
-                return pod
-        return None
+        return cls.check_resource(namespace_name, container_id, 'pod')
 
     @classmethod
     def check_service(cls, namespace_name: str, container_id: str) -> dict | None:
         '''
         Check if id of the container is service.
         '''
-        services: list = ServiceManager.list(ListServiceDataClass(**{'namespace_name': namespace_name}))
-        for service in services:
-            if container_id == service['service_id']:
-                return service
-        return None
+        return cls.check_resource(namespace_name, container_id, 'service')
 
     @classmethod
     def check_ingress(cls, namespace_name: str, container_id: str) -> dict | None:
         '''
         Check if id of the container is ingress.
-        Use list method, since, we get id and namespace in data but not the actual name of the ingress.
+        We get id and namespace in data but not the actual name of the ingress, so resolve the name from the id.
         '''
-        ingresses: list = IngressManager.list(ListIngressDataClass(**{'namespace_name': namespace_name}))
-        for ingress in ingresses:
-            if container_id == ingress['ingress_id']:
-                return ingress
-        return None
+        return cls.check_resource(namespace_name, container_id, 'ingress')
 
     @classmethod
-    def delete_pod(cls, namespace_name: str, pod_name: str) -> None:
+    def delete_pod(cls, namespace_name: str, pod_name: str, wait: bool = False) -> None:
         PodManager.delete(DeletePodDataClass(
             namespace_name=namespace_name,
             pod_name=pod_name,
+            wait=wait,
         ))
 
     @classmethod
-    def delete_service(cls, namespace_name: str, service_name: str) -> None:
+    def delete_service(cls, namespace_name: str, service_name: str, wait: bool = False) -> None:
         service: dict = ServiceManager.get(GetServiceDataClass(
             namespace_name=namespace_name,
             service_name=service_name,
         ))
-        # FIX: Use 'associated_resources' instead of 'associated_pods'
-        associated_pods: list = service.get('associated_resources', [])
-        for pod in associated_pods:
-            cls.delete_pod(namespace_name=namespace_name, pod_name=pod['pod_name'])
-        ServiceManager.delete(DeleteServiceDataClass(
-            namespace_name=namespace_name,
-            service_name=service_name,
-        ))
+        cls.teardown(namespace_name, service or {'resource_type': 'service', 'service_name': service_name}, wait=wait)
 
     @classmethod
-    def delete_ingress(cls, namespace_name: str, ingress_name: str) -> None:
+    def delete_ingress(cls, namespace_name: str, ingress_name: str, wait: bool = False) -> None:
+        # the ingress response already embeds its services and their pods, so one read plans the whole cascade.
         ingress: dict = IngressManager.get(GetIngressDataClass(
             namespace_name=namespace_name,
             ingress_name=ingress_name,
         ))
-        # FIX: Use 'associated_resources' instead of 'associated_services'
-        associated_services: list = ingress.get('associated_resources', [])
-        for service in associated_services:
-            cls.delete_service(namespace_name=namespace_name, service_name=service['service_name'])
-        IngressManager.delete(DeleteIngressDataClass(
-            namespace_name=namespace_name,
-            ingress_name=ingress_name,
-        ))
+        cls.teardown(namespace_name, ingress or {'resource_type': 'ingress', 'ingress_name': ingress_name}, wait=wait)
 
     @classmethod
-    def delete_lingering_namespaces(cls) -> None:
+    def teardown_stages(cls, resource: dict) -> list[list[tuple[str, str]]]:
         '''
-        Delete namespaces that have no resources associated with them.
-        Skip protected namespaces.
+        Plan the cascaded delete of a container: ingress, then its services, then their pods.
+        A pod shared by several services is deleted once.
+        :params: resource: dict - Ingress, service or pod response
+        :returns: list[list[tuple[str, str]]]: Stages of (kind, name), front to back
         '''
-        # System namespaces that should not be deleted.
-        PROTECTED_NAMESPACES: list[str] = [
-            'default', 
-            'kube-system', 
-            'kube-public', 
-            'kube-node-lease',
-            'ingress-nginx',
-            'metallb-system',
-        ]
-        # for the rest, we just check if there are no pods, services or ingresses.
-        namespaces: list = NamespaceManager.list()
-        for ns in namespaces:
-            namespace_name: str = ns['namespace_name']
-            if namespace_name in PROTECTED_NAMESPACES:
-                continue
-            pods: list = PodManager.list(ListPodDataClass(**{'namespace_name': namespace_name}))
-            services: list = ServiceManager.list(ListServiceDataClass(**{'namespace_name': namespace_name}))
-            ingresses: list = IngressManager.list(ListIngressDataClass(**{'namespace_name': namespace_name}))
-            if not (pods or services or ingresses):
-                NamespaceManager.delete(
-                    DeleteNamespaceDataClass(namespace_name=namespace_name)
-                )
+        stages: list[list[tuple[str, str]]] = []
+        level: list[dict] = [resource]
+        while level:
+            stage: dict[tuple[str, str], None] = {}
+            children: list[dict] = []
+            for item in level:
+                kind: str = item.get('resource_type', '')
+                if kind not in ('ingress', 'service', 'pod'):
+                    continue  # associated resources of a pod are its containers.
+                stage[(kind, item[f'{kind}_name'])] = None
+                children.extend(item.get('associated_resources') or [])
+            if stage:
+                stages.append(list(stage))
+            level = children
+        return stages
+
+    @classmethod
+    def teardown(cls, namespace_name: str, resource: dict, wait: bool = False) -> None:
+        '''
+        Delete a resource and everything associated with it.
+        Every delete is issued up front, a stage once the API server accepted the previous one,
+        so the ingress stops routing before its backends go away. With wait, all terminations
+        are then awaited together, so the cascade takes about as long as its slowest termination.
+        :params: namespace_name: str
+        :params: resource: dict - Ingress, service or pod response
+        :params: wait: bool - Block until every deleted resource is gone
+        '''
+        managers: dict = {
+            'pod': (PodManager, lambda name: DeletePodDataClass(namespace_name=namespace_name, pod_name=name, wait=False)),
+            'service': (ServiceManager, lambda name: DeleteServiceDataClass(namespace_name=namespace_name, service_name=name, wait=False)),
+            'ingress': (IngressManager, lambda name: DeleteIngressDataClass(namespace_name=namespace_name, ingress_name=name, wait=False)),
+        }
+        stages: list[list[tuple[str, str]]] = cls.teardown_stages(resource)
+        for stage in stages:
+            FanOut.run(*[
+                lambda kind=kind, name=name: managers[kind][0].delete(managers[kind][1](name))
+                for kind, name in stage
+            ])
+        if wait:
+            FanOut.run(*[
+                lambda kind=kind, name=name: managers[kind][0].poll_termination(namespace_name, name)
+                for stage in stages for kind, name in stage
+            ])
+
+    @classmethod
+    def rollback(cls, namespace_name: str, kind: str, name: str) -> None:
+        '''
+        Delete what one stage of a failed create made. An object that was never created is skipped.
+        A pod is found by its `app` label, since a claimed warm pod keeps its own name.
+        :params: namespace_name: str
+        :params: kind: str - pod, service or ingress
+        :params: name: str
+        '''
+        if kind == 'pod':
+            PodManager.invalidate_reads(namespace_name)
+            for pod in PodManager.list_by_selector(namespace_name, {'app': name}):
+                PodManager.delete(DeletePodDataClass(namespace_name=namespace_name, pod_name=pod['pod_name']))
+            return
+        if kind == 'service':
+            if ServiceManager.informer(namespace_name).get(name) is not None:
+                ServiceManager.delete(DeleteServiceDataClass(namespace_name=namespace_name, service_name=name))
+            return
+        if IngressManager.informer(namespace_name).get(name) is not None:
+            IngressManager.delete(DeleteIngressDataClass(namespace_name=namespace_name, ingress_name=name))
 
 
 class KubernetesContainerManager(ContainerManager):
@@ -166,25 +227,36 @@ class KubernetesContainerManager(ContainerManager):
         Services inside the ingress are not listed only ingresses are listed.
         Pods inside the service are not listed only services are listed.
         '''
+        # the namespace check, the pod list, the service list and the ingress list are independent,
+        # so they run concurrently. Everything else is joined in memory.
+        watched: set = InformerCache.watched(data.network_name)
+        namespace, pods, services, ingresses = FanOut.run(
+            lambda: NamespaceManager.get(GetNamespaceDataClass(namespace_name=data.network_name)),
+            *NamespaceSnapshot.readers(data.network_name),
+        )
         # if namespace does not exist return empty list
-        namespace: dict = NamespaceManager.get(GetNamespaceDataClass(namespace_name=data.network_name))
         if not namespace:
+            # do not keep watching a namespace that does not exist. Informers this list did not start,
+            # or that someone waits on, belong to a concurrent create of the namespace.
+            InformerCache.stop_unused(data.network_name, watched)
             return []
-        ingresses: list = IngressManager.list(ListIngressDataClass(**{'namespace_name': data.network_name}))
-        ingress_services: list = [service for ingress in ingresses for service in ingress.get('associated_resources', [])]
-        ingress_pods: list = [pod for service in ingress_services for pod in service.get('associated_resources', [])]
-        ingress_services_ids: list = [service['service_id'] for service in ingress_services]
-        ingress_pods_ids: list = [pod['pod_id'] for pod in ingress_pods]
-
-        services: list = ServiceManager.list(ListServiceDataClass(**{'namespace_name': data.network_name}))
-        unique_services: list = [service for service in services if service['service_id'] not in ingress_services_ids]
-        unique_service_pods: list = [pod for service in unique_services for pod in service.get('associated_resources', [])]
-        unique_service_pods_ids: list = [pod['pod_id'] for pod in unique_service_pods]
-
-        pod_ids_to_exclude: list = ingress_pods_ids + unique_service_pods_ids
-
-        pods: list = PodManager.list(ListPodDataClass(**{'namespace_name': data.network_name}))
-        unique_pods: list = [pod for pod in pods if pod['pod_id'] not in pod_ids_to_exclude]
+        snapshot: NamespaceSnapshot = NamespaceSnapshot(data.network_name, pods, services, ingresses)
+        ingresses: list = snapshot.ingresses
+        ingress_services_ids: set = {
+            service['service_id']
+            for ingress in ingresses
+            for service in ingress.get('associated_resources', [])
+        }
+        unique_services: list = [service for service in snapshot.services if service['service_id'] not in ingress_services_ids]
+
+        # pods behind ingress services and pods behind unique services are both excluded.
+        # Every service is one or the other, so that is every pod behind any service.
+        pod_ids_to_exclude: set = {
+            pod['pod_id']
+            for service in snapshot.services
+            for pod in service.get('associated_resources', [])
+        }
+        unique_pods: list = [pod for pod in snapshot.pods if pod['pod_id'] not in pod_ids_to_exclude]
 
         containers: list = []
         for ingress in ingresses:
@@ -233,10 +305,9 @@ class KubernetesContainerManager(ContainerManager):
         namespace: dict = NamespaceManager.get(GetNamespaceDataClass(namespace_name=data.network_name))
         if not namespace:
             return {}
-        pod: dict | None = KubernetesContainerHelper.check_pod(namespace_name=data.network_name, container_id=data.container_id)
-        service: dict | None = KubernetesContainerHelper.check_service(namespace_name=data.network_name, container_id=data.container_id)
-        ingress: dict | None = KubernetesContainerHelper.check_ingress(namespace_name=data.network_name, container_id=data.container_id)
-        final_container: dict = pod or service or ingress or {}
+        # one UID lookup, then one targeted read.
+        resolved: tuple[str, str] | None = KubernetesContainerHelper.resolve_container(namespace_name=data.network_name, container_id=data.container_id)
+        final_container: dict = KubernetesContainerHelper.get_resource(data.network_name, *resolved) if resolved else {}
 
         if not final_container:
             raise Exception(f'Cannot find, container_id={data.container_id} in namespace={data.network_name}')
@@ -267,32 +338,29 @@ class KubernetesContainerManager(ContainerManager):
         namespace: dict = NamespaceManager.get(GetNamespaceDataClass(namespace_name=data.network_name))
         if not namespace:
             return []
-        pod: dict | None = KubernetesContainerHelper.check_pod(namespace_name=data.network_name, container_id=data.container_id)
-        service: dict | None = KubernetesContainerHelper.check_service(namespace_name=data.network_name, container_id=data.container_id)
-        ingress: dict | None = KubernetesContainerHelper.check_ingress(namespace_name=data.network_name, container_id=data.container_id)
-        final_container: dict = pod or service or ingress or {}
+        resolved: tuple[str, str] | None = KubernetesContainerHelper.resolve_container(namespace_name=data.network_name, container_id=data.container_id)
 
-        if not final_container:
+        if not resolved:
             raise Exception(f'Cannot find, container_id={data.container_id} in namespace={data.network_name}')
 
-        if pod:
+        kind, name = resolved
+        if kind == 'pod':
             # if its a pod, we will only get a dictionary back.
             # To make the output consistent, we will put it in a list.
             return [PodManager.save(SavePodDataClass(
                 namespace_name=data.network_name,
-                pod_name=pod['pod_name'],
+                pod_name=name,
                 sidecar_pod_name=SNAPSHOT_SIDECAR_NAME,
             ))]
-        if service:
+        if kind == 'service':
             return ServiceManager.save_service_pods(GetServiceDataClass(
                 namespace_name=data.network_name,
-                service_name=service['service_name'],
-            ))
-        if ingress:
-            return IngressManager.save_ingress_services(GetIngressDataClass(
-                namespace_name=data.network_name,
-                ingress_name=ingress['ingress_name'],
+                service_name=name,
             ))
+        return IngressManager.save_ingress_services(GetIngressDataClass(
+            namespace_name=data.network_name,
+            ingress_name=name,
+        ))
 
     @classmethod
     def validate_publish_information(cls, publish_information: list) -> None:
@@ -311,17 +379,18 @@ class KubernetesContainerManager(ContainerManager):
                 raise ValueError(f'Duplicate publish port: {p.publish_port}')
 
     @classmethod
+    @single_flight(lambda cls, data: ('create', 'container', data.network_name, data.container_name))
     def create(cls, data: CreateContainerDataClass) -> dict:
         '''
         Create a container.
         Create the namespace. If it already exists, use it.
-        First create the pod.
-        Then if,
+        Then create the pod and, at the same time, if
         - Exposure level is greater than ExposureLevel.CLUSTER_LOCAL, create the service of type ClusterIP.
         - Exposure level is greater than ExposureLevel.CLUSTER_EXTERNAL, create the service of type LoadBalancer.
         - Exposure level is greater than ExposureLevel.EXPOSED, create the ingress.
         '''
         try:
+            ImagePrePuller.record(data.image_name)
             NamespaceManager.create(CreateNamespaceDataClass(namespace_name=data.network_name))
             cls.validate_publish_information(data.publish_information)
             final_container: dict = {}
@@ -335,22 +404,30 @@ class KubernetesContainerManager(ContainerManager):
                 ephemeral_limit=data.resource_requirements.ephemeral_limit,
                 snapshot_size_limit=data.resource_requirements.snapshot_size_limit,
             )
-            pod: dict = PodManager.create(CreatePodDataClass(
+            # every object is submitted as soon as its name is known: a service and an ingress do not need
+            # a running pod to exist. Each create then waits on its own readiness, all of them together,
+            # so an exposed container takes as long as its slowest stage instead of the sum of them.
+            # If one stage fails, the others are cancelled and every stage is rolled back, see CreateStages.
+            pod_data: CreatePodDataClass = CreatePodDataClass(
                 image_name=data.image_name,
                 pod_name=f'{data.container_name}-pod',
                 namespace_name=data.network_name,
                 target_ports={pi.target_port for pi in data.publish_information},
                 environment_variables=data.environment_variables,
                 resource_requirements=resource_requirements,
-            ))
-            final_container = pod
+            )
+            # a warm pod of the same image and resources is claimed if there is one, see WarmPodPool.
+            stages: list[tuple] = [(
+                lambda: WarmPodPool.claim(pod_data) or PodManager.create(pod_data),
+                lambda: cls.helper.rollback(data.network_name, 'pod', pod_data.pod_name),
+            )]
             # create the service if exposure level is greater than ExposureLevel.INTERNAL
             if data.exposure_level.value > ExposureLevel.INTERNAL.value:
                 service_type: ServiceType = (
                     ServiceType.LOAD_BALANCER if data.exposure_level.value > ExposureLevel.CLUSTER_LOCAL.value
                     else ServiceType.CLUSTER_IP
                 )
-                service: dict = ServiceManager.create(CreateServiceDataClass(
+                stages.append((lambda: ServiceManager.create(CreateServiceDataClass(
                     service_name=f'{data.container_name}-service',
                     pod_name=f'{data.container_name}-pod',
                     namespace_name=data.network_name,
@@ -362,19 +439,28 @@ class KubernetesContainerManager(ContainerManager):
                         )
                         for pi in data.publish_information
                     ],
-                    service_type=service_type
-                ))
-                final_container = service
+                    service_type=service_type,
+                    # the endpoints only get ready once the pod started, which is no longer awaited first.
+                    endpoints_timeout_seconds=POD_UPTIME_TIMEOUT + SERVICE_ENDPOINTS_TIMEOUT_SECONDS,
+                )), lambda: cls.helper.rollback(data.network_name, 'service', f'{data.container_name}-service')))
             # create an ingress if exposure level is greater than ExposureLevel.CLUSTER_EXTERNAL
             if data.exposure_level.value > ExposureLevel.CLUSTER_EXTERNAL.value:
-                ingress: dict = IngressManager.create(CreateIngressDataClass(
+                stages.append((lambda: IngressManager.create(CreateIngressDataClass(
                     namespace_name=data.network_name,
                     ingress_name=f'{data.container_name}-ingress',
                     service_name=f'{data.container_name}-service',
                     host=config.INGRESS_HOST,
-                    service_ports=service['service_ports']
-                ))
-                final_container = ingress
+                    # the ingress only needs the service ports, which are the publish ports.
+                    service_ports=[
+                        {'name': None, 'container_port': pi.publish_port, 'protocol': pi.protocol}
+                        for pi in data.publish_information
+                    ],
+                )), lambda: cls.helper.rollback(data.network_name, 'ingress', f'{data.container_name}-ingress')))
+            created: list[dict] = CreateStages.run(*stages)
+            final_container = created[-1]
+            if final_container['resource_type'] == 'ingress':
+                # the ingress may be ready before its service, so embed the service as it was once ready.
+                final_container = {**final_container, 'associated_resources': [created[1]]}
 
             id_key: str = [key for key in final_container.keys() if key.endswith('_id')][0]
             ip_key: str = [key for key in final_container.keys() if key.endswith('_ip')][0]
@@ -434,29 +520,26 @@ class KubernetesContainerManager(ContainerManager):
         3. This means when the ingress container is deleted, all associated resources should also be deleted.
             Because the container is a whole, i.e. ingress + service + pod.
         4. We should however, delete the lingering resources if there are any, but as it is, thats how things should be.
+        5. The network (namespace) is not deleted here, even when the container was the last thing in it.
+            NamespaceReaper deletes it later, in the background, once it has been empty for REAPER_GRACE_SECONDS.
         '''
         try:
             namespace: dict = NamespaceManager.get(GetNamespaceDataClass(namespace_name=data.network_name))
             if not namespace:
                 return {'container_id': data.container_id, 'status': f'Network: {data.network_name} does not exist.'}
-            pod: dict | None = KubernetesContainerHelper.check_pod(
-                namespace_name=data.network_name, container_id=data.container_id)
-            if pod:
-                KubernetesContainerHelper.delete_pod(namespace_name=data.network_name, pod_name=pod['pod_name'])
-
-            service: dict | None = KubernetesContainerHelper.check_service(
-                namespace_name=data.network_name, container_id=data.container_id)
-            if service:
-                KubernetesContainerHelper.delete_service(
-                    namespace_name=data.network_name, service_name=service['service_name'])
-
-            ingress: dict | None = KubernetesContainerHelper.check_ingress(
+            resolved: tuple[str, str] | None = KubernetesContainerHelper.resolve_container(
                 namespace_name=data.network_name, container_id=data.container_id)
-            if ingress:
-                KubernetesContainerHelper.delete_ingress(
-                    namespace_name=data.network_name, ingress_name=ingress['ingress_name'])
-            # delete lingering resources.
-            KubernetesContainerHelper.delete_lingering_namespaces()
+            if resolved:
+                kind, name = resolved
+                # without wait, the delete returns once the API server accepted it. Reads already hide the resources.
+                if kind == 'pod':
+                    KubernetesContainerHelper.delete_pod(namespace_name=data.network_name, pod_name=name, wait=data.wait)
+                elif kind == 'service':
+                    KubernetesContainerHelper.delete_service(namespace_name=data.network_name, service_name=name, wait=data.wait)
+                else:
+                    KubernetesContainerHelper.delete_ingress(namespace_name=data.network_name, ingress_name=name, wait=data.wait)
+            # the namespace is deleted in the background once it stays empty.
+            NamespaceReaper.notify(data.network_name)
             return {'container_id': data.container_id, 'status': 'Deleted'}
         except ApiException as ae:
             raise ApiException(f'Error occurred while deleting container: {str(ae)}') from ae
@@ -6,3 +6,4 @@ from dataclasses import dataclass
 class DeleteContainerDataClass:
     container_id: str  # id of the container to delete
     network_name: str  # network of the container to delete
+    wait: bool = False  # block until the deleted resources are gone
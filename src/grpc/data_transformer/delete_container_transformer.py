@@ -12,7 +12,9 @@ class DeleteContainerInputDataTransformer(InputDataTransformer):
     def transform(cls, input_data: DeleteContainerRequest) -> DeleteContainerDataClass:
         return DeleteContainerDataClass(
             container_id=input_data.container_id,
-            network_name=input_data.network_name
+            network_name=input_data.network_name,
+            # optional, older versions of the spec have no wait field.
+            wait=getattr(input_data, 'wait', False),
         )
 
 
@@ -14,6 +14,8 @@ from container_maker_spec.types_pb2 import SaveContainerResponse
 
 # modules
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.timeline import Timeline
+from src.resources.request_context import RequestContext
 
 # third party
 from grpc import ServicerContext
@@ -52,7 +54,8 @@ class ContainerMakerAPIServicerImpl(ContainerMakerAPIServicer):
     def createContainer(self, request: CreateContainerRequest, context: ServicerContext) -> ContainerResponse:
         try:
             input_data: CreateContainerDataClass = CreateContainerInputDataTransformer.transform(request)
-            container: dict = KubernetesContainerManager.create(input_data)
+            with RequestContext(), Timeline('createContainer', context):
+                container: dict = KubernetesContainerManager.create(input_data)
             output_data: ContainerResponse = CreateContainerOutputDataTransformer.transform(container)
             return output_data
         except TimeoutError as te:
@@ -67,7 +70,8 @@ class ContainerMakerAPIServicerImpl(ContainerMakerAPIServicer):
     def listContainer(self, request: ListContainerRequest, context: ServicerContext) -> ListContainerResponse:
         try:
             input_data: ListContainerDataClass = ListContainerInputDataTransformer.transform(request)
-            containers: list[dict] = KubernetesContainerManager.list(input_data)
+            with RequestContext():
+                containers: list[dict] = KubernetesContainerManager.list(input_data)
             output_data: ListContainerResponse = ListContainerOutputDataTransformer.transform(containers)
             return output_data
         except TimeoutError as te:
@@ -82,7 +86,8 @@ class ContainerMakerAPIServicerImpl(ContainerMakerAPIServicer):
     def getContainer(self, request: GetContainerRequest, context: ServicerContext) -> ContainerResponse:
         try:
             input_data: GetContainerDataClass = GetContainerInputDataTransformer.transform(request)
-            container: dict = KubernetesContainerManager.get(input_data)
+            with RequestContext():
+                container: dict = KubernetesContainerManager.get(input_data)
             output_data: ContainerResponse = GetContainerOutputDataTransformer.transform(container)
             return output_data
         except TimeoutError as te:
@@ -97,7 +102,8 @@ class ContainerMakerAPIServicerImpl(ContainerMakerAPIServicer):
     def deleteContainer(self, request: DeleteContainerRequest, context: ServicerContext) -> DeleteContainerResponse:
         try:
             input_data: DeleteContainerDataClass = DeleteContainerInputDataTransformer.transform(request)
-            container: dict = KubernetesContainerManager.delete(input_data)
+            with RequestContext(), Timeline('deleteContainer', context):
+                container: dict = KubernetesContainerManager.delete(input_data)
             output_data: DeleteContainerResponse = DeleteContainerOutputDataTransformer.transform(container)
             return output_data
         except TimeoutError as te:
@@ -112,7 +118,8 @@ class ContainerMakerAPIServicerImpl(ContainerMakerAPIServicer):
     def saveContainer(self, request: SaveContainerRequest, context: ServicerContext) -> SaveContainerResponse:
         try:
             input_data: SaveContainerDataClass = SaveContainerInputDataTransformer.transform(request)
-            container: dict = KubernetesContainerManager.save(input_data)
+            with RequestContext(), Timeline('saveContainer', context):
+                container: dict = KubernetesContainerManager.save(input_data)
             output_data: SaveContainerResponse = SaveContainerOutputDataTransformer.transform(container)
             return output_data
         except TimeoutError as te:
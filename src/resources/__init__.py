@@ -1,5 +1,6 @@
 # builtins
 from abc import abstractmethod
+from typing import Callable
 
 # modules
 from src.resources.dataclasses import GetResourceDataClass, ListResourceDataClass
@@ -7,6 +8,9 @@ from src.resources.dataclasses import CreateResourceDataClass
 from src.resources.dataclasses import DeleteResourceDataClass
 from src.common.utils import get_runtime_environment
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.timeline import Timeline
+from src.resources.request_context import RequestContext
+from src.resources.informer import InformerCache, KubernetesInformer
 
 # third party
 from kubernetes.client import CoreV1Api
@@ -88,6 +92,103 @@ class KubernetesResourceManager(ResourceManager):
             )
             raise UnsupportedRuntimeEnvironment(client_is_none)
 
+    @classmethod
+    def memoized_read(cls, verb: str, kind: str, namespace_name: str | None, name: str | None, read_function: Callable) -> object:
+        '''
+        Run a read once per request.
+        Inside a RequestContext, the result of read_function is memoized under (verb, kind, namespace_name, name).
+        Outside of one, read_function is simply called.
+        Exceptions are not memoized.
+        :params: verb: str - e.g. 'get' or 'list'
+        :params: kind: str - e.g. 'pod'
+        :params: namespace_name: str | None
+        :params: name: str | None - None for list reads
+        :params: read_function: Callable - Zero argument function doing the actual read
+        :returns: object: Result of read_function
+        '''
+        context: RequestContext | None = RequestContext.current.get()
+        if context is None:
+            return read_function()
+        key: tuple = (verb, kind, namespace_name, name)
+        found, value = context.get(key)
+        if found:
+            return value
+        value = read_function()
+        context.set(key, value)
+        return value
+
+    @classmethod
+    def invalidate_reads(cls, namespace_name: str) -> None:
+        '''
+        Drop the memoized reads of a namespace after a write.
+        :params: namespace_name: str
+        :returns: None
+        '''
+        context: RequestContext | None = RequestContext.current.get()
+        if context is not None:
+            context.invalidate(namespace_name)
+
+    @classmethod
+    def wait_until(cls, kind: str, list_function: Callable, namespace_name: str | None, name: str, predicate: Callable, timeout_seconds: float) -> object | None:
+        '''
+        Wait for a condition on one object.
+        Every wait is a waiter on the informer of (kind, namespace), so all in-flight operations share
+        one watch per kind and namespace, no matter how many of them are waiting.
+        :params: kind: str - e.g. 'pod'
+        :params: list_function: Callable - list_namespaced_* (or list_* for cluster scoped kinds) function of the kubernetes client
+        :params: namespace_name: str | None - None for cluster scoped kinds
+        :params: name: str
+        :params: predicate: Callable - (event_type, obj) -> bool. event_type is ADDED, MODIFIED, DELETED,
+                 or MISSING (obj None) when the object does not exist. May raise to fail the wait.
+        :params: timeout_seconds: float
+        :returns: object | None: The object of the accepted event
+        :raises: TimeoutError: If the condition is not met within timeout_seconds
+        '''
+        informer: KubernetesInformer = InformerCache.get_informer(kind, namespace_name, list_function)
+        return informer.wait_for(name, predicate, timeout_seconds)
+
+    @classmethod
+    def wait_for_terminating(cls, informer: KubernetesInformer, name: str, timeout_seconds: float) -> None:
+        '''
+        If an object of that name is still being deleted, wait until it is gone, so that it can be created again.
+        Reads hide objects being deleted, so without this a create right after a delete would fail with a conflict.
+        :params: informer: KubernetesInformer
+        :params: name: str
+        :params: timeout_seconds: float
+        :returns: None
+        :raises: TimeoutError: If the object is still there after timeout_seconds
+        '''
+        if informer.get(name, include_deleting=True) is None or informer.get(name) is not None:
+            return
+        with Timeline.phase(f'{informer.kind}.wait_for_terminating'):
+            informer.wait_for(name, lambda event_type, obj: event_type in ('DELETED', 'MISSING'), timeout_seconds)
+        if informer.namespace_name is not None:
+            cls.invalidate_reads(informer.namespace_name)
+
+    @classmethod
+    def wait_for_deletion(cls, kind: str, list_function: Callable, namespace_name: str | None, name: str, timeout_seconds: float) -> None:
+        '''
+        Wait until an object is gone, i.e. its DELETED event arrives or it is no longer in the informer.
+        :params: kind: str - e.g. 'pod'
+        :params: list_function: Callable
+        :params: namespace_name: str | None - None for cluster scoped kinds
+        :params: name: str
+        :params: timeout_seconds: float
+        :returns: None
+        :raises: TimeoutError: If the object still exists after timeout_seconds
+        '''
+        with Timeline.phase(f'{kind}.poll_termination'):
+            cls.wait_until(
+                kind,
+                list_function,
+                namespace_name,
+                name,
+                lambda event_type, obj: event_type in ('DELETED', 'MISSING'),
+                timeout_seconds,
+            )
+        if namespace_name is not None:
+            cls.invalidate_reads(namespace_name)
+
 
 class DockerResourceManager(ResourceManager):
     pass
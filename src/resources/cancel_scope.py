@@ -0,0 +1,87 @@
+'''
+Cancel the informer waits of a group of calls.
+
+The stages of a create (pod, service, ingress) block for up to minutes on their readiness waits.
+When one stage fails, the others are cancelled through the CancelScope they run in: every wait
+registered in the scope fails at once, and so does every later wait.
+'''
+
+# builtins
+from contextvars import ContextVar
+import threading
+from typing import Callable
+
+
+class WaitCancelled(Exception):
+    '''
+    A wait of a cancelled scope.
+    '''
+    pass
+
+
+class CancelScope:
+    '''
+    Cancellation token for the waits of the calls that run inside it.
+    Calls on other threads join the scope by running in a copy of the context.
+
+    Usage:
+        with CancelScope() as scope:
+            ...
+            scope.cancel('service create failed')
+    '''
+    current: ContextVar = ContextVar('cancel_scope', default=None)
+
+    def __init__(self) -> None:
+        self.reason: str | None = None
+        self.callbacks: list[Callable] = []
+        self.lock: threading.Lock = threading.Lock()
+        self.token = None
+
+    def __enter__(self) -> 'CancelScope':
+        self.token = CancelScope.current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        CancelScope.current.reset(self.token)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def cancel(self, reason: str) -> None:
+        '''
+        Cancel every wait of the scope. Only the first reason is kept.
+        :params: reason: str
+        :returns: None
+        '''
+        with self.lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+            callbacks: list[Callable] = self.callbacks
+            self.callbacks = []
+        for callback in callbacks:
+            callback(WaitCancelled(f'Cancelled: {reason}'))
+
+    def on_cancel(self, callback: Callable) -> Callable:
+        '''
+        Register a callback for the cancellation. It runs at once if the scope is already cancelled.
+        :params: callback: Callable - (error: WaitCancelled) -> None
+        :returns: Callable: Unregisters the callback
+        '''
+        with self.lock:
+            if self.reason is None:
+                self.callbacks.append(callback)
+                return lambda: self.remove(callback)
+        callback(WaitCancelled(f'Cancelled: {self.reason}'))
+        return lambda: None
+
+    def remove(self, callback: Callable) -> None:
+        '''
+        Unregister a callback.
+        :params: callback: Callable
+        :returns: None
+        '''
+        with self.lock:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
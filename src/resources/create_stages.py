@@ -0,0 +1,73 @@
+'''
+Run the stages of one create (pod, service, ingress) concurrently.
+
+The stages block for up to minutes on readiness waits, so they do not run on the FanOut executor,
+which is kept for short reads. The first stage runs on the calling thread and every other stage
+gets a thread of its own: concurrent creates never wait on each other
+for a worker, and never hold one that a read needs.
+'''
+
+# builtins
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+# modules
+from src.resources.cancel_scope import CancelScope
+
+
+class CreateStages:
+    '''
+    Run create stages all at once, all or nothing.
+    When a stage fails, the waits of the other stages are cancelled, the objects of every stage are
+    rolled back, and the error of the failed stage is raised.
+    '''
+
+    @classmethod
+    def run(cls, *stages: tuple[Callable, Callable]) -> list:
+        '''
+        Run the stages concurrently and return their results in order.
+        :params: stages: tuple[Callable, Callable] - (create, rollback) per stage. create takes no arguments
+                 and returns the result of the stage, rollback takes no arguments and deletes what create made.
+        :returns: list: Results, in the order of stages
+        :raises: The error of the first stage that failed, once every stage is rolled back
+        '''
+        if len(stages) < 2:
+            return [create() for create, _ in stages]
+        lock: threading.Lock = threading.Lock()
+        failures: list[tuple[int, BaseException]] = []
+
+        with CancelScope() as scope:
+            def run_stage(position: int) -> object:
+                try:
+                    return stages[position][0]()
+                except BaseException as e:
+                    with lock:
+                        failures.append((position, e))
+                    scope.cancel(f'stage {position} failed: {str(e)}')
+                    raise
+
+            with ThreadPoolExecutor(max_workers=len(stages) - 1, thread_name_prefix='create-stage') as executor:
+                futures: list[Future] = [
+                    executor.submit(contextvars.copy_context().run, run_stage, position)
+                    for position in range(1, len(stages))
+                ]
+                try:
+                    first: object = run_stage(0)
+                except BaseException:
+                    first = None
+            # the executor has joined every stage here, so nothing is created after its rollback.
+
+        if not failures:
+            return [first] + [future.result() for future in futures]
+        error: BaseException = failures[0][1]
+        # the failed stage is rolled back too: it may have failed after its create call, e.g. on a readiness wait.
+        # Rollbacks skip objects that were never created. Later stages (e.g. the ingress) depend on earlier ones,
+        # so they are undone first.
+        for position in reversed(range(len(stages))):
+            try:
+                stages[position][1]()
+            except Exception as e:
+                print(f'Could not roll back create stage {position}: {str(e)}')
+        raise error
@@ -12,3 +12,4 @@ class DeleteIngressDataClass(DeleteResourceDataClass):
     '''
     namespace_name: str  # The namespace to delete ingress from.
     ingress_name: str  # The ingress to delete.
+    wait: bool = False  # Block until the ingress is gone, instead of returning once the delete is accepted.
@@ -11,4 +11,5 @@ class DeleteNamespaceDataClass(DeleteResourceDataClass):
     Delete Namespace DataClass
     '''
     namespace_name: str  # name of the namespace.
+    wait: bool = True  # block until the namespace is gone. Namespaces are named after users, so they are reused.
 
@@ -12,3 +12,4 @@ class DeletePodDataClass(DeleteResourceDataClass):
     '''
     namespace_name: str  # namespace of the pod
     pod_name: str  # name of the pod
+    wait: bool = False  # block until the pod is gone, instead of returning once the delete is accepted
@@ -32,3 +32,4 @@ class CreateServiceDataClass(CreateResourceDataClass):
     publish_information: list[PublishInformationDataClass]  # list of publish information
     service_type: Optional[ServiceType] = None  # type of the service. Default is LoadBalancer.
     node_port: Optional[int] = None  #  to hardcode the port for the service.
+    endpoints_timeout_seconds: Optional[float] = None  # how long to wait for a ready endpoint. Default is SERVICE_ENDPOINTS_TIMEOUT_SECONDS.
@@ -11,4 +11,5 @@ class DeleteServiceDataClass(DeleteResourceDataClass):
     Delete Service DataClass
     '''
     namespace_name: str
-    service_name: str 
+    service_name: str
+    wait: bool = False  # block until the service is gone, instead of returning once the delete is accepted 
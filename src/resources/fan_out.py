@@ -0,0 +1,53 @@
+'''
+Run independent kubernetes reads concurrently on one bounded, process wide executor.
+'''
+
+# builtins
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+# modules
+from src.resources.resource_config import FAN_OUT_MAX_WORKERS
+
+
+class FanOut:
+    '''
+    Submit a few independent calls at once and join their results.
+    Every call runs in a copy of the caller's context, so the RequestContext memo is shared.
+    '''
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=FAN_OUT_MAX_WORKERS, thread_name_prefix='fan-out')
+    worker: threading.local = threading.local()
+
+    @classmethod
+    def run_in_worker(cls, function: Callable) -> object:
+        '''
+        Run a function, marking the current thread as a fan out worker.
+        '''
+        cls.worker.active = True
+        try:
+            return function()
+        finally:
+            cls.worker.active = False
+
+    @classmethod
+    def run(cls, *functions: Callable) -> list:
+        '''
+        Run zero argument functions concurrently and return their results in order.
+        The first exception is raised once every call has finished.
+        A fan out from inside a worker runs inline, so nested fan outs can not starve the executor.
+        :params: functions: Callable - Zero argument functions
+        :returns: list: Results, in the order of functions
+        '''
+        if getattr(cls.worker, 'active', False) or len(functions) < 2:
+            return [function() for function in functions]
+        futures: list[Future] = [
+            cls.executor.submit(contextvars.copy_context().run, cls.run_in_worker, function)
+            for function in functions
+        ]
+        errors: list[BaseException] = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
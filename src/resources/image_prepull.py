@@ -0,0 +1,320 @@
+'''
+Keep the images a create needs cached on every node.
+
+Every pod runs the snapshot and status sidecars next to the user image, so a create on a node
+that never ran one pulls three images first. A managed DaemonSet pulls the sidecar images and the
+IMAGE_PREPULL_TOP_K most created images of the IMAGE_PREPULL_IMAGES allowlist on every node.
+Each image is a container of its own that sleeps, so one image that can not run does not hold back
+the others. The sleep is a static busybox copied in through an emptyDir: no binary of a pulled image
+is ever run, and the pods get no service account token.
+New or autoscaled nodes get the DaemonSet pod, and so the images, before their first create.
+'''
+
+# builtins
+import threading
+import time
+
+# modules
+import src.common.config as config
+from src.common.metrics import gauge
+from src.resources import KubernetesResourceManager
+from src.resources.resource_config import SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME
+from src.resources.resource_config import IMAGE_PREPULL_DAEMONSET_NAME, IMAGE_PREPULL_TOOLS_IMAGE, IMAGE_PREPULL_TOOLS_DIR, IMAGE_PREPULL_RUN_AS_USER
+from src.resources.resource_config import IMAGE_PREPULL_RECONCILE_SECONDS, IMAGE_PREPULL_HALF_LIFE_SECONDS
+
+# third party
+from kubernetes.client import AppsV1Api
+from kubernetes.client import V1DaemonSet, V1DaemonSetSpec, V1DaemonSetUpdateStrategy, V1RollingUpdateDaemonSet
+from kubernetes.client import V1LabelSelector, V1PodTemplateSpec, V1PodSpec, V1Container, V1ObjectMeta
+from kubernetes.client import V1ResourceRequirements, V1Node, V1Volume, V1VolumeMount, V1EmptyDirVolumeSource
+from kubernetes.client import V1PodSecurityContext, V1SecurityContext, V1Capabilities
+from kubernetes.client.rest import ApiException
+
+
+IMAGE_NODES_GAUGE = gauge('container_maker_image_prepull_nodes', 'Nodes that have a pre-pulled image', ['image'])
+NODES_GAUGE = gauge('container_maker_image_prepull_nodes_total', 'Nodes in the cluster')
+DAEMONSET_READY_GAUGE = gauge('container_maker_image_prepull_daemonset_ready', 'Nodes whose pre-pull pod pulled every image')
+
+
+def normalize_image(image_name: str) -> str:
+    '''
+    Get the fully qualified name of an image, as nodes report it (e.g. ubuntu -> docker.io/library/ubuntu:latest).
+    :params: image_name: str
+    :returns: str
+    '''
+    name: str = image_name
+    first: str = name.split('/')[0]
+    if '/' not in name or ('.' not in first and ':' not in first and first != 'localhost'):
+        name = f'docker.io/{name}'
+    if name.startswith('docker.io/') and name.count('/') == 1:
+        name = name.replace('docker.io/', 'docker.io/library/', 1)
+    if '@' not in name and ':' not in name.split('/')[-1]:
+        name = f'{name}:latest'
+    return name
+
+
+class ImagePopularity:
+    '''
+    Decaying create count per image: a create counts 1, halving every IMAGE_PREPULL_HALF_LIFE_SECONDS.
+    '''
+
+    def __init__(self, half_life_seconds: float = IMAGE_PREPULL_HALF_LIFE_SECONDS) -> None:
+        '''
+        :params: half_life_seconds: float
+        '''
+        self.half_life_seconds: float = half_life_seconds
+        self.scores: dict[str, tuple[float, float]] = {}  # image -> (score, time of the score)
+        self.lock: threading.Lock = threading.Lock()
+
+    def score(self, image_name: str, now: float) -> float:
+        '''
+        Get the score of an image at a point in time. Called with the lock held.
+        :params: image_name: str
+        :params: now: float
+        :returns: float
+        '''
+        score, scored_at = self.scores.get(image_name, (0.0, now))
+        return score * 0.5 ** ((now - scored_at) / self.half_life_seconds)
+
+    def record(self, image_name: str, now: float | None = None) -> None:
+        '''
+        Count one create of an image.
+        :params: image_name: str
+        :params: now: float | None - Defaults to time.time()
+        :returns: None
+        '''
+        now = time.time() if now is None else now
+        with self.lock:
+            self.scores[image_name] = (self.score(image_name, now) + 1.0, now)
+
+    def top(self, k: int, now: float | None = None) -> list[str]:
+        '''
+        Get the k most popular images.
+        :params: k: int
+        :params: now: float | None - Defaults to time.time()
+        :returns: list[str]: Most popular first
+        '''
+        now = time.time() if now is None else now
+        with self.lock:
+            ranked: list[tuple[float, str]] = sorted(
+                ((self.score(image_name, now), image_name) for image_name in self.scores),
+                key=lambda item: (-item[0], item[1]),
+            )
+        return [image_name for _, image_name in ranked[:k]]
+
+
+class ImagePrePuller:
+    '''
+    Reconcile the pre-pull DaemonSet with the sidecar images and the most popular user images,
+    and report how many nodes have each image.
+    '''
+    popularity: ImagePopularity = ImagePopularity()
+    apps_client: AppsV1Api | None = None
+    images: list[str] = []  # images of the DaemonSet, as last reconciled
+    pull_state: dict[str, int] = {}  # image -> nodes that have it
+    lock: threading.Lock = threading.Lock()
+    wake: threading.Event = threading.Event()
+    thread: threading.Thread | None = None
+
+    @classmethod
+    def start(cls) -> None:
+        '''
+        Start the reconcile thread, if pre-pulling is enabled. Safe to call many times.
+        :params: None
+        :returns: None
+        '''
+        if not config.IMAGE_PREPULL_ENABLED or KubernetesResourceManager.client is None:
+            return
+        with cls.lock:
+            if cls.thread is not None:
+                return
+            cls.apps_client = AppsV1Api()
+            cls.thread = threading.Thread(target=cls.run, name='image-prepull', daemon=True)
+            cls.thread.start()
+
+    @classmethod
+    def allowed_image(cls, image_name: str) -> str | None:
+        '''
+        Get the allowlisted name of an image (see IMAGE_PREPULL_IMAGES).
+        :params: image_name: str
+        :returns: str | None: The image as configured, None if it may not be pre-pulled
+        '''
+        normalized: str = normalize_image(image_name)
+        return next((allowed for allowed in config.IMAGE_PREPULL_IMAGES if normalize_image(allowed) == normalized), None)
+
+    @classmethod
+    def record(cls, image_name: str) -> None:
+        '''
+        Count a create of an allowlisted image. Reconciles right away when the image is new to the top K.
+        :params: image_name: str
+        :returns: None
+        '''
+        allowed: str | None = cls.allowed_image(image_name)
+        if allowed is None:
+            return
+        cls.popularity.record(allowed)
+        if cls.thread is not None and allowed not in cls.images and allowed in cls.popularity.top(config.IMAGE_PREPULL_TOP_K):
+            cls.wake.set()
+
+    @classmethod
+    def desired_images(cls, current_images: list[str] | None = None) -> list[str]:
+        '''
+        Get the images every node should have: the sidecars, then the most popular allowlisted images, sorted.
+        Popularity is only kept in memory, so while it knows fewer than IMAGE_PREPULL_TOP_K images
+        (e.g. after a restart) the images already in the DaemonSet are kept.
+        :params: current_images: list[str] | None - Images of the current DaemonSet
+        :returns: list[str]
+        '''
+        sidecars: list[str] = [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME]
+        popular: list[str] = [
+            image_name for image_name in cls.popularity.top(config.IMAGE_PREPULL_TOP_K)
+            if cls.allowed_image(image_name) is not None
+        ]
+        for image_name in sorted(current_images or []):
+            if len(popular) >= config.IMAGE_PREPULL_TOP_K:
+                break
+            allowed: str | None = cls.allowed_image(image_name)
+            if allowed is not None and allowed not in popular:
+                popular.append(allowed)
+        return sidecars + sorted(set(popular) - set(sidecars))
+
+    @classmethod
+    def daemonset_images(cls, daemonset: V1DaemonSet) -> list[str]:
+        '''
+        Get the pre-pulled images of a DaemonSet.
+        :params: daemonset: V1DaemonSet
+        :returns: list[str]
+        '''
+        return [container.image for container in (daemonset.spec.template.spec.containers or []) if container.name.startswith('prepull-')]
+
+    @classmethod
+    def run(cls) -> None:
+        '''
+        Reconcile loop.
+        :params: None
+        :returns: None
+        '''
+        while True:
+            try:
+                cls.reconcile()
+            except Exception as e:
+                print(f'Image pre-pull: reconcile failed: {str(e)}')
+            cls.wake.wait(timeout=IMAGE_PREPULL_RECONCILE_SECONDS)
+            cls.wake.clear()
+
+    @classmethod
+    def build_daemonset(cls, images: list[str]) -> V1DaemonSet:
+        '''
+        Build the pre-pull DaemonSet.
+        :params: images: list[str]
+        :returns: V1DaemonSet
+        '''
+        labels: dict[str, str] = {'app': IMAGE_PREPULL_DAEMONSET_NAME}
+        resources: V1ResourceRequirements = V1ResourceRequirements(
+            requests={'cpu': '1m', 'memory': '8Mi'},
+            limits={'cpu': '100m', 'memory': '32Mi'},
+        )
+        security_context: V1SecurityContext = V1SecurityContext(
+            allow_privilege_escalation=False,
+            capabilities=V1Capabilities(drop=['ALL']),
+        )
+        tools: V1VolumeMount = V1VolumeMount(name='tools', mount_path=IMAGE_PREPULL_TOOLS_DIR, read_only=True)
+        sleep: list[str] = [f'{IMAGE_PREPULL_TOOLS_DIR}/busybox', 'sleep', '2147483647']
+        return V1DaemonSet(
+            metadata=V1ObjectMeta(
+                name=IMAGE_PREPULL_DAEMONSET_NAME,
+                namespace=config.IMAGE_PREPULL_NAMESPACE,
+                labels=labels,
+            ),
+            spec=V1DaemonSetSpec(
+                selector=V1LabelSelector(match_labels=labels),
+                # pre-pull pods serve nothing, so a new image list rolls out on every node at once.
+                update_strategy=V1DaemonSetUpdateStrategy(
+                    type='RollingUpdate',
+                    rolling_update=V1RollingUpdateDaemonSet(max_unavailable='100%'),
+                ),
+                template=V1PodTemplateSpec(
+                    metadata=V1ObjectMeta(labels=labels),
+                    spec=V1PodSpec(
+                        automount_service_account_token=False,
+                        security_context=V1PodSecurityContext(run_as_user=IMAGE_PREPULL_RUN_AS_USER, run_as_non_root=True),
+                        volumes=[V1Volume(name='tools', empty_dir=V1EmptyDirVolumeSource(size_limit='16Mi'))],
+                        init_containers=[
+                            V1Container(
+                                name='install-tools',
+                                image=IMAGE_PREPULL_TOOLS_IMAGE,
+                                command=['cp', '/bin/busybox', f'{IMAGE_PREPULL_TOOLS_DIR}/busybox'],
+                                volume_mounts=[V1VolumeMount(name='tools', mount_path=IMAGE_PREPULL_TOOLS_DIR)],
+                                resources=resources,
+                                security_context=security_context,
+                            ),
+                        ],
+                        # one container per image, so an image that does not pull or run leaves the others alone.
+                        containers=[
+                            V1Container(
+                                name=f'prepull-{index}',
+                                image=image_name,
+                                command=sleep,
+                                args=[],
+                                volume_mounts=[tools],
+                                resources=resources,
+                                security_context=security_context,
+                            )
+                            for index, image_name in enumerate(images)
+                        ],
+                    ),
+                ),
+            ),
+        )
+
+    @classmethod
+    def reconcile(cls) -> None:
+        '''
+        Create or update the DaemonSet if its images are not the desired ones, then refresh the pull state.
+        Only a change of the set of images rolls the DaemonSet out again, not a change of their popularity order.
+        :params: None
+        :returns: None
+        '''
+        try:
+            current: V1DaemonSet | None = cls.apps_client.read_namespaced_daemon_set(IMAGE_PREPULL_DAEMONSET_NAME, config.IMAGE_PREPULL_NAMESPACE)
+        except ApiException as ae:
+            if ae.status != 404:
+                raise
+            current = None
+        images: list[str] = cls.desired_images(cls.daemonset_images(current) if current is not None else cls.images)
+        daemonset: V1DaemonSet = cls.build_daemonset(images)
+        if current is None:
+            current = cls.apps_client.create_namespaced_daemon_set(config.IMAGE_PREPULL_NAMESPACE, daemonset)
+        elif set(cls.daemonset_images(current)) != set(images):
+            daemonset.metadata.resource_version = current.metadata.resource_version
+            current = cls.apps_client.replace_namespaced_daemon_set(IMAGE_PREPULL_DAEMONSET_NAME, config.IMAGE_PREPULL_NAMESPACE, daemonset)
+        cls.images = images
+        cls.update_pull_state(images, KubernetesResourceManager.client.list_node().items, current)
+
+    @classmethod
+    def update_pull_state(cls, images: list[str], nodes: list[V1Node], daemonset: V1DaemonSet | None = None) -> dict[str, int]:
+        '''
+        Count the nodes that have each image, from the images the nodes report, and update the metrics.
+        :params: images: list[str]
+        :params: nodes: list[V1Node]
+        :params: daemonset: V1DaemonSet | None
+        :returns: dict[str, int]: image -> nodes that have it
+        '''
+        node_images: list[set[str]] = [
+            {name for image in ((node.status.images if node.status else None) or []) for name in (image.names or [])}
+            for node in nodes
+        ]
+        pull_state: dict[str, int] = {
+            image_name: sum(normalize_image(image_name) in names or image_name in names for names in node_images)
+            for image_name in images
+        }
+        if IMAGE_NODES_GAUGE is not None:
+            for image_name in set(cls.pull_state) - set(pull_state):
+                IMAGE_NODES_GAUGE.remove(image_name)
+            for image_name, count in pull_state.items():
+                IMAGE_NODES_GAUGE.labels(image_name).set(count)
+            NODES_GAUGE.set(len(nodes))
+            if daemonset is not None and daemonset.status is not None:
+                DAEMONSET_READY_GAUGE.set(daemonset.status.number_ready or 0)
+        cls.pull_state = pull_state
+        return pull_state
@@ -0,0 +1,630 @@
+'''
+In-process informer cache for kubernetes resources.
+
+Each (kind, namespace) pair gets exactly one KubernetesInformer.
+The informer lists the resource once, then keeps a watch open from the listed resourceVersion
+and applies ADDED/MODIFIED/DELETED events to an in-memory store.
+The resource managers read from this store instead of calling list_namespaced_* on every request.
+Waits (pod running, service IP, deletion, ...) are registered on the informer as waiters and
+resolved by the same watch, so waiting costs no extra API calls.
+'''
+
+# builtins
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FuturesTimeoutError
+from typing import Callable
+
+# modules
+from src.resources.cancel_scope import CancelScope
+from src.resources.resource_config import INFORMER_WATCH_TIMEOUT_SECONDS, INFORMER_RETRY_DELAY_SECONDS
+
+# third party
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+class Waiter:
+    '''
+    A pending wait on one object: a predicate and the future it resolves.
+    '''
+
+    def __init__(self, name: str, predicate: Callable) -> None:
+        '''
+        :params: name: str - Name of the awaited object
+        :params: predicate: Callable - (event_type, obj) -> bool. May raise to fail the wait.
+        '''
+        self.name: str = name
+        self.predicate: Callable = predicate
+        self.future: Future = Future()
+
+    def offer(self, event_type: str, obj: object | None) -> bool:
+        '''
+        Resolve the future if the predicate accepts the event.
+        :params: event_type: str - ADDED, MODIFIED, DELETED, or MISSING when the object does not exist
+        :params: obj: object | None
+        :returns: bool: True if the waiter is done
+        '''
+        try:
+            if not self.predicate(event_type, obj):
+                return False
+            self.future.set_result(obj)
+        except Exception as e:
+            self.future.set_exception(e)
+        return True
+
+    def fail(self, error: Exception) -> None:
+        '''
+        Fail the wait, unless it is already done.
+        :params: error: Exception
+        :returns: None
+        '''
+        try:
+            self.future.set_exception(error)
+        except InvalidStateError:
+            pass
+
+
+class KubernetesInformer:
+    '''
+    Keep an in-memory copy of one resource kind in one namespace.
+    The store is keyed by the resource name, with a secondary UID -> name index.
+    '''
+
+    def __init__(self, kind: str, namespace_name: str, list_function: Callable, indexers: dict[str, Callable] | None = None, group_label: str | None = None) -> None:
+        '''
+        :params: kind: str - Resource kind, used only for bookkeeping (e.g. 'pod')
+        :params: namespace_name: str | None - Namespace to watch, None for cluster scoped kinds
+        :params: list_function: Callable - list_namespaced_* (or list_*) function of the kubernetes client
+        :params: indexers: dict[str, Callable] | None - Derived per object values kept next to the store,
+                 e.g. {'container_states': PodManager.get_container_states}. Each indexer maps an object to a value.
+        :params: group_label: str | None - Group objects by the value of this label, e.g. 'kubernetes.io/service-name'
+                 for endpoint slices. Groups can be listed and waited on like single objects.
+        '''
+        self.kind: str = kind
+        self.namespace_name: str | None = namespace_name
+        self.scope: dict = {'namespace': namespace_name} if namespace_name is not None else {}
+        self.list_function: Callable = list_function
+        self.store: dict[str, object] = {}
+        self.uids: dict[str, str] = {}
+        self.indexers: dict[str, Callable] = indexers or {}
+        self.indexes: dict[str, dict[str, object]] = {index_name: {} for index_name in self.indexers}
+        self.resource_version: str | None = None
+        self.lock: threading.RLock = threading.RLock()
+        self.started: bool = False
+        self.stopped: threading.Event = threading.Event()
+        self.watcher: watch.Watch | None = None
+        self.thread: threading.Thread | None = None
+        self.waiters: dict[str, list[Waiter]] = {}
+        self.group_label: str | None = group_label
+        self.groups: dict[str, set[str]] = {}
+        self.group_waiters: dict[str, list[Waiter]] = {}
+        # name -> uid of objects we asked to delete, hidden from reads before the watch reports their deletionTimestamp.
+        self.tombstones: dict[str, str] = {}
+
+    def relist(self) -> None:
+        '''
+        Replace the store with a fresh list from the API server.
+        :params: None
+        :returns: None
+        '''
+        response = self.list_function(**self.scope)
+        with self.lock:
+            self.store = {item.metadata.name: item for item in response.items}
+            self.uids = {item.metadata.uid: item.metadata.name for item in response.items}
+            self.indexes = {
+                index_name: {item.metadata.name: indexer(item) for item in response.items}
+                for index_name, indexer in self.indexers.items()
+            }
+            self.groups = {}
+            for item in response.items:
+                self.add_to_group(item)
+            self.tombstones = {
+                name: uid for name, uid in self.tombstones.items()
+                if name in self.store and self.store[name].metadata.uid == uid
+            }
+            self.resource_version = response.metadata.resource_version
+            # events may have been missed, re-check every waiter against the new store.
+            for name in list(self.waiters):
+                obj: object | None = self.store.get(name)
+                self.notify(name, 'MODIFIED' if obj is not None else 'MISSING', obj)
+            for group in list(self.group_waiters):
+                self.notify_group(group)
+
+    def start(self) -> None:
+        '''
+        Seed the store and start the watch thread. Safe to call many times.
+        The first caller pays for the initial list, concurrent callers wait for it.
+        :params: None
+        :returns: None
+        '''
+        with self.lock:
+            if self.started:
+                return
+            self.relist()
+            self.thread = threading.Thread(
+                target=self.run,
+                name=f'informer-{self.kind}-{self.namespace_name}',
+                daemon=True,
+            )
+            self.thread.start()
+            self.started = True
+
+    def stop(self) -> None:
+        '''
+        Stop the watch thread.
+        :params: None
+        :returns: None
+        '''
+        self.stopped.set()
+        if self.watcher is not None:
+            self.watcher.stop()
+        with self.lock:
+            waiters: list[Waiter] = [
+                waiter
+                for registry in (self.waiters, self.group_waiters)
+                for waiters in registry.values()
+                for waiter in waiters
+            ]
+            self.waiters = {}
+            self.group_waiters = {}
+        for waiter in waiters:
+            waiter.fail(Exception(f'Stopped watching {self.kind} in {self.namespace_name}'))
+
+    def is_idle(self) -> bool:
+        '''
+        Check that no one waits on the informer.
+        :params: None
+        :returns: bool
+        '''
+        with self.lock:
+            return not any(self.waiters.values()) and not any(self.group_waiters.values())
+
+    def run(self) -> None:
+        '''
+        Watch loop. Reconnects from the last seen resourceVersion and relists when it has expired.
+        :params: None
+        :returns: None
+        '''
+        while not self.stopped.is_set():
+            self.watcher = watch.Watch()
+            try:
+                for event in self.watcher.stream(
+                    self.list_function,
+                    resource_version=self.resource_version,
+                    timeout_seconds=INFORMER_WATCH_TIMEOUT_SECONDS,
+                    allow_watch_bookmarks=True,
+                    **self.scope,
+                ):
+                    self.apply(event['type'], event['object'])
+                    if self.stopped.is_set():
+                        break
+                if self.watcher.resource_version:
+                    self.resource_version = self.watcher.resource_version
+            except ApiException as ae:
+                if self.stopped.is_set():
+                    break
+                if ae.status != 410:
+                    print(f'Informer {self.kind}/{self.namespace_name}: watch failed: {str(ae)}')
+                    time.sleep(INFORMER_RETRY_DELAY_SECONDS)
+                self.safe_relist()
+            except Exception as e:
+                if self.stopped.is_set():
+                    break
+                print(f'Informer {self.kind}/{self.namespace_name}: watch failed: {str(e)}')
+                time.sleep(INFORMER_RETRY_DELAY_SECONDS)
+                self.safe_relist()
+
+    def safe_relist(self) -> None:
+        '''
+        Relist, keeping the stale store if the API server is unreachable.
+        :params: None
+        :returns: None
+        '''
+        try:
+            self.relist()
+        except Exception as e:
+            print(f'Informer {self.kind}/{self.namespace_name}: relist failed: {str(e)}')
+
+    def apply(self, event_type: str, obj: object) -> None:
+        '''
+        Apply a single watch event to the store.
+        :params: event_type: str - ADDED, MODIFIED, DELETED or BOOKMARK
+        :params: obj: object - The deserialized kubernetes object
+        :returns: None
+        '''
+        if event_type == 'BOOKMARK':
+            return
+        with self.lock:
+            previous: object | None = self.store.get(obj.metadata.name)
+            if previous is not None:
+                self.remove_from_group(previous)
+            if event_type == 'DELETED':
+                self.store.pop(obj.metadata.name, None)
+                self.uids.pop(obj.metadata.uid, None)
+                if self.tombstones.get(obj.metadata.name) == obj.metadata.uid:
+                    del self.tombstones[obj.metadata.name]
+                for index in self.indexes.values():
+                    index.pop(obj.metadata.name, None)
+            else:
+                if previous is not None and previous.metadata.uid != obj.metadata.uid:
+                    # same name, new object (deleted and created again between two events)
+                    self.uids.pop(previous.metadata.uid, None)
+                self.store[obj.metadata.name] = obj
+                self.uids[obj.metadata.uid] = obj.metadata.name
+                self.update_indexes(obj)
+                self.add_to_group(obj)
+            self.notify(obj.metadata.name, event_type, obj)
+            for group in {self.group_of(previous), self.group_of(obj)} - {None}:
+                self.notify_group(group)
+
+    def group_of(self, obj: object | None) -> str | None:
+        '''
+        Get the group of an object, i.e. the value of its group label.
+        :params: obj: object | None
+        :returns: str | None
+        '''
+        if obj is None or self.group_label is None:
+            return None
+        return (obj.metadata.labels or {}).get(self.group_label)
+
+    def add_to_group(self, obj: object) -> None:
+        '''
+        Add an object to its group. Called with the lock held.
+        :params: obj: object
+        :returns: None
+        '''
+        group: str | None = self.group_of(obj)
+        if group is not None:
+            self.groups.setdefault(group, set()).add(obj.metadata.name)
+
+    def remove_from_group(self, obj: object) -> None:
+        '''
+        Remove an object from its group. Called with the lock held.
+        :params: obj: object
+        :returns: None
+        '''
+        group: str | None = self.group_of(obj)
+        if group is not None and group in self.groups:
+            self.groups[group].discard(obj.metadata.name)
+            if not self.groups[group]:
+                del self.groups[group]
+
+    def update_indexes(self, obj: object) -> None:
+        '''
+        Recompute the derived values of one object. Called with the lock held.
+        :params: obj: object
+        :returns: None
+        '''
+        for index_name, indexer in self.indexers.items():
+            self.indexes[index_name][obj.metadata.name] = indexer(obj)
+
+    def notify(self, name: str, event_type: str, obj: object | None) -> None:
+        '''
+        Offer an event to the waiters of an object, dropping the ones that are done.
+        Called with the lock held.
+        :params: name: str
+        :params: event_type: str
+        :params: obj: object | None
+        :returns: None
+        '''
+        self.offer(self.waiters, name, event_type, obj)
+
+    def notify_group(self, group: str) -> None:
+        '''
+        Offer the current objects of a group to the waiters of that group.
+        Called with the lock held.
+        :params: group: str
+        :returns: None
+        '''
+        if group in self.group_waiters:
+            self.offer(self.group_waiters, group, 'MODIFIED', self.list_group(group))
+
+    def offer(self, registry: dict[str, list[Waiter]], key: str, event_type: str, obj: object | None) -> None:
+        '''
+        Offer an event to the waiters registered under a key, dropping the ones that are done.
+        Called with the lock held.
+        :params: registry: dict[str, list[Waiter]] - self.waiters or self.group_waiters
+        :params: key: str
+        :params: event_type: str
+        :params: obj: object | None
+        :returns: None
+        '''
+        waiters: list[Waiter] | None = registry.get(key)
+        if not waiters:
+            return
+        pending: list[Waiter] = [waiter for waiter in waiters if not waiter.offer(event_type, obj)]
+        if pending:
+            registry[key] = pending
+        else:
+            del registry[key]
+
+    def wait_for(self, name: str, predicate: Callable, timeout_seconds: float) -> object | None:
+        '''
+        Block until predicate accepts an event of the object, checking the current state first.
+        The predicate gets (event_type, obj): ADDED/MODIFIED/DELETED from the watch,
+        or MISSING with obj None when the object does not exist.
+        :params: name: str
+        :params: predicate: Callable - (event_type, obj) -> bool. May raise to fail the wait.
+        :params: timeout_seconds: float
+        :returns: object | None: The object of the accepted event
+        :raises: TimeoutError: If predicate accepts nothing within timeout_seconds
+        '''
+        waiter: Waiter = Waiter(name, predicate)
+        with self.lock:
+            obj: object | None = self.store.get(name)
+            if not waiter.offer('ADDED' if obj is not None else 'MISSING', obj):
+                self.waiters.setdefault(name, []).append(waiter)
+        return self.wait(self.waiters, waiter, timeout_seconds)
+
+    def wait_for_group(self, group: str, predicate: Callable, timeout_seconds: float) -> list:
+        '''
+        Block until predicate accepts the objects of a group, checking the current objects first.
+        The predicate gets ('MODIFIED', objs) every time an object of the group changes.
+        :params: group: str - Value of the group label
+        :params: predicate: Callable - (event_type, objs) -> bool. May raise to fail the wait.
+        :params: timeout_seconds: float
+        :returns: list: The objects of the group when predicate accepted them
+        :raises: TimeoutError: If predicate accepts nothing within timeout_seconds
+        '''
+        waiter: Waiter = Waiter(group, predicate)
+        with self.lock:
+            if not waiter.offer('MODIFIED', self.list_group(group)):
+                self.group_waiters.setdefault(group, []).append(waiter)
+        return self.wait(self.group_waiters, waiter, timeout_seconds)
+
+    def wait(self, registry: dict[str, list[Waiter]], waiter: Waiter, timeout_seconds: float) -> object | None:
+        '''
+        Block on a registered waiter, unregistering it on timeout or when its CancelScope is cancelled.
+        :params: registry: dict[str, list[Waiter]] - self.waiters or self.group_waiters
+        :params: waiter: Waiter
+        :params: timeout_seconds: float
+        :returns: object | None: The result of the waiter
+        :raises: TimeoutError
+        :raises: WaitCancelled: If the CancelScope of the caller is cancelled
+        '''
+        scope: CancelScope | None = CancelScope.current.get()
+        unregister_cancel = scope.on_cancel(lambda error: self.cancel(registry, waiter, error)) if scope is not None else None
+        try:
+            return waiter.future.result(timeout=timeout_seconds)
+        except FuturesTimeoutError as te:
+            self.unregister(registry, waiter)
+            raise TimeoutError(f'Timeout waiting for {self.kind} {waiter.name} after {timeout_seconds} seconds') from te
+        finally:
+            if unregister_cancel is not None:
+                unregister_cancel()
+
+    def cancel(self, registry: dict[str, list[Waiter]], waiter: Waiter, error: Exception) -> None:
+        '''
+        Unregister a waiter and fail it.
+        :params: registry: dict[str, list[Waiter]]
+        :params: waiter: Waiter
+        :params: error: Exception
+        :returns: None
+        '''
+        with self.lock:
+            self.unregister(registry, waiter)
+            waiter.fail(error)
+
+    def unregister(self, registry: dict[str, list[Waiter]], waiter: Waiter) -> None:
+        '''
+        Remove a waiter from its registry.
+        :params: registry: dict[str, list[Waiter]]
+        :params: waiter: Waiter
+        :returns: None
+        '''
+        with self.lock:
+            waiters: list[Waiter] = registry.get(waiter.name, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                registry.pop(waiter.name, None)
+
+    def record_created(self, obj: object) -> None:
+        '''
+        Add an object we just created, so that a read right after the create sees it
+        even if the ADDED event has not arrived yet. Never overwrites a newer watch update.
+        :params: obj: object - The object returned by create_namespaced_*
+        :returns: None
+        '''
+        with self.lock:
+            if obj.metadata.name not in self.store:
+                self.store[obj.metadata.name] = obj
+                self.uids[obj.metadata.uid] = obj.metadata.name
+                self.update_indexes(obj)
+                self.add_to_group(obj)
+                self.notify(obj.metadata.name, 'ADDED', obj)
+                group: str | None = self.group_of(obj)
+                if group is not None:
+                    self.notify_group(group)
+
+    def record_deleting(self, name: str) -> None:
+        '''
+        Hide an object whose delete the API server has just accepted,
+        even if the watch has not reported its deletionTimestamp yet.
+        :params: name: str
+        :returns: None
+        '''
+        with self.lock:
+            obj: object | None = self.store.get(name)
+            if obj is not None:
+                self.tombstones[name] = obj.metadata.uid
+
+    def is_deleting(self, obj: object) -> bool:
+        '''
+        Check if an object is being deleted (terminating), i.e. it is on its way out and should not be read.
+        Called with the lock held.
+        :params: obj: object
+        :returns: bool
+        '''
+        if getattr(obj.metadata, 'deletion_timestamp', None) is not None:
+            return True
+        return self.tombstones.get(obj.metadata.name) == obj.metadata.uid
+
+    def list(self, include_deleting: bool = False) -> list:
+        '''
+        List all objects in the store. Objects being deleted are left out.
+        :params: include_deleting: bool - Also list objects being deleted
+        :returns: list: Kubernetes objects
+        '''
+        with self.lock:
+            return [obj for obj in self.store.values() if include_deleting or not self.is_deleting(obj)]
+
+    def get(self, name: str, include_deleting: bool = False) -> object | None:
+        '''
+        Get an object from the store. An object being deleted is reported as missing.
+        :params: name: str
+        :params: include_deleting: bool - Also return an object being deleted
+        :returns: object | None
+        '''
+        with self.lock:
+            obj: object | None = self.store.get(name)
+            if obj is not None and not include_deleting and self.is_deleting(obj):
+                return None
+            return obj
+
+    def list_group(self, group: str) -> list:
+        '''
+        List the objects of a group.
+        :params: group: str - Value of the group label
+        :returns: list: Kubernetes objects
+        '''
+        with self.lock:
+            return [self.store[name] for name in sorted(self.groups.get(group, ()))]
+
+    def get_indexed(self, index_name: str, name: str) -> object | None:
+        '''
+        Get the derived value of an object.
+        :params: index_name: str
+        :params: name: str
+        :returns: object | None
+        '''
+        with self.lock:
+            return self.indexes[index_name].get(name)
+
+    def get_name_by_uid(self, uid: str) -> str | None:
+        '''
+        Get the name of an object from its UID.
+        :params: uid: str
+        :returns: str | None
+        '''
+        with self.lock:
+            name: str | None = self.uids.get(uid)
+            if name is None or self.is_deleting(self.store[name]):
+                return None
+            return name
+
+
+class InformerCache:
+    '''
+    Registry of informers shared by every resource manager in the process.
+    '''
+    informers: dict[tuple[str, str], KubernetesInformer] = {}
+    indexers: dict[str, dict[str, Callable]] = {}
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def register_indexer(cls, kind: str, index_name: str, indexer: Callable) -> None:
+        '''
+        Keep a derived value for every object of a kind, in every informer of that kind created from now on.
+        :params: kind: str
+        :params: index_name: str
+        :params: indexer: Callable - obj -> value
+        :returns: None
+        '''
+        with cls.lock:
+            cls.indexers.setdefault(kind, {})[index_name] = indexer
+
+    @classmethod
+    def get_informer(cls, kind: str, namespace_name: str | None, list_function: Callable, group_label: str | None = None) -> KubernetesInformer:
+        '''
+        Get the informer for a kind in a namespace, creating and starting it on first use.
+        :params: kind: str
+        :params: namespace_name: str | None - None for cluster scoped kinds
+        :params: list_function: Callable
+        :params: group_label: str | None - See KubernetesInformer
+        :returns: KubernetesInformer
+        '''
+        with cls.lock:
+            informer: KubernetesInformer | None = cls.informers.get((kind, namespace_name))
+            if informer is None:
+                informer = KubernetesInformer(kind, namespace_name, list_function, indexers=cls.indexers.get(kind), group_label=group_label)
+                cls.informers[(kind, namespace_name)] = informer
+        # start outside the registry lock, so that one slow list does not block other namespaces.
+        try:
+            informer.start()
+        except Exception:
+            # do not keep an informer that never listed, the next caller creates a fresh one.
+            with cls.lock:
+                if cls.informers.get((kind, namespace_name)) is informer and not informer.started:
+                    del cls.informers[(kind, namespace_name)]
+            raise
+        return informer
+
+    @classmethod
+    def record_created(cls, kind: str, namespace_name: str, obj: object) -> None:
+        '''
+        Add a freshly created object to the informer, if the informer is running.
+        :params: kind: str
+        :params: namespace_name: str
+        :params: obj: object
+        :returns: None
+        '''
+        informer: KubernetesInformer | None = cls.informers.get((kind, namespace_name))
+        if informer is not None:
+            informer.record_created(obj)
+
+    @classmethod
+    def record_deleting(cls, kind: str, namespace_name: str, name: str) -> None:
+        '''
+        Hide an object whose delete was just accepted, if the informer is running.
+        :params: kind: str
+        :params: namespace_name: str
+        :params: name: str
+        :returns: None
+        '''
+        informer: KubernetesInformer | None = cls.informers.get((kind, namespace_name))
+        if informer is not None:
+            informer.record_deleting(name)
+
+    @classmethod
+    def stop_namespace(cls, namespace_name: str) -> None:
+        '''
+        Stop and forget every informer of a namespace. Used when the namespace is deleted.
+        :params: namespace_name: str
+        :returns: None
+        '''
+        with cls.lock:
+            keys: list[tuple[str, str]] = [key for key in cls.informers if key[1] == namespace_name]
+            informers: list[KubernetesInformer] = [cls.informers.pop(key) for key in keys]
+        for informer in informers:
+            informer.stop()
+
+    @classmethod
+    def watched(cls, namespace_name: str) -> set[tuple[str, str]]:
+        '''
+        Get the keys of the informers of a namespace.
+        :params: namespace_name: str
+        :returns: set[tuple[str, str]]: (kind, namespace_name)
+        '''
+        with cls.lock:
+            return {key for key in cls.informers if key[1] == namespace_name}
+
+    @classmethod
+    def stop_unused(cls, namespace_name: str, keep: set[tuple[str, str]]) -> None:
+        '''
+        Stop and forget the informers of a namespace that are not in keep and that no one waits on.
+        Used when a read finds that its namespace does not exist: the informers the read started are dropped,
+        while those of concurrent calls (e.g. the first create of the namespace) keep running.
+        :params: namespace_name: str
+        :params: keep: set[tuple[str, str]] - Keys of informers to keep, see watched
+        :returns: None
+        '''
+        with cls.lock:
+            keys: list[tuple[str, str]] = [
+                key for key, informer in cls.informers.items()
+                if key[1] == namespace_name and key not in keep and informer.is_idle()
+            ]
+            informers: list[KubernetesInformer] = [cls.informers.pop(key) for key in keys]
+        for informer in informers:
+            informer.stop()
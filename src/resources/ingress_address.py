@@ -0,0 +1,103 @@
+'''
+Cached address of the ingress controller.
+
+Every ingress of the nginx ingress class ends up with the same load balancer address: the one of the controller.
+So instead of waiting for the controller to sync the status of each new ingress, the address is taken from
+the controller's Service (watched through the informer cache) or from any ingress that already has it.
+'''
+
+# builtins
+import threading
+import time
+
+# modules
+from src.resources import KubernetesResourceManager
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.resource_config import INGRESS_CONTROLLER_NAMESPACE, INGRESS_CONTROLLER_SERVICE_NAME
+from src.resources.resource_config import INGRESS_CONTROLLER_RETRY_SECONDS, INGRESS_CONTROLLER_RETRY_MAX_SECONDS
+
+# third party
+from kubernetes.client import V1LoadBalancerStatus
+
+
+class IngressControllerAddress:
+    '''
+    Discover the ingress controller address once and keep it up to date.
+    '''
+    observed: str | None = None
+    # after a failed watch of the controller namespace, it is retried at retry_at, with a doubling delay.
+    retry_at: float = 0.0
+    retry_delay: float = INGRESS_CONTROLLER_RETRY_SECONDS
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def from_load_balancer(cls, load_balancer: V1LoadBalancerStatus | None) -> str | None:
+        '''
+        Get the address of a load balancer status, IP first then hostname.
+        :params: load_balancer: V1LoadBalancerStatus | None - From a Service or an Ingress status
+        :returns: str | None
+        '''
+        if not load_balancer or not load_balancer.ingress:
+            return None
+        return load_balancer.ingress[0].ip or load_balancer.ingress[0].hostname
+
+    @classmethod
+    def observe(cls, address: str | None) -> None:
+        '''
+        Remember the address seen on a provisioned ingress. The latest one wins, so a change is picked up.
+        :params: address: str | None
+        :returns: None
+        '''
+        if address:
+            with cls.lock:
+                cls.observed = address
+
+    @classmethod
+    def controller_informer(cls, start: bool) -> KubernetesInformer | None:
+        '''
+        Get the service informer of the controller namespace.
+        A failed start is not retried before retry_at.
+        :params: start: bool - Start it if it is not running yet
+        :returns: KubernetesInformer | None
+        '''
+        with cls.lock:
+            backing_off: bool = time.monotonic() < cls.retry_at
+        if not start or backing_off or KubernetesResourceManager.client is None:
+            return InformerCache.informers.get(('service', INGRESS_CONTROLLER_NAMESPACE))
+        try:
+            informer: KubernetesInformer = InformerCache.get_informer(
+                'service',
+                INGRESS_CONTROLLER_NAMESPACE,
+                KubernetesResourceManager.client.list_namespaced_service,
+            )
+        except Exception:
+            with cls.lock:
+                cls.retry_at = time.monotonic() + cls.retry_delay
+                cls.retry_delay = min(cls.retry_delay * 2, INGRESS_CONTROLLER_RETRY_MAX_SECONDS)
+            raise
+        with cls.lock:
+            cls.retry_at = 0.0
+            cls.retry_delay = INGRESS_CONTROLLER_RETRY_SECONDS
+        return informer
+
+    @classmethod
+    def get(cls, start: bool = True) -> str | None:
+        '''
+        Get the controller address: from the controller Service if it has one, else from the last provisioned ingress.
+        :params: start: bool - Allow starting the controller Service informer (one list and one watch, once per process).
+                 Pass False on read paths that must not call the API server.
+        :returns: str | None: None if no address is known yet
+        '''
+        try:
+            informer: KubernetesInformer | None = cls.controller_informer(start)
+        except Exception as e:
+            # e.g. no permission to watch the controller namespace. The observed address still works.
+            print(f'Ingress controller address: could not watch {INGRESS_CONTROLLER_NAMESPACE}, retrying in {cls.retry_at - time.monotonic():.0f}s: {str(e)}')
+            informer = None
+        if informer is not None:
+            service = informer.get(INGRESS_CONTROLLER_SERVICE_NAME)
+            address: str | None = cls.from_load_balancer(service.status.load_balancer if service and service.status else None)
+            if address:
+                return address
+        with cls.lock:
+            return cls.observed
@@ -1,5 +1,5 @@
 # builtins
-import time
+import contextvars
 
 # modules
 from src.resources.dataclasses.ingress.create_ingress_dataclass import CreateIngressDataClass
@@ -7,9 +7,14 @@ from src.resources.dataclasses.ingress.delete_ingress_dataclass import DeleteIng
 from src.resources.dataclasses.ingress.get_ingress_dataclass import GetIngressDataClass
 from src.resources.dataclasses.ingress.list_ingress_dataclass import ListIngressDataClass
 from src.resources import KubernetesResourceManager
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.label_index import LabelSelectorIndex
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.timeline import Timeline
+from src.common.single_flight import single_flight
 from src.resources.dataclasses.service.get_service_dataclass import GetServiceDataClass
-from src.resources.resource_config import INGRESS_IP_TIMEOUT_SECONDS, INGRESS_TERMINATION_TIMEOUT
+from src.resources.resource_config import INGRESS_IP_TIMEOUT_SECONDS, INGRESS_TERMINATION_TIMEOUT, INGRESS_CLASS_NAME
+from src.resources.ingress_address import IngressControllerAddress
 
 # third party
 from kubernetes.client.rest import ApiException
@@ -34,9 +39,12 @@ class IngressManager(KubernetesResourceManager):
         cls.client = NetworkingV1Api()
 
     @classmethod
-    def get_associated_services(cls, ingress: dict) -> list[dict]:
+    def get_associated_services(cls, ingress: dict, pod_index: LabelSelectorIndex | None = None, services_by_name: dict[str, dict] | None = None) -> list[dict]:
         '''
         Get associated services for an ingress.
+        Pass pod_index to share one pod listing between services.
+        Pass services_by_name (service responses of a namespace snapshot) to resolve backends without any API call.
+        Backends that do not exist (anymore) are skipped.
         '''
         namespace = ingress.get('metadata', {}).get('namespace', '')
         rules = ingress.get('spec', {}).get('rules', [])
@@ -45,23 +53,19 @@ class IngressManager(KubernetesResourceManager):
         if not rules:
             return []
 
-        # Get all service names from all paths in all rules
-        service_names = [
+        # Get all service names from all paths in all rules.
+        # A multi-port ingress has one path per port, all pointing at the same service, so deduplicate (keeping order).
+        service_names = list(dict.fromkeys(
             path.get('backend', {}).get('service', {}).get('name')
             for rule in rules
             for path in rule.get('http', {}).get('paths', [])
             if path.get('backend', {}).get('service', {}).get('name')
-        ]
+        ))
 
-        # Get service details for each service name
-        return [
-            ServiceManager.get(GetServiceDataClass(
-                namespace_name=namespace,
-                service_name=service_name
-            ))
-            for service_name in service_names
-            if service_name
-        ]
+        # Resolve every backend in one batch: one service list and one pod list for the namespace.
+        if services_by_name is None:
+            services_by_name = ServiceManager.get_services_by_name(namespace, service_names, pod_index=pod_index)
+        return [services_by_name[service_name] for service_name in service_names if service_name in services_by_name]
 
     @classmethod
     def get_ingress_ports(cls) -> list[dict]:
@@ -72,7 +76,7 @@ class IngressManager(KubernetesResourceManager):
         ]
 
     @classmethod
-    def get_ingress_response(cls, ingress: V1Ingress, ingress_ip: str | None = None) -> dict:
+    def get_ingress_response(cls, ingress: V1Ingress, ingress_ip: str | None = None, pod_index: LabelSelectorIndex | None = None, services_by_name: dict[str, dict] | None = None) -> dict:
         """
         Format a V1Ingress into a consistent response dictionary.
 
@@ -80,17 +84,18 @@ class IngressManager(KubernetesResourceManager):
             ingress: The Kubernetes V1Ingress object.
             ingress_ip: Optional override for the ingress IP/hostname. If not
                         provided, it is derived from the ingress status.
+            pod_index: Optional label index of the namespace's pods.
+            services_by_name: Optional service responses of the namespace,
+                              keyed by service name.
         """
         if ingress_ip is None:
-            if ingress.status.load_balancer.ingress:
-                ingress_ip = (
-                    ingress.status.load_balancer.ingress[0].ip
-                    or ingress.status.load_balancer.ingress[0].hostname
-                )
-            else:
-                ingress_ip = None
+            ingress_ip = IngressControllerAddress.from_load_balancer(ingress.status.load_balancer if ingress.status else None)
+            IngressControllerAddress.observe(ingress_ip)
+        if ingress_ip is None and ingress.spec and ingress.spec.ingress_class_name == INGRESS_CLASS_NAME:
+            # status not synced yet, but it will be the controller's address.
+            ingress_ip = IngressControllerAddress.get(start=False)
 
-        associated_services: list[dict] = cls.get_associated_services(ingress.to_dict())
+        associated_services: list[dict] = cls.get_associated_services(ingress.to_dict(), pod_index=pod_index, services_by_name=services_by_name)
 
         return {
             'resource_type': 'ingress',
@@ -102,6 +107,20 @@ class IngressManager(KubernetesResourceManager):
             'associated_resources': associated_services,
         }
 
+    @classmethod
+    def informer(cls, namespace_name: str) -> KubernetesInformer:
+        '''
+        Get the shared ingress informer of a namespace.
+        '''
+        return InformerCache.get_informer('ingress', namespace_name, cls.client.list_namespaced_ingress)
+
+    @classmethod
+    def list_objects(cls, namespace_name: str) -> list[V1Ingress]:
+        '''
+        List all V1Ingress objects in a namespace from the informer cache.
+        '''
+        return cls.informer(namespace_name).list()
+
     @classmethod
     def list(cls, data: ListIngressDataClass) -> list[dict]:
         '''
@@ -109,10 +128,14 @@ class IngressManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            return [
-                cls.get_ingress_response(ingress)
-                for ingress in cls.client.list_namespaced_ingress(data.namespace_name).items
-            ]
+
+            def read() -> list[dict]:
+                pod_index: LabelSelectorIndex = ServiceManager.build_pod_index(data.namespace_name)
+                return [
+                    cls.get_ingress_response(ingress, pod_index=pod_index)
+                    for ingress in cls.list_objects(data.namespace_name)
+                ]
+            return cls.memoized_read('list', 'ingress', data.namespace_name, None, read)
         except ApiException as ae:
             raise ApiException(f'Error occured while listing ingress: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -127,8 +150,13 @@ class IngressManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            response: V1Ingress = cls.client.read_namespaced_ingress(data.ingress_name, data.namespace_name)
-            return cls.get_ingress_response(response)
+
+            def read() -> dict:
+                response: V1Ingress | None = cls.informer(data.namespace_name).get(data.ingress_name)
+                if response is None:
+                    return {}
+                return cls.get_ingress_response(response)
+            return cls.memoized_read('get', 'ingress', data.namespace_name, data.ingress_name, read)
         except ApiException as ae:
             if ae.status == 404:
                 return {}
@@ -154,6 +182,7 @@ class IngressManager(KubernetesResourceManager):
             futures: list = []
             for service in services:
                 future = worker.submit(
+                    contextvars.copy_context().run,
                     ServiceManager.save_service_pods,
                     GetServiceDataClass(namespace_name=data.namespace_name, service_name=service['service_name']))
                 futures.append(future)
@@ -168,22 +197,25 @@ class IngressManager(KubernetesResourceManager):
 
     @classmethod
     def get_ingress_ip(cls, namespace_name: str, ingress_name: str, timeout_seconds: float = INGRESS_IP_TIMEOUT_SECONDS) -> str:
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                ingress = cls.client.read_namespaced_ingress(name=ingress_name, namespace=namespace_name)
-                print('Ingress IP status:', ingress.status.load_balancer.ingress)
-                if ingress.status.load_balancer.ingress:
-                    # Try IP first, then hostname if IP is not available
-                    return (ingress.status.load_balancer.ingress[0].ip or 
-                           ingress.status.load_balancer.ingress[0].hostname)
-            except ApiException as e:
-                if e.status != 404:  # Ignore 404 errors while pod is being created
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for ingress {ingress_name} IP/hostname after {timeout_seconds} seconds")
+        '''
+        Get the IP (or hostname) of the ingress, waiting for the controller to publish it.
+        '''
+        def has_address(event_type: str, ingress: V1Ingress | None) -> bool:
+            if event_type in ('DELETED', 'MISSING'):
+                return False
+            return bool(ingress.status and ingress.status.load_balancer and ingress.status.load_balancer.ingress)
+
+        try:
+            ingress: V1Ingress = cls.wait_until('ingress', cls.client.list_namespaced_ingress, namespace_name, ingress_name, has_address, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for ingress {ingress_name} IP/hostname after {timeout_seconds} seconds") from te
+        # Try IP first, then hostname if IP is not available
+        ingress_ip: str = IngressControllerAddress.from_load_balancer(ingress.status.load_balancer)
+        IngressControllerAddress.observe(ingress_ip)
+        return ingress_ip
 
     @classmethod
+    @single_flight(lambda cls, data: ('create', 'ingress', data.namespace_name, data.ingress_name))
     def create(cls, data: CreateIngressDataClass) -> dict:
         '''
         Create an ingress or return an existing ingress.
@@ -193,6 +225,8 @@ class IngressManager(KubernetesResourceManager):
             i: dict = cls.get(GetIngressDataClass(ingress_name=data.ingress_name, namespace_name=data.namespace_name))
             if i:
                 return i
+            # a ingress of the same name may still be terminating after a delete that did not wait.
+            cls.wait_for_terminating(cls.informer(data.namespace_name), data.ingress_name, INGRESS_TERMINATION_TIMEOUT)
 
             paths: list[dict] = [
                 {
@@ -223,7 +257,7 @@ class IngressManager(KubernetesResourceManager):
                     }
                 },
                 "spec": {
-                    "ingressClassName": "nginx",
+                    "ingressClassName": INGRESS_CLASS_NAME,
                     "rules": [
                         {
                             "host": data.host,
@@ -239,13 +273,26 @@ class IngressManager(KubernetesResourceManager):
             ingress_manifest["spec"] = {k: v for k, v in ingress_manifest["spec"].items() if v is not None}
 
             # Create the ingress
-            ingress: V1Ingress = cls.client.create_namespaced_ingress(
-                namespace=data.namespace_name,
-                body=ingress_manifest
-            )
+            with Timeline.phase('ingress.create'):
+                try:
+                    ingress: V1Ingress = cls.client.create_namespaced_ingress(
+                        namespace=data.namespace_name,
+                        body=ingress_manifest
+                    )
+                except ApiException as ae:
+                    if ae.status != 409:
+                        raise
+                    # created at the same time by someone else (e.g. another replica): use that ingress instead.
+                    ingress = cls.client.read_namespaced_ingress(data.ingress_name, data.namespace_name)
+            InformerCache.record_created('ingress', data.namespace_name, ingress)
+            cls.invalidate_reads(data.namespace_name)
 
-            # Resolve IP/hostname with timeout and return formatted response
-            ingress_ip: str = cls.get_ingress_ip(data.namespace_name, data.ingress_name)
+            # All ingresses of the class share the controller's address, so use it if it is known.
+            # Only the first ingress of the process has to wait for the status sync.
+            ingress_ip: str | None = IngressControllerAddress.get()
+            if ingress_ip is None:
+                with Timeline.phase('ingress.get_ingress_ip'):
+                    ingress_ip = cls.get_ingress_ip(data.namespace_name, data.ingress_name)
             return cls.get_ingress_response(ingress, ingress_ip=ingress_ip)
         except ApiException as ae:
             raise ApiException(f'Error occured while creating ingress: {str(ae)}') from ae
@@ -256,12 +303,14 @@ class IngressManager(KubernetesResourceManager):
 
     @classmethod
     def poll_termination(cls, namespace_name: str, ingress_name: str, timeout_seconds: float = INGRESS_TERMINATION_TIMEOUT) -> None:
-        is_terminated: bool = False
-        while is_terminated != True:
-            ingress: dict = cls.get(GetIngressDataClass(namespace_name=namespace_name, ingress_name=ingress_name))
-            is_terminated = (ingress == {})
-            print(f'Ingress: {ingress_name} Deleted:', is_terminated)
-            time.sleep(timeout_seconds)
+        '''
+        Wait for ingress termination. Returns as soon as the DELETED event of the ingress arrives.
+        :params: namespace_name: str
+        :params: ingress_name: str
+        :params: timeout_seconds: float
+        :raises: TimeoutError: If the ingress still exists after timeout_seconds
+        '''
+        cls.wait_for_deletion('ingress', cls.client.list_namespaced_ingress, namespace_name, ingress_name, timeout_seconds)
 
     @classmethod
     def delete(cls, data: DeleteIngressDataClass) -> dict:
@@ -270,9 +319,16 @@ class IngressManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            cls.client.delete_namespaced_ingress(data.ingress_name, data.namespace_name)
-            cls.poll_termination(data.namespace_name, data.ingress_name) # wait for ingress to be deleted, otherwise list ingress will find it and integration tests will fail..
+            with Timeline.phase('ingress.delete'):
+                cls.client.delete_namespaced_ingress(data.ingress_name, data.namespace_name)
+            cls.invalidate_reads(data.namespace_name)
+            # reads hide ingresss being deleted, so only wait for it to be gone if asked to.
+            InformerCache.record_deleting('ingress', data.namespace_name, data.ingress_name)
+            if data.wait:
+                cls.poll_termination(data.namespace_name, data.ingress_name)
             return {'status': 'success'}
+        except TimeoutError as te:
+            raise TimeoutError(te) from te
         except ApiException as ae:
             raise ApiException(f'Error occured while deleting ingress: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
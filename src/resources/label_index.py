@@ -0,0 +1,45 @@
+'''
+Inverted label index used to match label selectors against pods.
+'''
+
+# builtins
+from collections import defaultdict
+
+
+class LabelSelectorIndex:
+    '''
+    Index pods by their (label key, label value) pairs.
+    Built once per namespace snapshot, so matching a selector is a set intersection
+    instead of a scan over every pod.
+    '''
+
+    def __init__(self, pods: list[dict]) -> None:
+        '''
+        :params: pods: list[dict] - Pod responses (see PodManager.get_pod_response)
+        '''
+        self.pods: list[dict] = pods
+        self.index: dict[tuple[str, str], set[int]] = defaultdict(set)
+        for position, pod in enumerate(pods):
+            for key, value in (pod.get('pod_labels') or {}).items():
+                self.index[(key, value)].add(position)
+
+    def match(self, selector: dict | None) -> list[dict]:
+        '''
+        Get all pods whose labels contain every key/value of the selector.
+        An empty selector matches nothing, same as a service without a selector.
+        :params: selector: dict | None
+        :returns: list[dict]: Matching pods, in listing order
+        '''
+        if not selector:
+            return []
+        # intersect starting from the smallest posting set.
+        postings: list[set[int]] = sorted(
+            (self.index.get((key, value), set()) for key, value in selector.items()),
+            key=len,
+        )
+        matched: set[int] = set(postings[0])
+        for posting in postings[1:]:
+            if not matched:
+                break
+            matched &= posting
+        return [self.pods[position] for position in sorted(matched)]
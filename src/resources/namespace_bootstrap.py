@@ -0,0 +1,60 @@
+'''
+Remember which namespaces are fully provisioned, so that creates and RPCs skip the namespace bootstrap.
+
+A namespace is provisioned once it exists with its NetworkPolicy and the RBAC of the status sidecar.
+Before this cache, every pod create read the ServiceAccount, Role and RoleBinding again and every RPC read the namespace.
+'''
+
+# builtins
+import threading
+
+# modules
+from src.resources.informer import InformerCache, KubernetesInformer
+
+
+class NamespaceBootstrap:
+    '''
+    Namespace name -> namespace response of provisioned namespaces.
+    An entry is only trusted while the namespace informer still holds the same namespace (same uid, not being deleted),
+    so a namespace deleted by anyone is dropped on the next watch event. Deletes through NamespaceManager drop it right away.
+    '''
+    provisioned: dict[str, dict] = {}
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, namespace_name: str) -> dict | None:
+        '''
+        Get the response of a provisioned namespace.
+        :params: namespace_name: str
+        :returns: dict | None: {'namespace_id', 'namespace_name'}, None if the namespace is not known to be provisioned
+        '''
+        with cls.lock:
+            response: dict | None = cls.provisioned.get(namespace_name)
+        if response is None:
+            return None
+        informer: KubernetesInformer | None = InformerCache.informers.get(('namespace', None))
+        namespace = informer.get(namespace_name) if informer is not None else None
+        if namespace is None or namespace.metadata.uid != response['namespace_id']:
+            cls.forget(namespace_name)
+            return None
+        return response
+
+    @classmethod
+    def record(cls, response: dict) -> None:
+        '''
+        Record a namespace as provisioned.
+        :params: response: dict - {'namespace_id', 'namespace_name'}
+        :returns: None
+        '''
+        with cls.lock:
+            cls.provisioned[response['namespace_name']] = response
+
+    @classmethod
+    def forget(cls, namespace_name: str) -> None:
+        '''
+        Drop a namespace, e.g. when it is deleted.
+        :params: namespace_name: str
+        :returns: None
+        '''
+        with cls.lock:
+            cls.provisioned.pop(namespace_name, None)
@@ -1,10 +1,15 @@
 # modules
-import time
 from src.resources.dataclasses.namespace.get_namespace_dataclass import GetNamespaceDataClass
 from src.resources import KubernetesResourceManager
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.namespace_bootstrap import NamespaceBootstrap
+from src.resources.pod_manager import PodManager
 from src.resources.dataclasses.namespace.create_namespace_dataclass import CreateNamespaceDataClass
 from src.resources.dataclasses.namespace.delete_namespace_dataclass import DeleteNamespaceDataClass
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.timeline import Timeline
+from src.common.single_flight import single_flight
+from src.resources.resource_config import NAMESPACE_TERMINATION_TIMEOUT, NAMESPACE_MANAGED_BY_LABEL, NAMESPACE_MANAGED_BY_VALUE
 
 # third party
 from kubernetes.client import V1Namespace
@@ -19,22 +24,25 @@ class NamespaceManager(KubernetesResourceManager):
     '''
     Manage kubernetes namespaces.
     '''
+    networking_client: NetworkingV1Api | None = None
+
     @classmethod
     def list(cls) -> list[dict]:
         '''
-        List all available namespaces.
+        List all available namespaces. Namespaces being deleted are left out.
         :params: None
         :returns: list[dict]: List of namespaces
         '''
         try:
             cls.check_kubernetes_client()
-            return [
+            return cls.memoized_read('list', 'namespace', None, None, lambda: [
                 {
                     'namespace_id': ns.metadata.uid,
                     'namespace_name': ns.metadata.name,
                 }
                 for ns in cls.client.list_namespace().items
-            ]
+                if ns.metadata.deletion_timestamp is None
+            ])
         except ApiException as ae:
             raise ApiException(f'Error occured while listing namespace: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -45,17 +53,30 @@ class NamespaceManager(KubernetesResourceManager):
     @classmethod
     def get(cls, data: GetNamespaceDataClass) -> dict:
         '''
-        Get a namespace.
+        Get a namespace. A namespace being deleted is reported as missing.
         :params: data: GetNamespaceDataClass
         :returns: dict: Namespace Details
         '''
         try:
             cls.check_kubernetes_client()
-            response: V1Namespace = cls.client.read_namespace(name=data.namespace_name)
-            return {
-                'namespace_id': response.metadata.uid,
-                'namespace_name': response.metadata.name,
-            }
+            provisioned: dict | None = NamespaceBootstrap.get(data.namespace_name)
+            if provisioned is not None:
+                return provisioned
+
+            def read() -> dict:
+                try:
+                    response: V1Namespace = cls.client.read_namespace(name=data.namespace_name)
+                except ApiException as ae:
+                    if ae.status == 404:
+                        return {}
+                    raise
+                if response.metadata.deletion_timestamp is not None:
+                    return {}
+                return {
+                    'namespace_id': response.metadata.uid,
+                    'namespace_name': response.metadata.name,
+                }
+            return cls.memoized_read('get', 'namespace', data.namespace_name, data.namespace_name, read)
         except ApiException as ae:
             if ae.status == 404:
                 return {}
@@ -66,20 +87,60 @@ class NamespaceManager(KubernetesResourceManager):
             raise Exception(f'Unkown error occured: {str(e)}') from e
 
     @classmethod
+    def networking_api(cls) -> NetworkingV1Api:
+        '''
+        Get the shared networking client.
+        :params: None
+        :returns: NetworkingV1Api
+        '''
+        if cls.networking_client is None:
+            cls.networking_client = NetworkingV1Api()
+        return cls.networking_client
+
+    @classmethod
+    def create_namespace(cls, namespace_name: str) -> V1Namespace:
+        '''
+        Create a namespace, or get it if it already exists.
+        A namespace of the same name that is still terminating is waited for and created again.
+        :params: namespace_name: str
+        :returns: V1Namespace
+        '''
+        namespace: V1Namespace = V1Namespace(
+            metadata=V1ObjectMeta(
+                name=namespace_name,
+                labels={NAMESPACE_MANAGED_BY_LABEL: NAMESPACE_MANAGED_BY_VALUE},  # lets the namespace reaper find it
+            )
+        )
+        try:
+            return cls.client.create_namespace(namespace)
+        except ApiException as ae:
+            if ae.status != 409:
+                raise
+        existing: V1Namespace = cls.client.read_namespace(name=namespace_name)
+        if existing.metadata.deletion_timestamp is None:
+            return existing
+        # a namespace of the same name is still terminating after a delete that did not wait.
+        cls.poll_termination(namespace_name)
+        return cls.client.create_namespace(namespace)
+
+    @classmethod
+    @single_flight(lambda cls, data: ('create', 'namespace', data.namespace_name, data.namespace_name))
     def create(cls, data: CreateNamespaceDataClass) -> dict:
         '''
-        Create a namespace. Return if already exists.
+        Create a namespace, with its NetworkPolicy and the RBAC of the status sidecar. Return if already exists.
+        Every step is a create that accepts an existing resource (409), and a provisioned namespace is remembered,
+        so only the first create of a namespace talks to the API server.
         :params: data: CreateNamespaceDataClass
         :returns: dict: Namespace Details
         '''
         try:
-            ns: dict = cls.get(GetNamespaceDataClass(namespace_name=data.namespace_name))
-            if ns:
-                return ns
-            namespace: V1Namespace = V1Namespace(
-                metadata=V1ObjectMeta(name=data.namespace_name)
-            )
-            cls.client.create_namespace(namespace)
+            cls.check_kubernetes_client()
+            provisioned: dict | None = NamespaceBootstrap.get(data.namespace_name)
+            if provisioned is not None:
+                return provisioned
+            with Timeline.phase('namespace.create'):
+                namespace: V1Namespace = cls.create_namespace(data.namespace_name)
+            cls.invalidate_reads(data.namespace_name)
             network_policy: V1NetworkPolicy = V1NetworkPolicy(
                 metadata=V1ObjectMeta(name=data.namespace_name),
                 spec={
@@ -88,12 +149,25 @@ class NamespaceManager(KubernetesResourceManager):
                     "ingress": [V1NetworkPolicyIngressRule(_from=None)]
                 }
             )
-            networking_api: NetworkingV1Api = NetworkingV1Api()
-            response: V1NetworkPolicy = networking_api.create_namespaced_network_policy(data.namespace_name, network_policy)
-            return {
-                'namespace_id': response.metadata.uid,
-                'namespace_name': response.metadata.name
+            with Timeline.phase('namespace.network_policy'):
+                try:
+                    cls.networking_api().create_namespaced_network_policy(data.namespace_name, network_policy)
+                except ApiException as ae:
+                    if ae.status != 409:
+                        raise
+            with Timeline.phase('namespace.status_sidecar_rbac'):
+                PodManager.ensure_status_sidecar_rbac(data.namespace_name)
+            response: dict = {
+                'namespace_id': namespace.metadata.uid,
+                'namespace_name': namespace.metadata.name
             }
+            # the informer is what invalidates the entry, so make sure it knows the namespace.
+            cls.informer()
+            InformerCache.record_created('namespace', None, namespace)
+            NamespaceBootstrap.record(response)
+            return response
+        except TimeoutError as te:
+            raise TimeoutError(te) from te
         except ApiException as ae:
             raise ApiException(f'Error occured while creating namespace: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -102,16 +176,22 @@ class NamespaceManager(KubernetesResourceManager):
             raise Exception(f'Unkown error occured: {str(e)}') from e
 
     @classmethod
-    def poll_termination(cls, namespace_name: str, timeout_seconds: float = 2.0) -> None:
+    def informer(cls) -> KubernetesInformer:
+        '''
+        Get the shared, cluster wide namespace informer.
+        :params: None
+        :returns: KubernetesInformer
+        '''
+        return InformerCache.get_informer('namespace', None, cls.client.list_namespace)
+
+    @classmethod
+    def poll_termination(cls, namespace_name: str, timeout_seconds: float = NAMESPACE_TERMINATION_TIMEOUT) -> None:
         '''
-        Poll the termination of a namespace.
+        Wait for the termination of a namespace. Returns as soon as the DELETED event of the namespace arrives.
+        :raises: TimeoutError: If the namespace still exists after timeout_seconds
         '''
-        is_terminated: bool = False
-        while is_terminated != True:
-            ns: dict = cls.get(GetNamespaceDataClass(namespace_name=namespace_name))
-            is_terminated = (ns == {})
-            print(f'Namespace: {namespace_name} Deleted:', is_terminated)
-            time.sleep(timeout_seconds)
+        cls.wait_for_deletion('namespace', cls.client.list_namespace, None, namespace_name, timeout_seconds)
+        cls.invalidate_reads(namespace_name)
 
     @classmethod
     def delete(cls, data: DeleteNamespaceDataClass) -> dict:
@@ -122,10 +202,16 @@ class NamespaceManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
+            NamespaceBootstrap.forget(data.namespace_name)
             # Call Kubernetes API to delete the namespace
             deletion_response = cls.client.delete_namespace(data.namespace_name)
-            cls.poll_termination(data.namespace_name)
+            cls.invalidate_reads(data.namespace_name)
+            if data.wait:
+                cls.poll_termination(data.namespace_name)
+            InformerCache.stop_namespace(data.namespace_name)
             return {"status": "success", "message": f"Namespace '{data.namespace_name}' deleted.", "details": deletion_response.to_dict()}
+        except TimeoutError as te:
+            raise TimeoutError(te) from te
         except ApiException as ae:
             raise ApiException(f"Error occurred while deleting namespace '{data.namespace_name}': {str(ae)}") from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -0,0 +1,189 @@
+'''
+Background deletion of empty namespaces.
+
+Namespaces are created per user on the first create and deleted once they hold no pod, service or ingress.
+The reaper does that in the background instead of inside every deleteContainer call:
+it only looks at namespaces created by this service, reads emptiness from the informer cache,
+waits for a grace period so a namespace is not deleted between its create and the create of its pod,
+and deletes the empty ones in parallel.
+'''
+
+# builtins
+import threading
+import time
+from datetime import datetime, timezone
+
+# modules
+from src.resources import KubernetesResourceManager
+from src.resources.dataclasses.namespace.delete_namespace_dataclass import DeleteNamespaceDataClass
+from src.resources.fan_out import FanOut
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.namespace_manager import NamespaceManager
+from src.resources.pod_manager import PodManager
+from src.resources.service_manager import ServiceManager
+from src.resources.ingress_manager import IngressManager
+from src.resources.resource_config import NAMESPACE_MANAGED_BY_LABEL, NAMESPACE_MANAGED_BY_VALUE
+from src.resources.resource_config import REAPER_SWEEP_INTERVAL_SECONDS, REAPER_MIN_INTERVAL_SECONDS
+from src.resources.resource_config import REAPER_GRACE_SECONDS, REAPER_MAX_DELETES_PER_SWEEP, WARM_POOL_STATE_LABEL
+
+# third party
+from kubernetes.client import V1Namespace
+
+
+class NamespaceReaper:
+    '''
+    Rate limited background thread deleting empty namespaces created by this service.
+    '''
+    dirty: set[str] = set()  # namespaces something was deleted from since the last sweep
+    empty_since: dict[str, float] = {}  # namespace -> time it was first seen empty
+    last_full_sweep: float = 0.0
+    lock: threading.Lock = threading.Lock()
+    wake: threading.Event = threading.Event()
+    thread: threading.Thread | None = None
+
+    @classmethod
+    def start(cls) -> None:
+        '''
+        Start the reaper thread. Safe to call many times. Does nothing outside of kubernetes.
+        :params: None
+        :returns: None
+        '''
+        if KubernetesResourceManager.client is None:
+            return
+        with cls.lock:
+            if cls.thread is not None:
+                return
+            cls.thread = threading.Thread(target=cls.run, name='namespace-reaper', daemon=True)
+            cls.thread.start()
+
+    @classmethod
+    def notify(cls, namespace_name: str) -> None:
+        '''
+        Tell the reaper that a namespace may have become empty. Returns immediately.
+        :params: namespace_name: str
+        :returns: None
+        '''
+        with cls.lock:
+            cls.dirty.add(namespace_name)
+        cls.start()
+        cls.wake.set()
+
+    @classmethod
+    def run(cls) -> None:
+        '''
+        Reaper loop: sweep when notified, when a grace period may have ended, or for the periodic full sweep.
+        :params: None
+        :returns: None
+        '''
+        while True:
+            with cls.lock:
+                timeout: float = REAPER_GRACE_SECONDS if cls.empty_since else REAPER_SWEEP_INTERVAL_SECONDS
+            cls.wake.wait(timeout=timeout)
+            cls.wake.clear()
+            try:
+                cls.sweep(time.time())
+            except Exception as e:
+                print(f'Namespace reaper: sweep failed: {str(e)}')
+            # rate limit: notifications arriving meanwhile are handled by the next sweep.
+            time.sleep(REAPER_MIN_INTERVAL_SECONDS)
+
+    @classmethod
+    def sweep(cls, now: float) -> list[str]:
+        '''
+        Check the candidate namespaces and delete the ones that have been empty for the grace period.
+        Candidates are the notified namespaces, the ones already seen empty, and every managed namespace
+        once per REAPER_SWEEP_INTERVAL_SECONDS (e.g. leftovers from before a restart).
+        :params: now: float - Current time, as time.time()
+        :returns: list[str]: Deleted namespaces
+        '''
+        managed: dict[str, V1Namespace] = cls.managed_namespaces()
+        with cls.lock:
+            candidates: set[str] = cls.dirty | set(cls.empty_since)
+            cls.dirty = set()
+            if now - cls.last_full_sweep >= REAPER_SWEEP_INTERVAL_SECONDS:
+                candidates |= set(managed)
+                cls.last_full_sweep = now
+        expired: list[str] = []
+        for namespace_name in sorted(candidates):
+            namespace: V1Namespace | None = managed.get(namespace_name)
+            if namespace is None or cls.age_seconds(namespace, now) < REAPER_GRACE_SECONDS or not cls.is_empty(namespace_name):
+                with cls.lock:
+                    cls.empty_since.pop(namespace_name, None)
+                continue
+            with cls.lock:
+                first_seen_empty: float = cls.empty_since.setdefault(namespace_name, now)
+            if now - first_seen_empty >= REAPER_GRACE_SECONDS:
+                expired.append(namespace_name)
+        expired = expired[:REAPER_MAX_DELETES_PER_SWEEP]
+        cls.delete(expired)
+        with cls.lock:
+            for namespace_name in expired:
+                cls.empty_since.pop(namespace_name, None)
+        return expired
+
+    @classmethod
+    def managed_namespaces(cls) -> dict[str, V1Namespace]:
+        '''
+        Get the namespaces created by this service, from the namespace informer.
+        :params: None
+        :returns: dict[str, V1Namespace]: Keyed by name. Namespaces being deleted are left out.
+        '''
+        NamespaceManager.check_kubernetes_client()
+        return {
+            namespace.metadata.name: namespace
+            for namespace in NamespaceManager.informer().list()
+            if (namespace.metadata.labels or {}).get(NAMESPACE_MANAGED_BY_LABEL) == NAMESPACE_MANAGED_BY_VALUE
+        }
+
+    @classmethod
+    def age_seconds(cls, namespace: V1Namespace, now: float) -> float:
+        '''
+        Get the age of a namespace.
+        :params: namespace: V1Namespace
+        :params: now: float
+        :returns: float
+        '''
+        created: datetime | None = namespace.metadata.creation_timestamp
+        if created is None:
+            return 0.0
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        return now - created.timestamp()
+
+    @classmethod
+    def is_empty(cls, namespace_name: str) -> bool:
+        '''
+        Check if a namespace has no pod, service or ingress. Unclaimed warm pool pods do not count.
+        Uses the informers of the namespace when they are running, otherwise lists at most one object per kind.
+        :params: namespace_name: str
+        :returns: bool
+        '''
+        IngressManager.check_kubernetes_client()
+        kinds: tuple = (
+            ('pod', PodManager.client.list_namespaced_pod),
+            ('service', ServiceManager.client.list_namespaced_service),
+            ('ingress', IngressManager.client.list_namespaced_ingress),
+        )
+        for kind, list_function in kinds:
+            informer: KubernetesInformer | None = InformerCache.informers.get((kind, namespace_name))
+            if informer is not None:
+                if [obj for obj in informer.list() if not PodManager.is_warm(obj)]:
+                    return False
+            elif list_function(namespace=namespace_name, limit=1, label_selector=f'!{WARM_POOL_STATE_LABEL}').items:
+                return False
+        return True
+
+    @classmethod
+    def delete(cls, namespace_names: list[str]) -> None:
+        '''
+        Delete namespaces in parallel, without waiting for them to be gone.
+        :params: namespace_names: list[str]
+        :returns: None
+        '''
+        def delete_one(namespace_name: str) -> None:
+            try:
+                NamespaceManager.delete(DeleteNamespaceDataClass(namespace_name=namespace_name, wait=False))
+            except Exception as e:
+                print(f'Namespace reaper: could not delete {namespace_name}: {str(e)}')
+
+        FanOut.run(*[lambda namespace_name=namespace_name: delete_one(namespace_name) for namespace_name in namespace_names])
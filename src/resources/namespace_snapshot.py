@@ -0,0 +1,60 @@
+'''
+A consistent, in-memory view of every pod, service and ingress of one namespace.
+'''
+
+# builtins
+from typing import Callable
+
+# modules
+from src.resources.label_index import LabelSelectorIndex
+from src.resources.pod_manager import PodManager
+from src.resources.service_manager import ServiceManager
+from src.resources.ingress_manager import IngressManager
+
+# third party
+from kubernetes.client import V1Pod
+from kubernetes.client import V1Service
+from kubernetes.client.models import V1Ingress
+
+
+class NamespaceSnapshot:
+    '''
+    A namespace read with exactly one pod list, one service list and one ingress list (see readers),
+    with the ingress -> service -> pod tree built in memory.
+    '''
+
+    def __init__(self, namespace_name: str, pods: list[V1Pod], services: list[V1Service], ingresses: list[V1Ingress]) -> None:
+        '''
+        :params: namespace_name: str
+        :params: pods: list[V1Pod]
+        :params: services: list[V1Service]
+        :params: ingresses: list[V1Ingress]
+        '''
+        self.namespace_name: str = namespace_name
+        self.pods: list[dict] = [PodManager.get_pod_response(pod) for pod in pods]
+        self.pod_index: LabelSelectorIndex = LabelSelectorIndex(self.pods)
+        self.services: list[dict] = [
+            ServiceManager.get_service_response(service, pod_index=self.pod_index)
+            for service in services
+        ]
+        self.services_by_name: dict[str, dict] = {service['service_name']: service for service in self.services}
+        self.ingresses: list[dict] = [
+            IngressManager.get_ingress_response(ingress, services_by_name=self.services_by_name)
+            for ingress in ingresses
+        ]
+
+    @classmethod
+    def readers(cls, namespace_name: str) -> list[Callable]:
+        '''
+        The three independent reads of a snapshot: pods, services and ingresses.
+        Callers can fan them out together with other reads (see KubernetesContainerManager.list).
+        :params: namespace_name: str
+        :returns: list[Callable]: Zero argument functions
+        '''
+        PodManager.check_kubernetes_client()
+        IngressManager.check_kubernetes_client()
+        return [
+            lambda: PodManager.list_objects(namespace_name),
+            lambda: ServiceManager.list_objects(namespace_name),
+            lambda: IngressManager.list_objects(namespace_name),
+        ]
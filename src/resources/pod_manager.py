@@ -6,12 +6,17 @@ from typing import List
 from src.resources.dataclasses.pod.delete_pod_dataclass import DeletePodDataClass
 from src.resources.dataclasses.pod.get_pod_dataclass import GetPodDataClass
 from src.resources import KubernetesResourceManager
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.namespace_bootstrap import NamespaceBootstrap
 from src.resources.dataclasses.pod.create_pod_dataclass import CreatePodDataClass, ResourceRequirementsDataClass
 from src.resources.dataclasses.pod.list_pod_dataclass import ListPodDataClass
 from src.resources.dataclasses.pod.save_pod_dataclass import SavePodDataClass
 from src.common.exceptions import UnsupportedRuntimeEnvironment
-from src.resources.resource_config import IMAGE_PUSH_TIMEOUT_MINUTES, POD_IP_TIMEOUT_SECONDS, POD_UPTIME_TIMEOUT, POD_TERMINATION_TIMEOUT, IMAGE_BUILD_TIMEOUT_MINUTES, STATUS_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_NAME, CONTAINER_READINESS_TIMEOUT_SECONDS, DOCKER_LOGIN_MAX_RETRIES, DOCKER_LOGIN_RETRY_DELAY_SECONDS, DOCKER_BUILD_MAX_RETRIES, DOCKER_BUILD_RETRY_DELAY_SECONDS
+from src.common.timeline import Timeline
+from src.common.single_flight import single_flight
+from src.resources.resource_config import IMAGE_PUSH_TIMEOUT_MINUTES, POD_IP_TIMEOUT_SECONDS, POD_IP_PENDING, POD_UPTIME_TIMEOUT, POD_TERMINATION_TIMEOUT, IMAGE_BUILD_TIMEOUT_MINUTES, STATUS_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_NAME, CONTAINER_READINESS_TIMEOUT_SECONDS, DOCKER_LOGIN_MAX_RETRIES, DOCKER_LOGIN_RETRY_DELAY_SECONDS, DOCKER_BUILD_MAX_RETRIES, DOCKER_BUILD_RETRY_DELAY_SECONDS
 from src.resources.resource_config import SNAPSHOT_DIR, SNAPSHOT_FILE_NAME, SNAPSHOT_SIDECAR_NAME, SNAPSHOT_SIDECAR_IMAGE_NAME
+from src.resources.resource_config import WARM_POOL_STATE_LABEL, WARM_POOL_STATE_WARM
 from src.common.config import REPO_NAME, REPO_PASSWORD
 
 # third party
@@ -574,30 +579,40 @@ class SaveUtility(KubernetesResourceManager):
             if not repo_name or not repo_password:
                 raise Exception('REPO_NAME or REPO_PASSWORD is not set')
             # check if the sidecar and main pod share a volume
-            if not cls.check_shared_volume(data):
-                raise ApiException(f'Sidecar and main pod do not share a volume')
+            with Timeline.phase('save.check_shared_volume'):
+                if not cls.check_shared_volume(data):
+                    raise ApiException(f'Sidecar and main pod do not share a volume')
             # build the tar file
-            cls.build_tar(data)
+            with Timeline.phase('save.build_tar'):
+                cls.build_tar(data)
             # unpack the tar file
-            cls.unpack_tar(data)
+            with Timeline.phase('save.unpack_tar'):
+                cls.unpack_tar(data)
             # create the dockerfile
-            cls.create_dockerfile(data)
+            with Timeline.phase('save.create_dockerfile'):
+                cls.create_dockerfile(data)
             # build the image
-            image_name: dict = cls.build_image(data)
+            with Timeline.phase('save.build_image'):
+                image_name: dict = cls.build_image(data)
             # cleanup snapshot files (tar and rootfs) to free up space
-            cls.cleanup_snapshot_files(data)
+            with Timeline.phase('save.cleanup_snapshot_files'):
+                cls.cleanup_snapshot_files(data)
             # tag the image
-            cls.tag_image(data, image_name['image_name'], repo_name)
+            with Timeline.phase('save.tag_image'):
+                cls.tag_image(data, image_name['image_name'], repo_name)
             # login to the docker registry
-            is_logged_in: bool = cls.docker_login(data, repo_name, repo_password)
+            with Timeline.phase('save.docker_login'):
+                is_logged_in: bool = cls.docker_login(data, repo_name, repo_password)
             if not is_logged_in:
                 raise Exception('Docker registry login failed')
             # push the image
-            is_pushed: bool = cls.docker_push(data, image_name['image_name'], repo_name)
+            with Timeline.phase('save.docker_push'):
+                is_pushed: bool = cls.docker_push(data, image_name['image_name'], repo_name)
             if not is_pushed:
                 raise Exception('Docker registry push failed')
             # delete local images to free up space
-            is_deleted: bool = cls.delete_local_image(data, image_name['image_name'], repo_name)
+            with Timeline.phase('save.delete_local_image'):
+                is_deleted: bool = cls.delete_local_image(data, image_name['image_name'], repo_name)
             if not is_deleted:
                 raise Exception('Local images deletion failed')
             return {
@@ -617,6 +632,7 @@ class PodManager(KubernetesResourceManager):
     '''
     Manage kubernetes pods.
     '''
+    rbac_client: RbacAuthorizationV1Api | None = None
 
     @classmethod
     def get_container_ports(cls, container: V1Container) -> list[dict]:
@@ -711,23 +727,76 @@ class PodManager(KubernetesResourceManager):
         return containers
 
     @classmethod
-    def get_pod_response(cls, pod: V1Pod) -> dict:
+    def get_pod_response(cls, pod: V1Pod, wait_for_ip: bool = False) -> dict:
         '''
         Get the pod response.
+        The IP is taken from the V1Pod we already have. If the pod has no IP yet, it is reported as pending.
+        Only pass wait_for_ip=True when the caller really needs the IP (i.e. create), since it blocks.
         :params: pod: V1Pod
+        :params: wait_for_ip: bool - Block until the pod has an IP
         :returns: dict: Pod Details
         '''
+        if wait_for_ip:
+            pod_ip: str = cls.get_pod_ip(pod.metadata.namespace, pod.metadata.name)
+        else:
+            pod_ip: str = (pod.status.pod_ip if pod.status else None) or POD_IP_PENDING
         return {
             'resource_type': 'pod',
             'pod_id': pod.metadata.uid,
             'pod_name': pod.metadata.name,
             'pod_namespace': pod.metadata.namespace,
-            'pod_ip': cls.get_pod_ip(pod.metadata.namespace, pod.metadata.name),
+            'pod_ip': pod_ip,
             'pod_ports': cls.get_pod_ports(pod),
             'pod_labels': pod.metadata.labels or {},
             'associated_resources': cls.get_pod_containers(pod),
         }
 
+    @classmethod
+    def get_container_states(cls, pod: V1Pod) -> dict[str, str]:
+        '''
+        Get the state of every container of a pod.
+        Kept by the pod informer for every pod, recomputed only when that pod changes.
+        :params: pod: V1Pod
+        :returns: dict[str, str]: container name -> 'running', 'terminated' or 'waiting'
+        '''
+        states: dict[str, str] = {}
+        for status in ((pod.status.container_statuses if pod.status else None) or []):
+            # V1ContainerState has attributes: running, waiting, terminated
+            if status.state and status.state.running is not None:
+                states[status.name] = 'running'
+            elif status.state and status.state.terminated is not None:
+                states[status.name] = 'terminated'
+            else:
+                states[status.name] = 'waiting'
+        return states
+
+    @classmethod
+    def informer(cls, namespace_name: str) -> KubernetesInformer:
+        '''
+        Get the shared pod informer of a namespace.
+        :params: namespace_name: str
+        :returns: KubernetesInformer
+        '''
+        return InformerCache.get_informer('pod', namespace_name, cls.client.list_namespaced_pod)
+
+    @classmethod
+    def list_objects(cls, namespace_name: str) -> list[V1Pod]:
+        '''
+        List all V1Pod objects in a namespace from the informer cache. Unclaimed warm pool pods are left out.
+        :params: namespace_name: str
+        :returns: list[V1Pod]
+        '''
+        return [pod for pod in cls.informer(namespace_name).list() if not cls.is_warm(pod)]
+
+    @classmethod
+    def is_warm(cls, pod: V1Pod) -> bool:
+        '''
+        Check if a pod is an unclaimed warm pool pod (see WarmPodPool).
+        :params: pod: V1Pod
+        :returns: bool
+        '''
+        return (pod.metadata.labels or {}).get(WARM_POOL_STATE_LABEL) == WARM_POOL_STATE_WARM
+
     @classmethod
     def list(cls, data: ListPodDataClass) -> list[dict]:
         '''
@@ -737,10 +806,10 @@ class PodManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            return [
+            return cls.memoized_read('list', 'pod', data.namespace_name, None, lambda: [
                 cls.get_pod_response(pod)
-                for pod in cls.client.list_namespaced_pod(namespace=data.namespace_name).items
-            ]
+                for pod in cls.list_objects(data.namespace_name)
+            ])
         except ApiException as ae:
             raise ApiException(f'Error occurred while listing pods: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -748,6 +817,25 @@ class PodManager(KubernetesResourceManager):
         except Exception as e:
             raise Exception(f'Unknown error occurred: {str(e)}') from e
 
+    @classmethod
+    def list_by_selector(cls, namespace_name: str, selector: dict) -> List[dict]:
+        '''
+        List the pods matching a label selector, filtered by the API server.
+        Used where holding every pod of the namespace is not wanted (e.g. the pods of one container).
+        :params: namespace_name: str
+        :params: selector: dict - e.g. {'app': 'my-pod'}
+        :returns: list[dict]: List of pods
+        '''
+        cls.check_kubernetes_client()
+        if not selector:
+            return []
+        label_selector: str = ','.join(f'{key}={value}' for key, value in sorted(selector.items()))
+        return cls.memoized_read('list', 'pod', namespace_name, f'selector:{label_selector}', lambda: [
+            cls.get_pod_response(pod)
+            for pod in cls.client.list_namespaced_pod(namespace=namespace_name, label_selector=label_selector).items
+            if pod.metadata.deletion_timestamp is None and not cls.is_warm(pod)
+        ])
+
     @classmethod
     def get(cls, data: GetPodDataClass) -> dict:
         '''
@@ -757,8 +845,13 @@ class PodManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            response: V1Pod = cls.client.read_namespaced_pod(name=data.pod_name, namespace=data.namespace_name)
-            return cls.get_pod_response(response)
+
+            def read() -> dict:
+                response: V1Pod | None = cls.informer(data.namespace_name).get(data.pod_name)
+                if response is None:
+                    return {}
+                return cls.get_pod_response(response)
+            return cls.memoized_read('get', 'pod', data.namespace_name, data.pod_name, read)
         except ApiException as ae:
             if ae.status == 404:
                 return {}
@@ -771,29 +864,28 @@ class PodManager(KubernetesResourceManager):
     @classmethod
     def get_pod_ip(cls, namespace_name: str, pod_name: str, timeout_seconds: float = POD_IP_TIMEOUT_SECONDS) -> str:
         '''
-        Get the IP of the Pod.
+        Get the IP of the Pod, waiting for it to be assigned.
         :params: namespace_name: str
         :params: pod_name: str
         :params: timeout_seconds: float
         :returns: str: Pod IP
         '''
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                pod = cls.client.read_namespaced_pod(name=pod_name, namespace=namespace_name)
-                if pod.status.pod_ip:
-                    print(f'Pod: {pod_name} IP:', pod.status.pod_ip)
-                    return pod.status.pod_ip
-            except ApiException as e:
-                if e.status != 404:  # Ignore 404 errors while pod is being created
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for pod {pod_name} IP address after {timeout_seconds} seconds")
+        def has_ip(event_type: str, pod: V1Pod | None) -> bool:
+            return event_type not in ('DELETED', 'MISSING') and bool(pod.status and pod.status.pod_ip)
+
+        try:
+            with Timeline.phase('pod.get_pod_ip'):
+                pod: V1Pod = cls.wait_until('pod', cls.client.list_namespaced_pod, namespace_name, pod_name, has_ip, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for pod {pod_name} IP address after {timeout_seconds} seconds") from te
+        return pod.status.pod_ip
 
     @classmethod
-    def poll_status(cls, namespace_name: str, pod_name: str, target_status: str, timeout_seconds: float = POD_UPTIME_TIMEOUT) -> None:
+    def poll_status(cls, namespace_name: str, pod_name: str, target_status: str, timeout_seconds: float = POD_UPTIME_TIMEOUT) -> V1Pod:
         '''
-        Poll pod status until it matches target_status or timeout is reached.
+        Wait until the pod phase matches target_status or timeout is reached.
+        The wait is a waiter on the pod informer, so it returns as soon as the phase changes
+        and adds no API calls of its own.
         
         Args:
             namespace_name: Name of the namespace
@@ -801,30 +893,61 @@ class PodManager(KubernetesResourceManager):
             target_status: Status to wait for (e.g., 'Running', 'Succeeded')
             timeout_seconds: Maximum time to wait in seconds
         
+        Returns:
+            V1Pod: The pod as it was when it reached target_status
+        
         Raises:
             TimeoutError: If pod doesn't reach target status within timeout
-            ApiException: If there's an error getting pod status
         '''
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                pod = cls.client.read_namespaced_pod(name=pod_name, namespace=namespace_name)
-                current_status = pod.status.phase
-                print(f'Pod: {pod_name} Status:', current_status)
-                if current_status == target_status:
-                    return
-                elif current_status in ['Failed', 'Unknown']:
-                    raise Exception(f'Pod entered {current_status} state')
-            except ApiException as e:
-                if e.status != 404:  # Ignore 404 errors while pod is being created
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for pod {pod_name} to reach status {target_status} after {timeout_seconds} seconds")
+        def reached(event_type: str, pod: V1Pod | None) -> bool:
+            if event_type == 'MISSING':
+                # not created yet.
+                return False
+            if event_type == 'DELETED':
+                raise Exception(f'Pod {pod_name} was deleted')
+            current_status: str | None = pod.status.phase if pod.status else None
+            if current_status in ['Failed', 'Unknown'] and current_status != target_status:
+                raise Exception(f'Pod entered {current_status} state')
+            return current_status == target_status
+
+        try:
+            return cls.wait_until('pod', cls.client.list_namespaced_pod, namespace_name, pod_name, reached, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for pod {pod_name} to reach status {target_status} after {timeout_seconds} seconds") from te
+
+    @classmethod
+    def observe_startup(cls, pod: V1Pod) -> None:
+        '''
+        Split the start up of a running pod into phases, from the timestamps kubernetes recorded:
+        pod.scheduling (created -> scheduled) and pod.image_pull_and_start (scheduled -> last container started).
+        The timestamps have a resolution of one second.
+        :params: pod: V1Pod
+        :returns: None
+        '''
+        created = pod.metadata.creation_timestamp
+        scheduled = next((
+            condition.last_transition_time
+            for condition in ((pod.status.conditions if pod.status else None) or [])
+            if condition.type == 'PodScheduled' and condition.status == 'True'
+        ), None)
+        started: list = [
+            status.state.running.started_at
+            for status in ((pod.status.container_statuses if pod.status else None) or [])
+            if status.state and status.state.running and status.state.running.started_at
+        ]
+        if created is None or scheduled is None:
+            return
+        # wall clock -> monotonic clock, the clock of the timeline.
+        offset: float = time.monotonic() - time.time()
+        Timeline.observe('pod.scheduling', created.timestamp() + offset, scheduled.timestamp() + offset)
+        if started:
+            Timeline.observe('pod.image_pull_and_start', scheduled.timestamp() + offset, max(started).timestamp() + offset)
 
     @classmethod
     def poll_container_readiness(cls, namespace_name: str, pod_name: str, container_names: List[str], timeout_seconds: float = CONTAINER_READINESS_TIMEOUT_SECONDS) -> None:
         '''
-        Poll container statuses until all specified containers are running or timeout is reached.
+        Wait until all specified containers are running or timeout is reached.
+        The wait is a waiter on the pod informer, resolved from the container states it keeps per pod.
 
         Args:
             namespace_name: Name of the namespace
@@ -834,50 +957,20 @@ class PodManager(KubernetesResourceManager):
 
         Raises:
             TimeoutError: If containers don't become running within timeout
-            ApiException: If there's an error getting pod status
         '''
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                pod = cls.client.read_namespaced_pod(name=pod_name, namespace=namespace_name)
-
-                # Check if pod is running first
-                if pod.status.phase != 'Running':
-                    time.sleep(1)
-                    continue
+        informer: KubernetesInformer = cls.informer(namespace_name)
 
-                # Build a map of container statuses
-                container_statuses = {}
-                if pod.status.container_statuses:
-                    for status in pod.status.container_statuses:
-                        container_statuses[status.name] = status
-
-                # Check if all required containers are running
-                all_running = True
-                for container_name in container_names:
-                    if container_name not in container_statuses:
-                        all_running = False
-                        break
-                    status = container_statuses[container_name]
-                    # Check if container state has 'running' attribute (meaning it's running)
-                    if not hasattr(status, 'state') or not status.state:
-                        all_running = False
-                        break
-                    # Check if state.running exists (container is running)
-                    # V1ContainerState has attributes: running, waiting, terminated
-                    if not hasattr(status.state, 'running') or status.state.running is None:
-                        all_running = False
-                        break
-
-                if all_running:
-                    print(f'All containers in pod {pod_name} are running')
-                    return
+        def all_running(event_type: str, pod: V1Pod | None) -> bool:
+            if event_type in ('DELETED', 'MISSING'):
+                return False
+            # the informer has already updated the container states of this pod.
+            states: dict[str, str] = informer.get_indexed('container_states', pod_name) or {}
+            return all(states.get(container_name) == 'running' for container_name in container_names)
 
-            except ApiException as e:
-                if e.status != 404:  # Ignore 404 errors while pod is being created
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for containers {container_names} in pod {pod_name} to be running after {timeout_seconds} seconds")
+        try:
+            cls.wait_until('pod', cls.client.list_namespaced_pod, namespace_name, pod_name, all_running, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for containers {container_names} in pod {pod_name} to be running after {timeout_seconds} seconds") from te
 
     @classmethod
     def save(cls, data: SavePodDataClass) -> dict:
@@ -910,12 +1003,13 @@ class PodManager(KubernetesResourceManager):
             # Wait for all containers to be running before attempting to save
             # This prevents "container not running" errors during save operations
             required_containers = [data.pod_name, data.sidecar_pod_name]
-            cls.poll_container_readiness(
-                namespace_name=data.namespace_name,
-                pod_name=data.pod_name,
-                container_names=required_containers,
-                timeout_seconds=CONTAINER_READINESS_TIMEOUT_SECONDS
-            )
+            with Timeline.phase('save.poll_container_readiness'):
+                cls.poll_container_readiness(
+                    namespace_name=data.namespace_name,
+                    pod_name=data.pod_name,
+                    container_names=required_containers,
+                    timeout_seconds=CONTAINER_READINESS_TIMEOUT_SECONDS
+                )
 
             # save the pod
             return {**SaveUtility.save_image(data), 'pod_name': data.pod_name, 'namespace_name': data.namespace_name}
@@ -929,93 +1023,194 @@ class PodManager(KubernetesResourceManager):
             raise Exception(f'Error occured: {str(e)}') from e
 
     @classmethod
-    def _ensure_status_sidecar_rbac(cls, namespace_name: str) -> None:
+    def rbac_api(cls) -> RbacAuthorizationV1Api:
+        '''
+        Get the shared RBAC client.
+        :params: None
+        :returns: RbacAuthorizationV1Api
+        '''
+        if cls.rbac_client is None:
+            cls.rbac_client = RbacAuthorizationV1Api()
+        return cls.rbac_client
+
+    @classmethod
+    def ensure_status_sidecar_rbac(cls, namespace_name: str) -> None:
         '''
         Ensure RBAC resources exist for status sidecar pod watching.
-        Creates ServiceAccount, Role, and RoleBinding if they don't exist.
+        Creates ServiceAccount, Role, and RoleBinding. One create each, an existing resource (409) is fine.
         This is idempotent - safe to call multiple times.
 
         :params: namespace_name: str - Namespace to create RBAC resources in
         '''
-        rbac_api: RbacAuthorizationV1Api = RbacAuthorizationV1Api()
-
-        # Create ServiceAccount if it doesn't exist
-        try:
-            cls.client.read_namespaced_service_account(
+        rbac_api: RbacAuthorizationV1Api = cls.rbac_api()
+        service_account: V1ServiceAccount = V1ServiceAccount(
+            metadata=V1ObjectMeta(
                 name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
                 namespace=namespace_name
             )
-        except ApiException as e:
-            if e.status == 404:
-                service_account = V1ServiceAccount(
-                    metadata=V1ObjectMeta(
-                        name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
-                        namespace=namespace_name
-                    )
-                )
-                cls.client.create_namespaced_service_account(namespace_name, service_account)
-                print(f'Created ServiceAccount {STATUS_SIDECAR_SERVICE_ACCOUNT_NAME} in namespace {namespace_name}')
-            else:
-                raise
-
-        # Create Role if it doesn't exist
-        try:
-            rbac_api.read_namespaced_role(
+        )
+        role: V1Role = V1Role(
+            metadata=V1ObjectMeta(
                 name=STATUS_SIDECAR_ROLE_NAME,
                 namespace=namespace_name
-            )
-        except ApiException as e:
-            if e.status == 404:
-                role = V1Role(
-                    metadata=V1ObjectMeta(
-                        name=STATUS_SIDECAR_ROLE_NAME,
-                        namespace=namespace_name
-                    ),
-                    rules=[
-                        V1PolicyRule(
-                            api_groups=[''],
-                            resources=['pods'],
-                            verbs=['get', 'list', 'watch']
-                        )
-                    ]
+            ),
+            rules=[
+                V1PolicyRule(
+                    api_groups=[''],
+                    resources=['pods'],
+                    verbs=['get', 'list', 'watch']
                 )
-                rbac_api.create_namespaced_role(namespace_name, role)
-                print(f'Created Role {STATUS_SIDECAR_ROLE_NAME} in namespace {namespace_name}')
-            else:
-                raise
-
-        # Create RoleBinding if it doesn't exist
-        try:
-            rbac_api.read_namespaced_role_binding(
+            ]
+        )
+        role_binding: V1RoleBinding = V1RoleBinding(
+            metadata=V1ObjectMeta(
                 name=STATUS_SIDECAR_ROLE_BINDING_NAME,
                 namespace=namespace_name
-            )
-        except ApiException as e:
-            if e.status == 404:
-                role_binding = V1RoleBinding(
-                    metadata=V1ObjectMeta(
-                        name=STATUS_SIDECAR_ROLE_BINDING_NAME,
-                        namespace=namespace_name
-                    ),
-                    subjects=[
-                        RbacV1Subject(
-                            kind='ServiceAccount',
-                            name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
-                            namespace=namespace_name
-                        )
-                    ],
-                    role_ref=V1RoleRef(
-                        api_group='rbac.authorization.k8s.io',
-                        kind='Role',
-                        name=STATUS_SIDECAR_ROLE_NAME
-                    )
+            ),
+            subjects=[
+                RbacV1Subject(
+                    kind='ServiceAccount',
+                    name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
+                    namespace=namespace_name
                 )
-                rbac_api.create_namespaced_role_binding(namespace_name, role_binding)
-                print(f'Created RoleBinding {STATUS_SIDECAR_ROLE_BINDING_NAME} in namespace {namespace_name}')
-            else:
-                raise
+            ],
+            role_ref=V1RoleRef(
+                api_group='rbac.authorization.k8s.io',
+                kind='Role',
+                name=STATUS_SIDECAR_ROLE_NAME
+            )
+        )
+        for create, body in (
+            (cls.client.create_namespaced_service_account, service_account),
+            (rbac_api.create_namespaced_role, role),
+            (rbac_api.create_namespaced_role_binding, role_binding),
+        ):
+            try:
+                create(namespace_name, body)
+                print(f'Created {body.__class__.__name__[2:]} {body.metadata.name} in namespace {namespace_name}')
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+
+    @classmethod
+    def build_pod_manifest(cls, data: CreatePodDataClass) -> V1Pod:
+        '''
+        Build the manifest of a pod: the main container, the snapshot sidecar and the status sidecar.
+        :params: data: CreatePodDataClass
+        :returns: V1Pod: Pod manifest
+        '''
+        # create environment variable list
+        environment_variables: list[V1EnvVar] = [
+            V1EnvVar(name=name, value=value)
+            for name, value in data.environment_variables.items()
+        ]
+        # create target port list
+        target_ports: list[V1ContainerPort] = [
+            V1ContainerPort(container_port=target_port)
+            for target_port in data.target_ports
+        ]
+        # Create volume mounts for snapshot directory
+        snapshot_volume_mount = V1VolumeMount(
+            name="snapshot-volume",
+            mount_path=SNAPSHOT_DIR
+        )
+        # Build resource requirements from the request's ResourceRequirementsDataClass
+        rr: ResourceRequirementsDataClass | None = data.resource_requirements
+        requests: dict = {}
+        limits: dict = {}
+        if rr:
+            rr_dict: dict = rr.to_dict()
+            # Map dataclass fields to Kubernetes resource keys and bucket (requests/limits)
+            field_mapping: dict[str, tuple[str, str]] = {
+                "cpu_request": ("requests", "cpu"),
+                "cpu_limit": ("limits", "cpu"),
+                "memory_request": ("requests", "memory"),
+                "memory_limit": ("limits", "memory"),
+                "ephemeral_request": ("requests", "ephemeral-storage"),
+                "ephemeral_limit": ("limits", "ephemeral-storage"),
+            }
+            for field_name, (bucket, k8s_key) in field_mapping.items():
+                value = rr_dict.get(field_name)
+                if not value:
+                    continue
+                if bucket == "requests":
+                    requests[k8s_key] = value
+                else:
+                    limits[k8s_key] = value
+
+        resource_requirements_k8s: V1ResourceRequirements | None = None
+        if requests or limits:
+            resource_requirements_k8s = V1ResourceRequirements(
+                requests=requests or None,
+                limits=limits or None,
+            )
+
+        containers: list[V1Container] = [
+            V1Container(
+                name=data.pod_name,
+                image=data.image_name,
+                ports=target_ports,
+                env=environment_variables,
+                security_context=V1SecurityContext(
+                    privileged=True
+                ),
+                volume_mounts=[snapshot_volume_mount],
+                resources=resource_requirements_k8s or None,
+            ),
+            V1Container(
+                name=SNAPSHOT_SIDECAR_NAME,
+                image=SNAPSHOT_SIDECAR_IMAGE_NAME,
+                security_context=V1SecurityContext(
+                    privileged=True
+                ),
+                volume_mounts=[snapshot_volume_mount],
+                resources=resource_requirements_k8s or None,
+            ),
+            V1Container(
+                name=STATUS_SIDECAR_NAME,
+                image=STATUS_SIDECAR_IMAGE_NAME,
+                security_context=V1SecurityContext(
+                    privileged=True
+                ),
+                env=environment_variables,
+                resources=resource_requirements_k8s or None,
+            )
+        ]
+        # Create volumes for the pod, with optional snapshot size limit
+        empty_dir_kwargs: dict = {}
+        if rr and rr.snapshot_size_limit:
+            empty_dir_kwargs["size_limit"] = rr.snapshot_size_limit
+        volumes = [
+            V1Volume(
+                name="snapshot-volume",
+                empty_dir=V1EmptyDirVolumeSource(**empty_dir_kwargs),
+            )
+        ]
+
+        # create pod manifest
+        pod_manifest: V1Pod = V1Pod(
+            metadata=V1ObjectMeta(
+                name=data.pod_name,
+                labels={"app": data.pod_name},
+                annotations={
+                    "nginx.org/websocket-services": data.pod_name,  # for websockets
+                    "nginx.ingress.kubernetes.io/proxy-read-timeout": "3600",  # for websockets
+                    "nginx.ingress.kubernetes.io/proxy-send-timeout": "3600"  # for websockets
+                }
+            ),
+            spec=V1PodSpec(
+                service_account_name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
+                security_context=V1SecurityContext(
+                    privileged=True
+                ),
+                volumes=volumes,
+                containers=containers
+            )
+        )
+        return pod_manifest
 
     @classmethod
+    @single_flight(lambda cls, data: ('create', 'pod', data.namespace_name, data.pod_name))
     def create(cls, data: CreatePodDataClass) -> dict:
         '''
         Create a pod.
@@ -1027,122 +1222,30 @@ class PodManager(KubernetesResourceManager):
             p: dict = cls.get(GetPodDataClass(namespace_name=data.namespace_name, pod_name=data.pod_name))
             if p:
                 return p
+            # a pod of the same name may still be terminating after a delete that did not wait.
+            cls.wait_for_terminating(cls.informer(data.namespace_name), data.pod_name, POD_TERMINATION_TIMEOUT)
 
-            # Ensure RBAC resources exist for status sidecar
-            cls._ensure_status_sidecar_rbac(data.namespace_name)
-            # create environment variable list
-            environment_variables: list[V1EnvVar] = [
-                V1EnvVar(name=name, value=value)
-                for name, value in data.environment_variables.items()
-            ]
-            # create target port list
-            target_ports: list[V1ContainerPort] = [
-                V1ContainerPort(container_port=target_port)
-                for target_port in data.target_ports
-            ]
-            # Create volume mounts for snapshot directory
-            snapshot_volume_mount = V1VolumeMount(
-                name="snapshot-volume",
-                mount_path=SNAPSHOT_DIR
-            )
-            # Build resource requirements from the request's ResourceRequirementsDataClass
-            rr: ResourceRequirementsDataClass | None = data.resource_requirements
-            requests: dict = {}
-            limits: dict = {}
-            if rr:
-                rr_dict: dict = rr.to_dict()
-                # Map dataclass fields to Kubernetes resource keys and bucket (requests/limits)
-                field_mapping: dict[str, tuple[str, str]] = {
-                    "cpu_request": ("requests", "cpu"),
-                    "cpu_limit": ("limits", "cpu"),
-                    "memory_request": ("requests", "memory"),
-                    "memory_limit": ("limits", "memory"),
-                    "ephemeral_request": ("requests", "ephemeral-storage"),
-                    "ephemeral_limit": ("limits", "ephemeral-storage"),
-                }
-                for field_name, (bucket, k8s_key) in field_mapping.items():
-                    value = rr_dict.get(field_name)
-                    if not value:
-                        continue
-                    if bucket == "requests":
-                        requests[k8s_key] = value
-                    else:
-                        limits[k8s_key] = value
-
-            resource_requirements_k8s: V1ResourceRequirements | None = None
-            if requests or limits:
-                resource_requirements_k8s = V1ResourceRequirements(
-                    requests=requests or None,
-                    limits=limits or None,
-                )
-
-            containers: list[V1Container] = [
-                V1Container(
-                    name=data.pod_name,
-                    image=data.image_name,
-                    ports=target_ports,
-                    env=environment_variables,
-                    security_context=V1SecurityContext(
-                        privileged=True
-                    ),
-                    volume_mounts=[snapshot_volume_mount],
-                    resources=resource_requirements_k8s or None,
-                ),
-                V1Container(
-                    name=SNAPSHOT_SIDECAR_NAME,
-                    image=SNAPSHOT_SIDECAR_IMAGE_NAME,
-                    security_context=V1SecurityContext(
-                        privileged=True
-                    ),
-                    volume_mounts=[snapshot_volume_mount],
-                    resources=resource_requirements_k8s or None,
-                ),
-                V1Container(
-                    name=STATUS_SIDECAR_NAME,
-                    image=STATUS_SIDECAR_IMAGE_NAME,
-                    security_context=V1SecurityContext(
-                        privileged=True
-                    ),
-                    env=environment_variables,
-                    resources=resource_requirements_k8s or None,
-                )
-            ]
-            # Create volumes for the pod, with optional snapshot size limit
-            empty_dir_kwargs: dict = {}
-            if rr and rr.snapshot_size_limit:
-                empty_dir_kwargs["size_limit"] = rr.snapshot_size_limit
-            volumes = [
-                V1Volume(
-                    name="snapshot-volume",
-                    empty_dir=V1EmptyDirVolumeSource(**empty_dir_kwargs),
-                )
-            ]
-
-            # create pod manifest
-            pod_manifest: V1Pod = V1Pod(
-                metadata=V1ObjectMeta(
-                    name=data.pod_name,
-                    labels={"app": data.pod_name},
-                    annotations={
-                        "nginx.org/websocket-services": data.pod_name,  # for websockets
-                        "nginx.ingress.kubernetes.io/proxy-read-timeout": "3600",  # for websockets
-                        "nginx.ingress.kubernetes.io/proxy-send-timeout": "3600"  # for websockets
-                    }
-                ),
-                spec=V1PodSpec(
-                    service_account_name=STATUS_SIDECAR_SERVICE_ACCOUNT_NAME,
-                    security_context=V1SecurityContext(
-                        privileged=True
-                    ),
-                    volumes=volumes,
-                    containers=containers
-                )
-            )
+            # Ensure RBAC resources exist for status sidecar, unless the namespace is known to be provisioned
+            if NamespaceBootstrap.get(data.namespace_name) is None:
+                cls.ensure_status_sidecar_rbac(data.namespace_name)
+            pod_manifest: V1Pod = cls.build_pod_manifest(data)
             # create the actual pod
-            pod: V1Pod = cls.client.create_namespaced_pod(data.namespace_name, pod_manifest)
+            with Timeline.phase('pod.create'):
+                try:
+                    pod: V1Pod = cls.client.create_namespaced_pod(data.namespace_name, pod_manifest)
+                except ApiException as ae:
+                    if ae.status != 409:
+                        raise
+                    # created at the same time by someone else (e.g. another replica): wait for that pod instead.
+                    pod = cls.client.read_namespaced_pod(data.pod_name, data.namespace_name)
+            InformerCache.record_created('pod', data.namespace_name, pod)
+            cls.invalidate_reads(data.namespace_name)
             # wait for the pod status to be running
-            cls.poll_status(namespace_name=data.namespace_name, pod_name=data.pod_name, target_status='Running')
-            return cls.get_pod_response(pod)
+            with Timeline.phase('pod.poll_status'):
+                running_pod: V1Pod = cls.poll_status(namespace_name=data.namespace_name, pod_name=data.pod_name, target_status='Running')
+            cls.observe_startup(running_pod)
+            # a running pod normally has its IP already, only wait for it if it does not.
+            return cls.get_pod_response(running_pod, wait_for_ip=not (running_pod.status and running_pod.status.pod_ip))
         except TimeoutError as te:
             raise TimeoutError(te) from te
         except ApiException as ae:
@@ -1155,17 +1258,13 @@ class PodManager(KubernetesResourceManager):
     @classmethod
     def poll_termination(cls, namespace_name: str, pod_name: str, timeout_seconds: float = POD_TERMINATION_TIMEOUT) -> None:
         '''
-        Poll pod termination.
+        Wait for pod termination. Returns as soon as the DELETED event of the pod arrives.
         :params: namespace_name: str
         :params: pod_name: str
         :params: timeout_seconds: float
+        :raises: TimeoutError: If the pod still exists after timeout_seconds
         '''
-        is_terminated: bool = False
-        while is_terminated != True:
-            pod: dict = cls.get(GetPodDataClass(**{'namespace_name': namespace_name, 'pod_name': pod_name}))
-            is_terminated = (pod == {})
-            print(f'Pod: {pod_name} Deleted:', is_terminated)
-            time.sleep(timeout_seconds)
+        cls.wait_for_deletion('pod', cls.client.list_namespaced_pod, namespace_name, pod_name, timeout_seconds)
 
     @classmethod
     def delete(cls, data: DeletePodDataClass) -> dict:
@@ -1176,12 +1275,22 @@ class PodManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            cls.client.delete_namespaced_pod(data.pod_name, data.namespace_name)
-            cls.poll_termination(data.namespace_name, data.pod_name) # wait for pod to be deleted, otherwise list pod will find it and integration tests will fail..
+            with Timeline.phase('pod.delete'):
+                cls.client.delete_namespaced_pod(data.pod_name, data.namespace_name)
+            cls.invalidate_reads(data.namespace_name)
+            # reads hide pods being deleted, so only wait for it to be gone if asked to.
+            InformerCache.record_deleting('pod', data.namespace_name, data.pod_name)
+            if data.wait:
+                cls.poll_termination(data.namespace_name, data.pod_name)
             return {'status': 'success'}
+        except TimeoutError as te:
+            raise TimeoutError(te) from te
         except ApiException as ae:
             raise ApiException(f'Error occured while deleting pod: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
             raise UnsupportedRuntimeEnvironment(f'Unsupported Run time Environment: {str(ure)}') from ure
         except Exception as e:
             raise Exception(f'Unkown error occured: {str(e)}') from e
+
+
+InformerCache.register_indexer('pod', 'container_states', PodManager.get_container_states)
@@ -0,0 +1,71 @@
+'''
+Request scoped read-through memo for kubernetes reads.
+
+One servicer call often repeats the same read many times
+(e.g. delete_ingress -> delete_service -> ServiceManager.get -> PodManager.list).
+Inside a RequestContext, identical reads (same verb, kind, namespace and name) are done once.
+Any write to a namespace drops the memoized reads of that namespace.
+'''
+
+# builtins
+from contextvars import ContextVar
+import threading
+
+
+class RequestContext:
+    '''
+    Memoize identical kubernetes reads for the lifetime of one servicer call.
+
+    Usage:
+        with RequestContext():
+            KubernetesContainerManager.delete(data)
+    '''
+    current: ContextVar = ContextVar('kubernetes_request_context', default=None)
+
+    def __init__(self) -> None:
+        self.reads: dict[tuple, object] = {}
+        self.lock: threading.Lock = threading.Lock()
+        self.token = None
+
+    def __enter__(self) -> 'RequestContext':
+        self.token = RequestContext.current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        RequestContext.current.reset(self.token)
+        self.reads.clear()
+
+    def get(self, key: tuple) -> tuple[bool, object]:
+        '''
+        Get a memoized read.
+        :params: key: tuple - (verb, kind, namespace_name, name)
+        :returns: tuple[bool, object]: (found, value)
+        '''
+        with self.lock:
+            if key in self.reads:
+                return True, self.reads[key]
+            return False, None
+
+    def set(self, key: tuple, value: object) -> None:
+        '''
+        Memoize a read.
+        :params: key: tuple - (verb, kind, namespace_name, name)
+        :params: value: object
+        :returns: None
+        '''
+        with self.lock:
+            self.reads[key] = value
+
+    def invalidate(self, namespace_name: str) -> None:
+        '''
+        Drop every memoized read of a namespace, and every namespace level read.
+        Responses of one kind embed other kinds (a service embeds its pods), so a write
+        to any kind invalidates the whole namespace.
+        :params: namespace_name: str
+        :returns: None
+        '''
+        with self.lock:
+            self.reads = {
+                key: value for key, value in self.reads.items()
+                if key[2] != namespace_name and key[1] != 'namespace'
+            }
@@ -3,17 +3,51 @@ from src.common.config import REPO_NAME
 
 # Timeout for getting IP addresses
 INGRESS_IP_TIMEOUT_SECONDS: float = 60.0
-INGRESS_TERMINATION_TIMEOUT: float = 20.0
+INGRESS_TERMINATION_TIMEOUT: float = 60.0
+
+# Ingress controller
+INGRESS_CLASS_NAME: str = 'nginx'
+INGRESS_CONTROLLER_NAMESPACE: str = 'ingress-nginx'
+INGRESS_CONTROLLER_SERVICE_NAME: str = 'ingress-nginx-controller'
+INGRESS_CONTROLLER_RETRY_SECONDS: float = 5.0  # first delay before watching the controller again after a failure
+INGRESS_CONTROLLER_RETRY_MAX_SECONDS: float = 300.0  # the delay doubles up to this
 
 # Timeout for pod uptime
 POD_UPTIME_TIMEOUT: float = 80.0
 POD_IP_TIMEOUT_SECONDS: float = 20.0
-POD_TERMINATION_TIMEOUT: float = 20.0
+POD_IP_PENDING: str = 'pending'  # reported while a pod has not been assigned an IP
+POD_TERMINATION_TIMEOUT: float = 90.0  # covers the default 30s termination grace period
 
 # Timeout for service uptime
 SERVICE_IP_TIMEOUT_SECONDS: float = 20.0
-SERVICE_TERMINATION_TIMEOUT: float = 20.0
+SERVICE_TERMINATION_TIMEOUT: float = 60.0
 SERVICE_ENDPOINTS_TIMEOUT_SECONDS: float = 30.0
+ENDPOINT_SLICE_SERVICE_LABEL: str = 'kubernetes.io/service-name'  # set by kubernetes on every EndpointSlice of a service
+
+# Timeout for namespace deletion
+NAMESPACE_TERMINATION_TIMEOUT: float = 180.0
+
+# Namespace reaper
+NAMESPACE_MANAGED_BY_LABEL: str = 'app.kubernetes.io/managed-by'
+NAMESPACE_MANAGED_BY_VALUE: str = 'container-maker'  # only namespaces with this label are ever reaped
+REAPER_SWEEP_INTERVAL_SECONDS: float = 300.0  # full sweep over every managed namespace
+REAPER_MIN_INTERVAL_SECONDS: float = 10.0  # at most one sweep per interval
+REAPER_GRACE_SECONDS: float = 60.0  # a namespace must be this old and empty for this long
+REAPER_MAX_DELETES_PER_SWEEP: int = 20
+
+# Image pre-pull (switches are in src/common/config.py)
+IMAGE_PREPULL_DAEMONSET_NAME: str = 'container-maker-image-prepull'
+IMAGE_PREPULL_TOOLS_IMAGE: str = 'busybox:1.36-musl'  # statically linked, copied into the pods so no binary of a pulled image is run
+IMAGE_PREPULL_TOOLS_DIR: str = '/prepull'
+IMAGE_PREPULL_RUN_AS_USER: int = 65534  # nobody
+IMAGE_PREPULL_RECONCILE_SECONDS: float = 300.0
+IMAGE_PREPULL_HALF_LIFE_SECONDS: float = 86400.0  # a create counts half as much for popularity after a day
+
+# Warm pod pool (sizes are in src/common/config.py)
+WARM_POOL_LABEL: str = 'container-maker/warm-pool'  # value: key of the (image, resource profile) pool
+WARM_POOL_STATE_LABEL: str = 'container-maker/warm-pool-state'  # removed when the pod is claimed
+WARM_POOL_STATE_WARM: str = 'warm'
+WARM_POOL_POD_PREFIX: str = 'warm'
 
 # Saving the Pod
 SNAPSHOT_DIR: str = '/mnt/snapshot'
@@ -39,3 +73,10 @@ DOCKER_LOGIN_RETRY_DELAY_SECONDS: float = 2.0
 # Docker build retry configuration
 DOCKER_BUILD_MAX_RETRIES: int = 3
 DOCKER_BUILD_RETRY_DELAY_SECONDS: float = 5.0
+
+# Informer cache
+INFORMER_WATCH_TIMEOUT_SECONDS: int = 300
+INFORMER_RETRY_DELAY_SECONDS: float = 1.0
+
+# Fan out
+FAN_OUT_MAX_WORKERS: int = 16
@@ -1,6 +1,7 @@
 # builtins
+import contextvars
 from collections import defaultdict
-import time
+from typing import List
 
 # modules
 from src.resources.dataclasses.pod.list_pod_dataclass import ListPodDataClass
@@ -10,13 +11,19 @@ from src.resources.dataclasses.service.create_service_dataclass import CreateSer
 from src.resources.dataclasses.service.get_service_dataclass import GetServiceDataClass
 from src.resources.dataclasses.service.list_service_dataclass import ListServiceDataClass
 from src.resources import KubernetesResourceManager
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.label_index import LabelSelectorIndex
 from src.common.exceptions import UnsupportedRuntimeEnvironment
+from src.common.timeline import Timeline
+from src.common.single_flight import single_flight
 from src.resources.pod_manager import PodManager
-from src.resources.resource_config import SERVICE_IP_TIMEOUT_SECONDS, SERVICE_TERMINATION_TIMEOUT, SERVICE_ENDPOINTS_TIMEOUT_SECONDS, SNAPSHOT_SIDECAR_NAME
+from src.resources.resource_config import SERVICE_IP_TIMEOUT_SECONDS, SERVICE_TERMINATION_TIMEOUT, SERVICE_ENDPOINTS_TIMEOUT_SECONDS, SNAPSHOT_SIDECAR_NAME, ENDPOINT_SLICE_SERVICE_LABEL
 
 # third party
 from kubernetes.client.rest import ApiException
 from kubernetes.client import V1Service
+from kubernetes.client import V1EndpointSlice
+from kubernetes.client import DiscoveryV1Api
 from kubernetes.client import V1ObjectMeta
 from kubernetes.client import V1ServiceSpec
 from kubernetes.client import V1ServicePort
@@ -26,26 +33,49 @@ class ServiceManager(KubernetesResourceManager):
     '''
     Manage kubernetes services.
     '''
+    discovery_client: DiscoveryV1Api | None = None
 
     @classmethod
-    def get_associated_pods(cls, service: dict) -> list[dict]:
+    def build_pod_index(cls, namespace_name: str) -> LabelSelectorIndex:
+        '''
+        Build a label index over all pods of a namespace, with a single pod list.
+        :params: namespace_name: str
+        :returns: LabelSelectorIndex
+        '''
+        return LabelSelectorIndex(PodManager.list(ListPodDataClass(**{'namespace_name': namespace_name})))
+
+    @classmethod
+    def endpoint_slice_informer(cls, namespace_name: str) -> KubernetesInformer:
+        '''
+        Get the shared EndpointSlice informer of a namespace, grouped by service name.
+        :params: namespace_name: str
+        :returns: KubernetesInformer
+        '''
+        if cls.discovery_client is None:
+            cls.discovery_client = DiscoveryV1Api()
+        return InformerCache.get_informer(
+            'endpointslice',
+            namespace_name,
+            cls.discovery_client.list_namespaced_endpoint_slice,
+            group_label=ENDPOINT_SLICE_SERVICE_LABEL,
+        )
+
+    @classmethod
+    def get_associated_pods(cls, service: dict, pod_index: LabelSelectorIndex | None = None) -> list[dict]:
         '''
         Get associated pods for a service by matching the service's selector labels
-        with pod labels.
+        with pod labels. Pods that are not ready (pending, unscheduled, not in an EndpointSlice yet)
+        are associated too, so that a teardown of the service deletes them.
         :params: service: dict
+        :params: pod_index: LabelSelectorIndex | None - Reuse an index built for the namespace. Built if not provided.
         :returns: list[dict]: List of pods
         '''
-        pods: list = PodManager.list(ListPodDataClass(**{'namespace_name': service.get('metadata', {}).get('namespace', '')}))
         service_selector: dict = service.get('spec', {}).get('selector', {})
         if not service_selector:
             return []
-        return [
-            pod for pod in pods
-            if all(
-                pod.get('pod_labels', {}).get(key) == value
-                for key, value in service_selector.items()
-            )
-        ]
+        if pod_index is None:
+            pod_index = cls.build_pod_index(service.get('metadata', {}).get('namespace', ''))
+        return pod_index.match(service_selector)
 
     @classmethod
     def get_service_ports(cls, service: V1Service) -> list[dict]:
@@ -63,6 +93,24 @@ class ServiceManager(KubernetesResourceManager):
             })
         return ports
 
+    @classmethod
+    def informer(cls, namespace_name: str) -> KubernetesInformer:
+        '''
+        Get the shared service informer of a namespace.
+        :params: namespace_name: str
+        :returns: KubernetesInformer
+        '''
+        return InformerCache.get_informer('service', namespace_name, cls.client.list_namespaced_service)
+
+    @classmethod
+    def list_objects(cls, namespace_name: str) -> list[V1Service]:
+        '''
+        List all V1Service objects in a namespace from the informer cache.
+        :params: namespace_name: str
+        :returns: list[V1Service]
+        '''
+        return cls.informer(namespace_name).list()
+
     @classmethod
     def list(cls, data: ListServiceDataClass) -> list[V1Service]:
         '''
@@ -72,10 +120,14 @@ class ServiceManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            return [
-                cls.get_service_response(service)
-                for service in cls.client.list_namespaced_service(namespace=data.namespace_name).items
-            ]
+
+            def read() -> list[dict]:
+                pod_index: LabelSelectorIndex = cls.build_pod_index(data.namespace_name)
+                return [
+                    cls.get_service_response(service, pod_index=pod_index)
+                    for service in cls.list_objects(data.namespace_name)
+                ]
+            return cls.memoized_read('list', 'service', data.namespace_name, None, read)
         except ApiException as ae:
             raise ApiException(f'Error occurred while listing services: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
@@ -84,7 +136,7 @@ class ServiceManager(KubernetesResourceManager):
             raise Exception(f'Unknown error occurred: {str(e)}') from e
 
     @classmethod
-    def get_service_response(cls, service: V1Service, service_ip: str | None = None) -> dict:
+    def get_service_response(cls, service: V1Service, service_ip: str | None = None, pod_index: LabelSelectorIndex | None = None) -> dict:
         """
         Format a V1Service into a consistent response dictionary.
 
@@ -92,9 +144,11 @@ class ServiceManager(KubernetesResourceManager):
             service: The Kubernetes V1Service object.
             service_ip: Optional override for the service IP. If not provided,
                         the IP is taken directly from the service's cluster_ip.
+            pod_index: Optional label index of the namespace's pods, shared
+                       between services so the pods are listed only once.
         """
         ip_value = service_ip if service_ip is not None else service._spec.cluster_ip
-        associated_pods: list[dict] = cls.get_associated_pods(service.to_dict())
+        associated_pods: list[dict] = cls.get_associated_pods(service.to_dict(), pod_index=pod_index)
 
         return {
             'resource_type': 'service',
@@ -108,16 +162,22 @@ class ServiceManager(KubernetesResourceManager):
         }
 
     @classmethod
-    def get(cls, data: GetServiceDataClass) -> V1Service:
+    def get(cls, data: GetServiceDataClass, pod_index: LabelSelectorIndex | None = None) -> V1Service:
         '''
         Get a service.
         :params: data: GetServiceDataClass
+        :params: pod_index: LabelSelectorIndex | None - Optional label index of the namespace's pods
         :returns: dict: Service Details
         '''
         try:
             cls.check_kubernetes_client()
-            response: V1Service = cls.client.read_namespaced_service(name=data.service_name, namespace=data.namespace_name)
-            return cls.get_service_response(response)
+
+            def read() -> dict:
+                response: V1Service | None = cls.informer(data.namespace_name).get(data.service_name)
+                if response is None:
+                    return {}
+                return cls.get_service_response(response, pod_index=pod_index)
+            return cls.memoized_read('get', 'service', data.namespace_name, data.service_name, read)
         except ApiException as ae:
             if ae.status == 404:
                 return {}
@@ -127,52 +187,73 @@ class ServiceManager(KubernetesResourceManager):
         except Exception as e:
             raise Exception(f'Unknown error occurred: {str(e)}') from e
 
+    @classmethod
+    def get_services_by_name(cls, namespace_name: str, service_names: List[str], pod_index: LabelSelectorIndex | None = None) -> dict[str, dict]:
+        '''
+        Resolve many services of a namespace in one batch.
+        Uses a single service list and a single pod list, no matter how many names are asked for.
+        :params: namespace_name: str
+        :params: service_names: list[str] - Names to resolve. Missing services are left out of the result.
+        :params: pod_index: LabelSelectorIndex | None - Optional label index of the namespace's pods
+        :returns: dict[str, dict]: Service responses keyed by service name
+        '''
+        cls.check_kubernetes_client()
+        wanted: set[str] = set(service_names)
+        services: list[V1Service] = [
+            service for service in cls.list_objects(namespace_name)
+            if service.metadata.name in wanted
+        ]
+        if not services:
+            return {}
+        if pod_index is None:
+            pod_index = cls.build_pod_index(namespace_name)
+        return {
+            service.metadata.name: cls.get_service_response(service, pod_index=pod_index)
+            for service in services
+        }
+
     @classmethod
     def get_service_ip(cls, namespace_name: str, service_name: str, timeout_seconds: float = SERVICE_IP_TIMEOUT_SECONDS) -> str:
         '''
-        Get the service IP.
+        Get the service IP, waiting for it to be assigned.
         :params: namespace_name: str
         :params: service_name: str
         :params: timeout_seconds: float
         :returns: str: Service IP
         '''
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                service = cls.client.read_namespaced_service(name=service_name, namespace=namespace_name)
-                if service._spec.cluster_ip:
-                    return service._spec.cluster_ip
-            except ApiException as e:
-                if e.status != 404:  # Ignore 404 errors while pod is being created
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for service {service_name} IP address after {timeout_seconds} seconds")
+        def has_ip(event_type: str, service: V1Service | None) -> bool:
+            return event_type not in ('DELETED', 'MISSING') and bool(service.spec and service.spec.cluster_ip)
+
+        try:
+            service: V1Service = cls.wait_until('service', cls.client.list_namespaced_service, namespace_name, service_name, has_ip, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for service {service_name} IP address after {timeout_seconds} seconds") from te
+        return service.spec.cluster_ip
 
     @classmethod
     def wait_for_endpoints(cls, namespace_name: str, service_name: str, timeout_seconds: float = SERVICE_ENDPOINTS_TIMEOUT_SECONDS) -> bool:
         '''
         Wait for service endpoints to be ready.
         This ensures the service can route traffic to pods.
+        Resolved from the EndpointSlice informer as soon as one ready endpoint appears.
         :params: namespace_name: str
         :params: service_name: str
         :params: timeout_seconds: float
         :returns: bool: True if endpoints are ready
         '''
-        start_time = time.time()
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                endpoints = cls.client.read_namespaced_endpoints(name=service_name, namespace=namespace_name)
-                # Check if there's at least one ready address
-                if endpoints.subsets:
-                    for subset in endpoints.subsets:
-                        if subset.addresses and len(subset.addresses) > 0:
-                            print(f'Service {service_name} has {len(subset.addresses)} ready endpoint(s)')
-                            return True
-            except ApiException as e:
-                if e.status != 404:
-                    raise
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for service {service_name} endpoints after {timeout_seconds} seconds")
+        def has_ready_endpoint(event_type: str, slices: list[V1EndpointSlice]) -> bool:
+            # ready None means unknown, which kubernetes says to treat as ready.
+            return any(
+                endpoint.conditions is None or endpoint.conditions.ready is not False
+                for endpoint_slice in slices
+                for endpoint in (endpoint_slice.endpoints or [])
+            )
+
+        try:
+            cls.endpoint_slice_informer(namespace_name).wait_for_group(service_name, has_ready_endpoint, timeout_seconds)
+        except TimeoutError as te:
+            raise TimeoutError(f"Timeout waiting for service {service_name} endpoints after {timeout_seconds} seconds") from te
+        return True
 
     @classmethod
     def get_v1_service_ports(cls, data: CreateServiceDataClass) -> list:
@@ -207,6 +288,7 @@ class ServiceManager(KubernetesResourceManager):
         return ports
 
     @classmethod
+    @single_flight(lambda cls, data: ('create', 'service', data.namespace_name, data.service_name))
     def create(cls, data: CreateServiceDataClass) -> dict:
         '''
         Create a service.
@@ -219,6 +301,8 @@ class ServiceManager(KubernetesResourceManager):
             s: dict = cls.get(GetServiceDataClass(**{'namespace_name': data.namespace_name, 'service_name': data.service_name}))
             if s:
                 return s
+            # a service of the same name may still be terminating after a delete that did not wait.
+            cls.wait_for_terminating(cls.informer(data.namespace_name), data.service_name, SERVICE_TERMINATION_TIMEOUT)
 
             # create the service manifest
             service_manifest: V1Service = V1Service(
@@ -232,11 +316,22 @@ class ServiceManager(KubernetesResourceManager):
                 )
             )
             # create the service
-            service: V1Service = cls.client.create_namespaced_service(data.namespace_name, service_manifest)
+            with Timeline.phase('service.create'):
+                try:
+                    service: V1Service = cls.client.create_namespaced_service(data.namespace_name, service_manifest)
+                except ApiException as ae:
+                    if ae.status != 409:
+                        raise
+                    # created at the same time by someone else (e.g. another replica): wait for that service instead.
+                    service = cls.client.read_namespaced_service(data.service_name, data.namespace_name)
+            InformerCache.record_created('service', data.namespace_name, service)
+            cls.invalidate_reads(data.namespace_name)
             # resolve IP with timeout
-            service_ip: str = cls.get_service_ip(data.namespace_name, data.service_name)
+            with Timeline.phase('service.get_service_ip'):
+                service_ip: str = cls.get_service_ip(data.namespace_name, data.service_name)
             # wait for endpoints to be ready so the service can route traffic
-            cls.wait_for_endpoints(data.namespace_name, data.service_name)
+            with Timeline.phase('service.wait_for_endpoints'):
+                cls.wait_for_endpoints(data.namespace_name, data.service_name, data.endpoints_timeout_seconds or SERVICE_ENDPOINTS_TIMEOUT_SECONDS)
             return cls.get_service_response(service, service_ip=service_ip)
         except ApiException as ae:
             raise ApiException(f'Error occurred while creating service: {str(ae)}') from ae
@@ -248,17 +343,13 @@ class ServiceManager(KubernetesResourceManager):
     @classmethod
     def poll_termination(cls, namespace_name: str, service_name: str, timeout_seconds: float = SERVICE_TERMINATION_TIMEOUT) -> None:
         '''
-        Poll service termination.
+        Wait for service termination. Returns as soon as the DELETED event of the service arrives.
         :params: namespace_name: str
         :params: service_name: str
         :params: timeout_seconds: float
+        :raises: TimeoutError: If the service still exists after timeout_seconds
         '''
-        is_terminated: bool = False
-        while is_terminated != True:
-            service: dict = cls.get(GetServiceDataClass(**{'namespace_name': namespace_name, 'service_name': service_name}))
-            is_terminated = (service == {})
-            print(f'Service: {service_name} Deleted:', is_terminated)
-            time.sleep(timeout_seconds)
+        cls.wait_for_deletion('service', cls.client.list_namespaced_service, namespace_name, service_name, timeout_seconds)
 
     @classmethod
     def save_service_pods(cls, data: GetServiceDataClass) -> list:
@@ -274,10 +365,11 @@ class ServiceManager(KubernetesResourceManager):
 
         from concurrent.futures import ThreadPoolExecutor
         with ThreadPoolExecutor(max_workers=4) as worker:
-            # Submit all save operations to run in parallel
+            # Submit all save operations to run in parallel, in a copy of the caller's context so their phases reach its timeline.
             futures: list = []
             for pod in pods:
                 future = worker.submit(
+                    contextvars.copy_context().run,
                     PodManager.save, 
                     SavePodDataClass(
                         namespace_name=data.namespace_name,
@@ -306,9 +398,16 @@ class ServiceManager(KubernetesResourceManager):
         '''
         try:
             cls.check_kubernetes_client()
-            cls.client.delete_namespaced_service(data.service_name, data.namespace_name)
-            cls.poll_termination(data.namespace_name, data.service_name) # wait for service to be deleted, otherwise list service will find it and integration tests will fail..
+            with Timeline.phase('service.delete'):
+                cls.client.delete_namespaced_service(data.service_name, data.namespace_name)
+            cls.invalidate_reads(data.namespace_name)
+            # reads hide services being deleted, so only wait for it to be gone if asked to.
+            InformerCache.record_deleting('service', data.namespace_name, data.service_name)
+            if data.wait:
+                cls.poll_termination(data.namespace_name, data.service_name)
             return {'status': 'success'}
+        except TimeoutError as te:
+            raise TimeoutError(te) from te
         except ApiException as ae:
             raise ApiException(f'Error occurred while deleting service: {str(ae)}') from ae
         except UnsupportedRuntimeEnvironment as ure:
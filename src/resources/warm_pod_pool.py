@@ -0,0 +1,205 @@
+'''
+Pool of pre-started pods, so that a create does not pay for scheduling, image pull and container start up.
+
+Warm pods are ordinary pods (see PodManager.build_pod_manifest) labelled with the key of their pool,
+one pool per namespace, image, ports and resource profile. Pods can not move between namespaces,
+so a pool fills up in a namespace after its first create of an image, and the first create of a namespace
+is never warm. Per user namespaces would each keep WARM_POOL_SIZE idle pods for little gain, so pools are
+only kept in the shared namespaces listed in WARM_POOL_NAMESPACES: at most
+WARM_POOL_SIZE pods per listed namespace and pool key.
+A create claims a warm pod by relabeling it: the claim removes the warm label and sets the `app` label
+services select on. The env of a running container can not be changed, so creates with environment
+variables are not pooled. The pool is then refilled in the background.
+'''
+
+# builtins
+import hashlib
+import threading
+import uuid
+
+# modules
+import src.common.config as config
+from src.common.timeline import Timeline
+from src.resources import KubernetesResourceManager
+from src.resources.dataclasses.pod.create_pod_dataclass import CreatePodDataClass
+from src.resources.informer import InformerCache
+from src.resources.pod_manager import PodManager
+from src.resources.resource_config import WARM_POOL_LABEL, WARM_POOL_STATE_LABEL, WARM_POOL_STATE_WARM
+from src.resources.resource_config import WARM_POOL_POD_PREFIX
+
+# third party
+from kubernetes.client import V1Pod
+from kubernetes.client.rest import ApiException
+
+
+class WarmPodPool:
+    '''
+    Claim warm pods on create and keep WARM_POOL_SIZE of them per namespace, image and resource profile.
+    '''
+    refilling: set[tuple[str, str]] = set()  # (namespace_name, pool key) with a refill running
+    lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls, namespace_name: str, image_name: str) -> bool:
+        '''
+        Check if pods of an image are pooled in a namespace.
+        :params: namespace_name: str
+        :params: image_name: str
+        :returns: bool
+        '''
+        return (
+            KubernetesResourceManager.client is not None
+            and config.WARM_POOL_SIZE > 0
+            and namespace_name in config.WARM_POOL_NAMESPACES
+            and (not config.WARM_POOL_IMAGES or image_name in config.WARM_POOL_IMAGES)
+        )
+
+    @classmethod
+    def pool_key(cls, data: CreatePodDataClass) -> str:
+        '''
+        Get the key of the pool a pod belongs to: a hash of its image, ports and resource profile, usable as a label value.
+        :params: data: CreatePodDataClass
+        :returns: str
+        '''
+        profile: dict = data.resource_requirements.to_dict() if data.resource_requirements else {}
+        ports: str = ','.join(str(port) for port in sorted(data.target_ports or []))
+        fingerprint: str = data.image_name + '|' + ports + '|' + '|'.join(f'{key}={profile[key]}' for key in sorted(profile))
+        return hashlib.sha256(fingerprint.encode()).hexdigest()[:32]
+
+    @classmethod
+    def warm_pods(cls, namespace_name: str, key: str) -> list[V1Pod]:
+        '''
+        Get the unclaimed pods of a pool, from the pod informer. Running pods come first.
+        :params: namespace_name: str
+        :params: key: str
+        :returns: list[V1Pod]
+        '''
+        pods: list[V1Pod] = [
+            pod for pod in PodManager.informer(namespace_name).list()
+            if PodManager.is_warm(pod) and pod.metadata.labels.get(WARM_POOL_LABEL) == key
+        ]
+        return sorted(pods, key=lambda pod: (pod.status is None or pod.status.phase != 'Running', pod.metadata.name))
+
+    @classmethod
+    def claim(cls, data: CreatePodDataClass) -> dict | None:
+        '''
+        Claim a warm pod for a create, and refill its pool in the background.
+        The claimed pod keeps its own name (and so does the response); it gets the `app` label of data.pod_name,
+        so services select it as usual.
+        If the claimed pod does not come up, it is deleted, so that a retry does not claim it again.
+        :params: data: CreatePodDataClass
+        :returns: dict | None: Pod response, None if the create is not pooled or its pool is empty
+        '''
+        if not cls.enabled(data.namespace_name, data.image_name) or data.environment_variables:
+            return None
+        key: str = cls.pool_key(data)
+        # a pod of this pool already claimed for this name, e.g. by a create that is retried.
+        claimed: list[dict] = PodManager.list_by_selector(data.namespace_name, {'app': data.pod_name, WARM_POOL_LABEL: key})
+        if claimed:
+            return cls.wait_running(data.namespace_name, claimed[0]['pod_name'])
+        try:
+            with Timeline.phase('pod.warm_claim'):
+                for pod in cls.warm_pods(data.namespace_name, key):
+                    if cls.relabel(data.namespace_name, pod.metadata.name, data.pod_name):
+                        PodManager.invalidate_reads(data.namespace_name)
+                        return cls.wait_running(data.namespace_name, pod.metadata.name)
+                return None
+        finally:
+            cls.refill_later(data)
+
+    @classmethod
+    def wait_running(cls, namespace_name: str, pod_name: str) -> dict:
+        '''
+        Wait for a claimed pod to run. A pod that does not is deleted.
+        :params: namespace_name: str
+        :params: pod_name: str - Name of the claimed pod
+        :returns: dict: Pod response
+        '''
+        try:
+            running_pod: V1Pod = PodManager.poll_status(namespace_name=namespace_name, pod_name=pod_name, target_status='Running')
+            return PodManager.get_pod_response(running_pod, wait_for_ip=not (running_pod.status and running_pod.status.pod_ip))
+        except BaseException:
+            cls.release(namespace_name, pod_name)
+            raise
+
+    @classmethod
+    def relabel(cls, namespace_name: str, pod_name: str, app: str) -> bool:
+        '''
+        Atomically take a warm pod out of its pool. The patch fails if another create claimed the pod first.
+        :params: namespace_name: str
+        :params: pod_name: str - Name of the warm pod
+        :params: app: str - Value of the `app` label services select on
+        :returns: bool: True if the pod was claimed
+        '''
+        state_path: str = '/metadata/labels/' + WARM_POOL_STATE_LABEL.replace('~', '~0').replace('/', '~1')
+        patch: list[dict] = [
+            {'op': 'test', 'path': state_path, 'value': WARM_POOL_STATE_WARM},
+            {'op': 'remove', 'path': state_path},
+            {'op': 'replace', 'path': '/metadata/labels/app', 'value': app},
+        ]
+        try:
+            PodManager.client.patch_namespaced_pod(pod_name, namespace_name, patch)
+            return True
+        except ApiException as ae:
+            # 422: the test failed, the pod was claimed by someone else. 404: it is gone.
+            if ae.status in (404, 409, 422):
+                return False
+            raise
+
+    @classmethod
+    def release(cls, namespace_name: str, pod_name: str) -> None:
+        '''
+        Delete a claimed pod whose claim failed. It is not put back into the pool, it did not come up.
+        :params: namespace_name: str
+        :params: pod_name: str - Name of the warm pod
+        :returns: None
+        '''
+        try:
+            PodManager.client.delete_namespaced_pod(pod_name, namespace_name)
+            PodManager.invalidate_reads(namespace_name)
+            InformerCache.record_deleting('pod', namespace_name, pod_name)
+        except ApiException as ae:
+            if ae.status != 404:
+                print(f'Warm pool {namespace_name}: could not delete claimed pod {pod_name}: {str(ae)}')
+
+    @classmethod
+    def refill_later(cls, data: CreatePodDataClass) -> None:
+        '''
+        Refill the pool of a create in a background thread, unless a refill is already running.
+        :params: data: CreatePodDataClass
+        :returns: None
+        '''
+        key: tuple[str, str] = (data.namespace_name, cls.pool_key(data))
+        with cls.lock:
+            if key in cls.refilling:
+                return
+            cls.refilling.add(key)
+        threading.Thread(target=cls.refill, args=(data,), name=f'warm-pool-{data.namespace_name}', daemon=True).start()
+
+    @classmethod
+    def refill(cls, data: CreatePodDataClass) -> None:
+        '''
+        Create warm pods until the pool of a create has WARM_POOL_SIZE of them. Does not wait for them to start.
+        :params: data: CreatePodDataClass
+        :returns: None
+        '''
+        key: str = cls.pool_key(data)
+        try:
+            missing: int = config.WARM_POOL_SIZE - len(cls.warm_pods(data.namespace_name, key))
+            for _ in range(missing):
+                pod_name: str = f'{WARM_POOL_POD_PREFIX}-{uuid.uuid4().hex[:12]}'
+                pod_manifest: V1Pod = PodManager.build_pod_manifest(CreatePodDataClass(
+                    pod_name=pod_name,
+                    namespace_name=data.namespace_name,
+                    image_name=data.image_name,
+                    target_ports=data.target_ports,
+                    resource_requirements=data.resource_requirements,
+                ))
+                pod_manifest.metadata.labels.update({WARM_POOL_LABEL: key, WARM_POOL_STATE_LABEL: WARM_POOL_STATE_WARM})
+                pod: V1Pod = PodManager.client.create_namespaced_pod(data.namespace_name, pod_manifest)
+                InformerCache.record_created('pod', data.namespace_name, pod)
+        except Exception as e:
+            print(f'Warm pool {data.namespace_name}/{data.image_name}: refill failed: {str(e)}')
+        finally:
+            with cls.lock:
+                cls.refilling.discard((data.namespace_name, key))
@@ -0,0 +1,77 @@
+# built-in
+import threading
+import time
+from unittest import TestCase
+
+# modules
+from src.common.single_flight import SingleFlight, single_flight
+
+
+class Creator:
+    '''
+    A manager like class whose create is slow and counts its runs.
+    '''
+    runs: int = 0
+
+    @classmethod
+    @single_flight(lambda cls, name, fail=False: ('create', 'thing', 'test-namespace', name))
+    def create(cls, name: str, fail: bool = False) -> dict:
+        cls.runs += 1
+        time.sleep(0.1)
+        if fail:
+            raise ValueError(f'could not create {name}')
+        return {'name': name, 'run': cls.runs}
+
+
+def run_concurrently(*functions) -> list:
+    results: list = [None] * len(functions)
+
+    def run(position: int, function) -> None:
+        try:
+            results[position] = function()
+        except Exception as e:
+            results[position] = e
+
+    threads: list[threading.Thread] = [threading.Thread(target=run, args=(position, function)) for position, function in enumerate(functions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestSingleFlight')
+        Creator.runs = 0
+
+    def test_duplicates_join_the_call_in_flight(self) -> None:
+        '''
+        Test that concurrent calls with the same key run once and share the result.
+        '''
+        print('Test: test_duplicates_join_the_call_in_flight')
+        results: list = run_concurrently(*[lambda: Creator.create('web')] * 5)
+        self.assertEqual(Creator.runs, 1)
+        self.assertEqual(results, [{'name': 'web', 'run': 1}] * 5)
+        self.assertEqual(SingleFlight.calls, {})
+
+    def test_different_keys_run_separately(self) -> None:
+        '''
+        Test that calls with different keys do not wait on each other.
+        '''
+        print('Test: test_different_keys_run_separately')
+        started: float = time.monotonic()
+        results: list = run_concurrently(lambda: Creator.create('web'), lambda: Creator.create('db'))
+        self.assertEqual(Creator.runs, 2)
+        self.assertEqual([result['name'] for result in results], ['web', 'db'])
+        self.assertLess(time.monotonic() - started, 0.19)
+
+    def test_error_is_shared_and_not_remembered(self) -> None:
+        '''
+        Test that duplicates get the error of the call they joined, and that a later call runs again.
+        '''
+        print('Test: test_error_is_shared_and_not_remembered')
+        results: list = run_concurrently(lambda: Creator.create('web', fail=True), lambda: Creator.create('web', fail=True))
+        self.assertEqual(Creator.runs, 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(Creator.create('web'), {'name': 'web', 'run': 2})
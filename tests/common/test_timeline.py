@@ -0,0 +1,88 @@
+# built-in
+import json
+import time
+from unittest import TestCase
+
+# modules
+from src.common.timeline import Timeline, TIMELINE_METADATA_KEY
+from src.resources.fan_out import FanOut
+
+
+class FakeServicerContext:
+    '''
+    Keeps the trailing metadata a servicer call would send.
+    '''
+    def __init__(self) -> None:
+        self.trailing_metadata: tuple = ()
+
+    def set_trailing_metadata(self, metadata: tuple) -> None:
+        self.trailing_metadata = metadata
+
+    def phases(self) -> list[dict]:
+        key, value = self.trailing_metadata[0]
+        assert key == TIMELINE_METADATA_KEY
+        return json.loads(value)
+
+
+class TestTimeline(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestTimeline')
+
+    def test_phases_are_sent_as_trailing_metadata(self) -> None:
+        '''
+        Test that the phases of an operation and its total reach the trailing metadata, in start order.
+        '''
+        print('Test: test_phases_are_sent_as_trailing_metadata')
+        context: FakeServicerContext = FakeServicerContext()
+        with Timeline('createContainer', context):
+            with Timeline.phase('pod.create'):
+                time.sleep(0.02)
+            with Timeline.phase('pod.poll_status'):
+                time.sleep(0.03)
+        phases: list[dict] = context.phases()
+        self.assertEqual([phase['phase'] for phase in phases if phase['phase'] != 'total'], ['pod.create', 'pod.poll_status'])
+        durations: dict = {phase['phase']: phase['duration_ms'] for phase in phases}
+        self.assertGreaterEqual(durations['pod.create'], 20)
+        self.assertGreaterEqual(durations['pod.poll_status'], 30)
+        self.assertGreaterEqual(durations['total'], 50)
+        self.assertGreaterEqual(phases[-1]['start_ms'], 20)
+
+    def test_failed_operation_keeps_its_timeline(self) -> None:
+        '''
+        Test that a failing phase is recorded and the timeline is still sent.
+        '''
+        print('Test: test_failed_operation_keeps_its_timeline')
+        context: FakeServicerContext = FakeServicerContext()
+        with self.assertRaises(TimeoutError):
+            with Timeline('saveContainer', context):
+                with Timeline.phase('save.docker_push'):
+                    raise TimeoutError('push timed out')
+        self.assertEqual(sorted(phase['phase'] for phase in context.phases()), ['save.docker_push', 'total'])
+
+    def test_phase_outside_a_timeline(self) -> None:
+        '''
+        Test that a phase without an operation around it runs normally and is not collected anywhere.
+        '''
+        print('Test: test_phase_outside_a_timeline')
+        with Timeline.phase('pod.delete'):
+            pass
+        self.assertIsNone(Timeline.current.get())
+
+    def test_phases_of_fanned_out_calls(self) -> None:
+        '''
+        Test that phases of calls run on the fan out workers reach the timeline of the caller, overlapping.
+        '''
+        print('Test: test_phases_of_fanned_out_calls')
+        context: FakeServicerContext = FakeServicerContext()
+
+        def step(name: str) -> None:
+            with Timeline.phase(name):
+                time.sleep(0.05)
+
+        with Timeline('createContainer', context):
+            FanOut.run(lambda: step('pod.create'), lambda: step('service.create'))
+        phases: dict = {phase['phase']: phase for phase in context.phases()}
+        self.assertIn('pod.create', phases)
+        self.assertIn('service.create', phases)
+        # both ran at once, so the total is less than the sum of the two.
+        self.assertLess(phases['total']['duration_ms'], 95)
@@ -1,5 +1,6 @@
 # builtins
 from unittest import TestCase
+from unittest.mock import patch
 
 # modules
 from src.containers.containers import KubernetesContainerManager
@@ -15,6 +16,7 @@ from src.resources.dataclasses.service.create_service_dataclass import PublishIn
 from src.resources.dataclasses.service.list_service_dataclass import ListServiceDataClass
 from src.resources.ingress_manager import IngressManager
 from src.resources.namespace_manager import NamespaceManager
+from src.resources.namespace_reaper import NamespaceReaper
 from src.resources.pod_manager import PodManager
 from src.resources.service_manager import ServiceManager
 
@@ -67,8 +69,11 @@ class TestDeleteContainer(TestCase):
                 - Deleted: Ingress
                 - Remaining: Service, Pod, Namespace
             c. Pod, Service and Ingress are created. Pod is deleted.
-                - Deleted: Pod, Service, Ingress, Namespace
-                - Remaining: None
+                - Deleted: Pod, Service, Ingress
+                - Remaining: Namespace, until the reaper deletes it
+        6. The namespace is never deleted by the delete itself: NamespaceReaper is notified and deletes it
+            in the background once it has been empty for REAPER_GRACE_SECONDS. The reaper is patched here,
+            so the tests check that it was notified and that the namespace is still there.
         
         Order of tests:
         ---------------
@@ -84,6 +89,10 @@ class TestDeleteContainer(TestCase):
             the namespace after Delete pod test deletes everything.
         '''
         print('Test: setUp TestDeleteContainer')
+        self.notified: list[str] = []
+        notify_patch = patch.object(NamespaceReaper, 'notify', lambda namespace_name: self.notified.append(namespace_name))
+        notify_patch.start()
+        self.addCleanup(notify_patch.stop)
         self.namespace_name: str = NAMESPACE_NAME
         self.container_name: str = 'test-container'
         self.image_name: str = 'zim95/ssh_ubuntu:latest'
@@ -173,7 +182,9 @@ class TestDeleteContainer(TestCase):
         self.assertEqual(len(final_pods), 0)  # one of the pod was deleted.
         self.assertEqual(len(final_services), 0)  # one of the service was deleted.
         self.assertEqual(len(final_ingresses), 0)  # the ingress was deleted.
-        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], False)  # the namespace was not deleted.
+        # the namespace is left to the reaper, which deletes it once it has been empty for its grace period.
+        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], True)
+        self.assertEqual(self.notified, [NAMESPACE_NAME])
 
     def test_b_delete_service(self) -> None:
         '''
@@ -210,14 +221,16 @@ class TestDeleteContainer(TestCase):
         self.assertEqual(len(final_pods), 0)  # one of the pod was deleted.
         self.assertEqual(len(final_services), 0)  # the service was deleted.
         self.assertEqual(len(final_ingresses), 0)  # the ingress was never there after the first test.
-        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], False)  # the namespace was not deleted.
+        # the namespace is left to the reaper, which deletes it once it has been empty for its grace period.
+        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], True)
+        self.assertEqual(self.notified, [NAMESPACE_NAME])
 
     def test_c_delete_pod(self) -> None:
         '''
         Create a container with an exposed exposure level.
         This creates: 1 pod, 1 service and 1 ingress.
         Delete the pod.
-        Result: The pod is deleted. The service and ingress are also deleted. The namespace is also deleted.
+        Result: The pod is deleted. The service and ingress are also deleted. The namespace is left to the reaper.
         '''
         print('Test: test_delete_pod')
         internal_container: dict = KubernetesContainerManager.create(self.pod_container_data)
@@ -247,4 +260,6 @@ class TestDeleteContainer(TestCase):
         self.assertEqual(len(final_pods), 0)  # the pod was deleted.
         self.assertEqual(len(final_services), 0)  # the service was deleted.
         self.assertEqual(len(final_ingresses), 0)  # the ingress was deleted.
-        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], False)  # the namespace was deleted.
+        # the namespace is left to the reaper, which deletes it once it has been empty for its grace period.
+        self.assertEqual(NAMESPACE_NAME in [namespace['namespace_name'] for namespace in final_namespaces], True)
+        self.assertEqual(self.notified, [NAMESPACE_NAME])
@@ -0,0 +1,102 @@
+# built-in
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+
+# modules
+from src.resources.cancel_scope import CancelScope, WaitCancelled
+from src.resources.create_stages import CreateStages
+from src.resources.fan_out import FanOut
+from src.resources.informer import KubernetesInformer
+
+
+def make_pod(name: str, phase: str) -> SimpleNamespace:
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, uid=f'{name}-uid'), status=SimpleNamespace(phase=phase))
+
+
+def is_running(event_type: str, pod: SimpleNamespace | None) -> bool:
+    return pod is not None and event_type != 'DELETED' and pod.status.phase == 'Running'
+
+
+class TestCreateStages(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestCreateStages')
+        self.informer: KubernetesInformer = KubernetesInformer(
+            'pod', 'test-namespace',
+            lambda namespace: SimpleNamespace(items=[make_pod('web-pod', 'Pending')], metadata=SimpleNamespace(resource_version='1')),
+        )
+        self.informer.relist()
+        self.rolled_back: list = []
+
+    def stage(self, position: int, create) -> tuple:
+        return create, lambda: self.rolled_back.append(position)
+
+    def test_stages_run_concurrently(self) -> None:
+        '''
+        Test that the stages run at the same time, the first one on the calling thread, and results keep their order.
+        '''
+        print('Test: test_stages_run_concurrently')
+
+        def create(position: int) -> tuple:
+            time.sleep(0.1)
+            return position, threading.current_thread().name
+
+        started: float = time.monotonic()
+        results: list = CreateStages.run(*[self.stage(position, lambda position=position: create(position)) for position in range(3)])
+        self.assertLess(time.monotonic() - started, 0.19)
+        self.assertEqual([position for position, _ in results], [0, 1, 2])
+        self.assertEqual(results[0][1], threading.current_thread().name)
+        self.assertTrue(all(name.startswith('create-stage') for _, name in results[1:]))
+        self.assertEqual(self.rolled_back, [])
+
+    def test_failure_cancels_waits_and_rolls_back_every_stage(self) -> None:
+        '''
+        Test that a failed stage cancels the readiness wait of another stage at once,
+        rolls back every stage, the failed one included, and is the error that is raised.
+        '''
+        print('Test: test_failure_cancels_waits_and_rolls_back_every_stage')
+
+        def fail() -> None:
+            time.sleep(0.05)
+            raise ValueError('service port is invalid')
+
+        started: float = time.monotonic()
+        with self.assertRaises(ValueError):
+            CreateStages.run(
+                self.stage(0, lambda: self.informer.wait_for('web-pod', is_running, timeout_seconds=5)),
+                self.stage(1, fail),
+                self.stage(2, lambda: 'ingress'),
+            )
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.rolled_back, [2, 1, 0])
+        self.assertEqual(self.informer.waiters, {})
+
+    def test_wait_in_a_cancelled_scope_fails_at_once(self) -> None:
+        '''
+        Test that a wait started after its scope was cancelled does not block.
+        '''
+        print('Test: test_wait_in_a_cancelled_scope_fails_at_once')
+        with CancelScope() as scope:
+            scope.cancel('pod create failed')
+            with self.assertRaises(WaitCancelled):
+                self.informer.wait_for('web-pod', is_running, timeout_seconds=5)
+        self.assertEqual(self.informer.waiters, {})
+
+    def test_creates_do_not_hold_fan_out_workers(self) -> None:
+        '''
+        Test that reads fanned out while many creates are waiting are not queued behind them.
+        '''
+        print('Test: test_creates_do_not_hold_fan_out_workers')
+        creates: list[threading.Thread] = [
+            threading.Thread(target=CreateStages.run, args=[self.stage(position, lambda: time.sleep(0.5)) for position in range(3)])
+            for _ in range(8)
+        ]
+        for create in creates:
+            create.start()
+        time.sleep(0.05)
+        started: float = time.monotonic()
+        self.assertEqual(FanOut.run(*[lambda read=read: read for read in range(4)]), [0, 1, 2, 3])
+        self.assertLess(time.monotonic() - started, 0.2)
+        for create in creates:
+            create.join()
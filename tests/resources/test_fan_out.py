@@ -0,0 +1,53 @@
+# built-in
+import time
+from unittest import TestCase
+
+# modules
+from src.resources.fan_out import FanOut
+from src.resources.request_context import RequestContext
+
+
+class TestFanOut(TestCase):
+    def test_results_keep_order_and_run_concurrently(self) -> None:
+        '''
+        Test that results come back in call order and the total time is close to the slowest call.
+        '''
+        print('Test: test_results_keep_order_and_run_concurrently')
+
+        def slow(value: int, seconds: float):
+            time.sleep(seconds)
+            return value
+
+        started: float = time.monotonic()
+        results: list = FanOut.run(lambda: slow(1, 0.3), lambda: slow(2, 0.1), lambda: slow(3, 0.2))
+        self.assertEqual(results, [1, 2, 3])
+        self.assertLess(time.monotonic() - started, 0.55)
+
+    def test_request_context_is_shared(self) -> None:
+        '''
+        Test that calls see the RequestContext of the caller.
+        '''
+        print('Test: test_request_context_is_shared')
+        with RequestContext() as context:
+            results: list = FanOut.run(lambda: RequestContext.current.get(), lambda: RequestContext.current.get())
+        self.assertEqual(results, [context, context])
+
+    def test_error_is_raised(self) -> None:
+        '''
+        Test that an error of any call is raised to the caller.
+        '''
+        print('Test: test_error_is_raised')
+
+        def fail():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            FanOut.run(lambda: 1, fail)
+
+    def test_nested_fan_out_runs_inline(self) -> None:
+        '''
+        Test that a fan out from inside a worker does not wait on the executor.
+        '''
+        print('Test: test_nested_fan_out_runs_inline')
+        results: list = FanOut.run(lambda: FanOut.run(lambda: 1, lambda: 2), lambda: 3)
+        self.assertEqual(results, [[1, 2], 3])
@@ -0,0 +1,114 @@
+# built-in
+from unittest import TestCase
+from unittest.mock import patch
+
+# modules
+import src.common.config as config
+from src.resources.image_prepull import ImagePopularity, ImagePrePuller, normalize_image
+from src.resources.resource_config import SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME
+
+# third party
+from kubernetes.client import V1Node, V1NodeStatus, V1ContainerImage
+
+
+def make_node(*names: str) -> V1Node:
+    return V1Node(status=V1NodeStatus(images=[V1ContainerImage(names=[name]) for name in names]))
+
+
+class TestImagePopularity(TestCase):
+    def test_top_images_follow_recent_creates(self) -> None:
+        '''
+        Test that images are ranked by create count, and that old creates count less.
+        '''
+        print('Test: test_top_images_follow_recent_creates')
+        popularity: ImagePopularity = ImagePopularity(half_life_seconds=100.0)
+        for _ in range(3):
+            popularity.record('ubuntu', now=0.0)
+        popularity.record('alpine', now=0.0)
+        self.assertEqual(popularity.top(1, now=0.0), ['ubuntu'])
+        # three creates four half lives ago weigh less than two creates now.
+        popularity.record('alpine', now=400.0)
+        self.assertEqual(popularity.top(2, now=400.0), ['alpine', 'ubuntu'])
+
+
+class TestImagePrePuller(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestImagePrePuller')
+        self.popularity: ImagePopularity = ImagePrePuller.popularity
+        ImagePrePuller.popularity = ImagePopularity()
+        allowlist = patch.object(config, 'IMAGE_PREPULL_IMAGES', ['ubuntu', 'alpine', 'python:3.12'])
+        allowlist.start()
+        self.addCleanup(allowlist.stop)
+
+    def tearDown(self) -> None:
+        ImagePrePuller.popularity = self.popularity
+        ImagePrePuller.pull_state = {}
+
+    def test_normalize_image(self) -> None:
+        '''
+        Test that image names are qualified the way nodes report them.
+        '''
+        print('Test: test_normalize_image')
+        self.assertEqual(normalize_image('ubuntu'), 'docker.io/library/ubuntu:latest')
+        self.assertEqual(normalize_image('zim95/ubuntu:22.04'), 'docker.io/zim95/ubuntu:22.04')
+        self.assertEqual(normalize_image('ghcr.io/org/image'), 'ghcr.io/org/image:latest')
+        self.assertEqual(normalize_image('localhost:5000/image:1'), 'localhost:5000/image:1')
+
+    def test_desired_images_start_with_sidecars(self) -> None:
+        '''
+        Test that the sidecar images are always pulled, followed by the popular allowlisted images in a stable order.
+        '''
+        print('Test: test_desired_images_start_with_sidecars')
+        ImagePrePuller.record('ubuntu')
+        ImagePrePuller.record('alpine')
+        ImagePrePuller.record('alpine')
+        self.assertEqual(ImagePrePuller.desired_images(), [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'alpine', 'ubuntu'])
+        # a change of popularity order alone does not change the list.
+        for _ in range(3):
+            ImagePrePuller.record('ubuntu')
+        self.assertEqual(ImagePrePuller.desired_images(), [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'alpine', 'ubuntu'])
+
+    def test_only_allowlisted_images_are_pulled(self) -> None:
+        '''
+        Test that creates of images outside the allowlist are not counted, however often they are created.
+        '''
+        print('Test: test_only_allowlisted_images_are_pulled')
+        for _ in range(50):
+            ImagePrePuller.record('attacker/miner')
+        ImagePrePuller.record('docker.io/library/python:3.12')
+        self.assertEqual(ImagePrePuller.desired_images(), [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'python:3.12'])
+
+    def test_cold_start_keeps_the_current_images(self) -> None:
+        '''
+        Test that without popularity (e.g. after a restart) the images already pre-pulled are kept,
+        except those no longer allowlisted.
+        '''
+        print('Test: test_cold_start_keeps_the_current_images')
+        current: list[str] = [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'ubuntu', 'alpine', 'removed/image']
+        self.assertEqual(ImagePrePuller.desired_images(current), [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'alpine', 'ubuntu'])
+
+    def test_daemonset_runs_no_image_binary(self) -> None:
+        '''
+        Test that every image is its own container running the copied static busybox, without a service account token.
+        '''
+        print('Test: test_daemonset_runs_no_image_binary')
+        images: list[str] = [SNAPSHOT_SIDECAR_IMAGE_NAME, STATUS_SIDECAR_IMAGE_NAME, 'ubuntu']
+        daemonset = ImagePrePuller.build_daemonset(images)
+        spec = daemonset.spec.template.spec
+        self.assertFalse(spec.automount_service_account_token)
+        self.assertEqual(ImagePrePuller.daemonset_images(daemonset), images)
+        for container in spec.containers:
+            self.assertTrue(container.command[0].startswith('/prepull/'))
+            self.assertEqual(container.args, [])
+
+    def test_pull_state_counts_nodes(self) -> None:
+        '''
+        Test that the pull state counts the nodes reporting each image.
+        '''
+        print('Test: test_pull_state_counts_nodes')
+        nodes: list[V1Node] = [
+            make_node('docker.io/library/ubuntu:latest', 'docker.io/library/alpine:latest'),
+            make_node('docker.io/library/ubuntu:latest'),
+            V1Node(status=None),
+        ]
+        self.assertEqual(ImagePrePuller.update_pull_state(['ubuntu', 'alpine', 'debian'], nodes), {'ubuntu': 2, 'alpine': 1, 'debian': 0})
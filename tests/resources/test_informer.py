@@ -0,0 +1,140 @@
+# built-in
+from unittest import TestCase
+from types import SimpleNamespace
+
+# modules
+from src.resources.informer import KubernetesInformer, InformerCache
+
+
+def make_object(name: str, resource_version: str = '1', uid: str | None = None, deletion_timestamp: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(metadata=SimpleNamespace(
+        name=name,
+        resource_version=resource_version,
+        uid=uid or f'{name}-uid',
+        deletion_timestamp=deletion_timestamp,
+    ))
+
+
+class TestKubernetesInformer(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestKubernetesInformer')
+        self.list_calls: int = 0
+        self.items: list = [make_object('pod-a'), make_object('pod-b')]
+
+        def list_function(namespace: str) -> SimpleNamespace:
+            self.list_calls += 1
+            return SimpleNamespace(items=list(self.items), metadata=SimpleNamespace(resource_version='10'))
+
+        self.informer: KubernetesInformer = KubernetesInformer('pod', 'test-namespace', list_function)
+
+    def test_relist_seeds_store(self) -> None:
+        '''
+        Test that a relist replaces the store and records the list resourceVersion.
+        '''
+        print('Test: test_relist_seeds_store')
+        self.informer.relist()
+        self.assertEqual(self.list_calls, 1)
+        self.assertEqual(sorted(obj.metadata.name for obj in self.informer.list()), ['pod-a', 'pod-b'])
+        self.assertEqual(self.informer.resource_version, '10')
+
+    def test_apply_events(self) -> None:
+        '''
+        Test that watch events update the store without listing again.
+        '''
+        print('Test: test_apply_events')
+        self.informer.relist()
+        self.informer.apply('ADDED', make_object('pod-c'))
+        self.informer.apply('MODIFIED', make_object('pod-a', '11'))
+        self.informer.apply('DELETED', make_object('pod-b'))
+        self.informer.apply('BOOKMARK', None)
+        self.assertEqual(self.list_calls, 1)
+        self.assertEqual(sorted(obj.metadata.name for obj in self.informer.list()), ['pod-a', 'pod-c'])
+        self.assertEqual(self.informer.get('pod-a').metadata.resource_version, '11')
+        self.assertIsNone(self.informer.get('pod-b'))
+
+    def test_record_created_does_not_overwrite(self) -> None:
+        '''
+        Test that a created object is visible immediately but never replaces a newer watch update.
+        '''
+        print('Test: test_record_created_does_not_overwrite')
+        self.informer.relist()
+        self.informer.record_created(make_object('pod-c', '12'))
+        self.assertEqual(self.informer.get('pod-c').metadata.resource_version, '12')
+        self.informer.record_created(make_object('pod-a', '5'))
+        self.assertEqual(self.informer.get('pod-a').metadata.resource_version, '1')
+
+    def test_uid_index(self) -> None:
+        '''
+        Test that the UID index follows the store, including a name reused by a new object.
+        '''
+        print('Test: test_uid_index')
+        self.informer.relist()
+        self.assertEqual(self.informer.get_name_by_uid('pod-a-uid'), 'pod-a')
+        self.informer.apply('MODIFIED', make_object('pod-a', '11', uid='pod-a-new-uid'))
+        self.assertIsNone(self.informer.get_name_by_uid('pod-a-uid'))
+        self.assertEqual(self.informer.get_name_by_uid('pod-a-new-uid'), 'pod-a')
+        self.informer.apply('DELETED', make_object('pod-b'))
+        self.assertIsNone(self.informer.get_name_by_uid('pod-b-uid'))
+
+    def test_indexes_follow_the_store(self) -> None:
+        '''
+        Test that derived values are computed on relist and recomputed only for the object of an event.
+        '''
+        print('Test: test_indexes_follow_the_store')
+        indexed: list = []
+
+        def indexer(obj: SimpleNamespace) -> str:
+            indexed.append(obj.metadata.name)
+            return obj.metadata.resource_version
+
+        informer: KubernetesInformer = KubernetesInformer('pod', 'test-namespace', self.informer.list_function, indexers={'version': indexer})
+        informer.relist()
+        informer.apply('MODIFIED', make_object('pod-a', '11'))
+        informer.apply('DELETED', make_object('pod-b'))
+        self.assertEqual(sorted(indexed), ['pod-a', 'pod-a', 'pod-b'])
+        self.assertEqual(informer.get_indexed('version', 'pod-a'), '11')
+        self.assertIsNone(informer.get_indexed('version', 'pod-b'))
+
+    def test_objects_being_deleted_are_hidden(self) -> None:
+        '''
+        Test that reads hide objects with a deletionTimestamp, and objects whose delete was just accepted.
+        '''
+        print('Test: test_objects_being_deleted_are_hidden')
+        self.informer.relist()
+        self.informer.apply('MODIFIED', make_object('pod-a', '11', deletion_timestamp='2024-01-01T00:00:00Z'))
+        self.informer.record_deleting('pod-b')
+        self.assertEqual(self.informer.list(), [])
+        self.assertIsNone(self.informer.get('pod-a'))
+        self.assertIsNone(self.informer.get_name_by_uid('pod-b-uid'))
+        self.assertEqual(len(self.informer.list(include_deleting=True)), 2)
+        # a new pod of the same name is visible again.
+        self.informer.apply('DELETED', make_object('pod-b'))
+        self.informer.apply('ADDED', make_object('pod-b', '12', uid='pod-b-new-uid'))
+        self.assertEqual(self.informer.get('pod-b').metadata.uid, 'pod-b-new-uid')
+
+
+class TestInformerCacheStop(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestInformerCacheStop')
+        list_function = lambda namespace: SimpleNamespace(items=[], metadata=SimpleNamespace(resource_version='1'))
+        self.informers: dict = {
+            (kind, 'missing-namespace'): KubernetesInformer(kind, 'missing-namespace', list_function)
+            for kind in ('pod', 'service', 'ingress')
+        }
+        for key, informer in self.informers.items():
+            InformerCache.informers[key] = informer
+            self.addCleanup(InformerCache.informers.pop, key, None)
+
+    def test_stop_unused_keeps_informers_of_other_calls(self) -> None:
+        '''
+        Test that only informers started by the caller and without waiters are stopped.
+        '''
+        print('Test: test_stop_unused_keeps_informers_of_other_calls')
+        # the pod informer existed before the read, a concurrent create waits on the service informer.
+        keep: set = {('pod', 'missing-namespace')}
+        self.informers[('service', 'missing-namespace')].waiters['web'] = [SimpleNamespace()]
+        InformerCache.stop_unused('missing-namespace', keep)
+        self.assertEqual(InformerCache.watched('missing-namespace'), {('pod', 'missing-namespace'), ('service', 'missing-namespace')})
+        self.assertTrue(self.informers[('ingress', 'missing-namespace')].stopped.is_set())
+        self.assertFalse(self.informers[('service', 'missing-namespace')].stopped.is_set())
+        self.assertEqual(len(self.informers[('service', 'missing-namespace')].waiters['web']), 1)
@@ -0,0 +1,113 @@
+# built-in
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+# modules
+from src.resources import KubernetesResourceManager
+from src.resources.ingress_address import IngressControllerAddress
+from src.resources.informer import InformerCache, KubernetesInformer
+from src.resources.resource_config import INGRESS_CONTROLLER_NAMESPACE, INGRESS_CONTROLLER_SERVICE_NAME, INGRESS_CONTROLLER_RETRY_SECONDS
+
+# third party
+from kubernetes.client import V1LoadBalancerStatus, V1LoadBalancerIngress
+from kubernetes.client.rest import ApiException
+
+
+def make_controller_service(ip: str | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=INGRESS_CONTROLLER_SERVICE_NAME, uid='controller-uid'),
+        status=SimpleNamespace(load_balancer=V1LoadBalancerStatus(ingress=[V1LoadBalancerIngress(ip=ip)] if ip else None)),
+    )
+
+
+class TestIngressControllerAddress(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestIngressControllerAddress')
+        IngressControllerAddress.observed = None
+        self.informer: KubernetesInformer = KubernetesInformer('service', INGRESS_CONTROLLER_NAMESPACE, None)
+        InformerCache.informers[('service', INGRESS_CONTROLLER_NAMESPACE)] = self.informer
+
+    def tearDown(self) -> None:
+        InformerCache.informers.pop(('service', INGRESS_CONTROLLER_NAMESPACE), None)
+        IngressControllerAddress.observed = None
+
+    def test_observed_address_is_used_without_controller_address(self) -> None:
+        '''
+        Test that the address of an already provisioned ingress is used while the controller service has none.
+        '''
+        print('Test: test_observed_address_is_used_without_controller_address')
+        self.assertIsNone(IngressControllerAddress.get(start=False))
+        self.informer.apply('ADDED', make_controller_service(None))
+        IngressControllerAddress.observe(IngressControllerAddress.from_load_balancer(
+            V1LoadBalancerStatus(ingress=[V1LoadBalancerIngress(hostname='lb.example.com')])
+        ))
+        self.assertEqual(IngressControllerAddress.get(start=False), 'lb.example.com')
+
+    def test_controller_address_follows_changes(self) -> None:
+        '''
+        Test that the controller service address wins and follows its watch events.
+        '''
+        print('Test: test_controller_address_follows_changes')
+        IngressControllerAddress.observe('10.0.0.1')
+        self.informer.apply('ADDED', make_controller_service('192.168.1.10'))
+        self.assertEqual(IngressControllerAddress.get(start=False), '192.168.1.10')
+        self.informer.apply('MODIFIED', make_controller_service('192.168.1.20'))
+        self.assertEqual(IngressControllerAddress.get(start=False), '192.168.1.20')
+
+
+class TestIngressControllerWatchFailure(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestIngressControllerWatchFailure')
+        self.list_calls: int = 0
+        self.forbidden: bool = True
+
+        def list_namespaced_service(namespace: str) -> SimpleNamespace:
+            self.list_calls += 1
+            if self.forbidden:
+                raise ApiException(status=403)
+            return SimpleNamespace(items=[make_controller_service('192.168.1.10')], metadata=SimpleNamespace(resource_version='1'))
+
+        self.now: float = 1000.0
+        patches: list = [
+            patch.object(KubernetesResourceManager, 'client', SimpleNamespace(list_namespaced_service=list_namespaced_service)),
+            patch.object(KubernetesInformer, 'run', lambda informer: None),
+            patch('src.resources.ingress_address.time.monotonic', lambda: self.now),
+        ]
+        for active in patches:
+            active.start()
+            self.addCleanup(active.stop)
+        IngressControllerAddress.observed = '10.0.0.1'
+        self.addCleanup(self.reset)
+
+    def reset(self) -> None:
+        InformerCache.informers.pop(('service', INGRESS_CONTROLLER_NAMESPACE), None)
+        IngressControllerAddress.observed = None
+        IngressControllerAddress.retry_at = 0.0
+        IngressControllerAddress.retry_delay = INGRESS_CONTROLLER_RETRY_SECONDS
+
+    def test_failed_watch_is_retried_with_backoff(self) -> None:
+        '''
+        Test that a failed watch of the controller namespace is not retried by every create,
+        leaves no informer behind, and is retried once its delay has passed.
+        '''
+        print('Test: test_failed_watch_is_retried_with_backoff')
+        self.assertEqual(IngressControllerAddress.get(), '10.0.0.1')
+        self.assertNotIn(('service', INGRESS_CONTROLLER_NAMESPACE), InformerCache.informers)
+        for _ in range(3):
+            self.assertEqual(IngressControllerAddress.get(), '10.0.0.1')
+        self.assertEqual(self.list_calls, 1)
+
+        # the delay doubles after the next failure.
+        self.now += INGRESS_CONTROLLER_RETRY_SECONDS
+        IngressControllerAddress.get()
+        self.assertEqual(self.list_calls, 2)
+        self.now += INGRESS_CONTROLLER_RETRY_SECONDS
+        IngressControllerAddress.get()
+        self.assertEqual(self.list_calls, 2)
+
+        self.forbidden = False
+        self.now += INGRESS_CONTROLLER_RETRY_SECONDS
+        self.assertEqual(IngressControllerAddress.get(), '192.168.1.10')
+        self.assertEqual(self.list_calls, 3)
+        self.assertEqual(IngressControllerAddress.retry_delay, INGRESS_CONTROLLER_RETRY_SECONDS)
@@ -0,0 +1,40 @@
+# built-in
+from unittest import TestCase
+
+# modules
+from src.resources.label_index import LabelSelectorIndex
+
+
+class TestLabelSelectorIndex(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestLabelSelectorIndex')
+        self.pods: list[dict] = [
+            {'pod_name': 'web-1', 'pod_labels': {'app': 'web', 'tier': 'frontend'}},
+            {'pod_name': 'web-2', 'pod_labels': {'app': 'web', 'tier': 'backend'}},
+            {'pod_name': 'db-1', 'pod_labels': {'app': 'db'}},
+            {'pod_name': 'bare', 'pod_labels': {}},
+        ]
+        self.index: LabelSelectorIndex = LabelSelectorIndex(self.pods)
+
+    def test_single_label_selector(self) -> None:
+        '''
+        Test that a single key selector returns every matching pod in listing order.
+        '''
+        print('Test: test_single_label_selector')
+        self.assertEqual([pod['pod_name'] for pod in self.index.match({'app': 'web'})], ['web-1', 'web-2'])
+
+    def test_multi_label_selector(self) -> None:
+        '''
+        Test that a selector with several keys is an intersection.
+        '''
+        print('Test: test_multi_label_selector')
+        self.assertEqual([pod['pod_name'] for pod in self.index.match({'app': 'web', 'tier': 'backend'})], ['web-2'])
+        self.assertEqual(self.index.match({'app': 'db', 'tier': 'backend'}), [])
+
+    def test_empty_selector_matches_nothing(self) -> None:
+        '''
+        Test that a service without a selector has no associated pods.
+        '''
+        print('Test: test_empty_selector_matches_nothing')
+        self.assertEqual(self.index.match({}), [])
+        self.assertEqual(self.index.match(None), [])
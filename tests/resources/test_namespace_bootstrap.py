@@ -0,0 +1,64 @@
+# built-in
+from datetime import datetime, timezone
+from unittest import TestCase
+
+# modules
+from src.resources.namespace_bootstrap import NamespaceBootstrap
+from src.resources.informer import InformerCache, KubernetesInformer
+
+# third party
+from kubernetes.client import V1Namespace, V1ObjectMeta
+
+NAMESPACE_NAME: str = 'test-namespace'
+
+
+def make_namespace(uid: str, deleting: bool = False) -> V1Namespace:
+    return V1Namespace(metadata=V1ObjectMeta(
+        name=NAMESPACE_NAME,
+        uid=uid,
+        deletion_timestamp=datetime.now(timezone.utc) if deleting else None,
+    ))
+
+
+class TestNamespaceBootstrap(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestNamespaceBootstrap')
+        NamespaceBootstrap.provisioned = {}
+        self.informer: KubernetesInformer = KubernetesInformer('namespace', None, None)
+        InformerCache.informers[('namespace', None)] = self.informer
+        self.informer.apply('ADDED', make_namespace('uid-1'))
+        NamespaceBootstrap.record({'namespace_id': 'uid-1', 'namespace_name': NAMESPACE_NAME})
+
+    def tearDown(self) -> None:
+        InformerCache.informers.pop(('namespace', None), None)
+        NamespaceBootstrap.provisioned = {}
+
+    def test_provisioned_namespace_is_served_from_cache(self) -> None:
+        '''
+        Test that a recorded namespace is returned while the informer still has it.
+        '''
+        print('Test: test_provisioned_namespace_is_served_from_cache')
+        self.assertEqual(NamespaceBootstrap.get(NAMESPACE_NAME), {'namespace_id': 'uid-1', 'namespace_name': NAMESPACE_NAME})
+
+    def test_watch_events_invalidate(self) -> None:
+        '''
+        Test that a namespace being deleted, deleted, or replaced by a new one of the same name is no longer provisioned.
+        '''
+        print('Test: test_watch_events_invalidate')
+        for event_type, namespace in (
+            ('MODIFIED', make_namespace('uid-1', deleting=True)),
+            ('DELETED', make_namespace('uid-1')),
+            ('ADDED', make_namespace('uid-2')),
+        ):
+            NamespaceBootstrap.record({'namespace_id': 'uid-1', 'namespace_name': NAMESPACE_NAME})
+            self.informer.apply(event_type, namespace)
+            self.assertIsNone(NamespaceBootstrap.get(NAMESPACE_NAME))
+            self.assertNotIn(NAMESPACE_NAME, NamespaceBootstrap.provisioned)
+
+    def test_forget(self) -> None:
+        '''
+        Test that a forgotten namespace has to be provisioned again.
+        '''
+        print('Test: test_forget')
+        NamespaceBootstrap.forget(NAMESPACE_NAME)
+        self.assertIsNone(NamespaceBootstrap.get(NAMESPACE_NAME))
@@ -0,0 +1,108 @@
+# built-in
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import TestCase
+
+# modules
+from src.resources.namespace_reaper import NamespaceReaper
+from src.resources.resource_config import NAMESPACE_MANAGED_BY_LABEL, NAMESPACE_MANAGED_BY_VALUE
+from src.resources.resource_config import REAPER_GRACE_SECONDS, REAPER_MAX_DELETES_PER_SWEEP
+
+
+NOW: float = 1_000_000.0
+
+
+def make_namespace(name: str, age_seconds: float = 3600.0, managed: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(metadata=SimpleNamespace(
+        name=name,
+        labels={NAMESPACE_MANAGED_BY_LABEL: NAMESPACE_MANAGED_BY_VALUE} if managed else {},
+        creation_timestamp=datetime.fromtimestamp(NOW - age_seconds, tz=timezone.utc),
+    ))
+
+
+class FakeReaper(NamespaceReaper):
+    '''
+    Reaper over an in memory cluster.
+    '''
+    namespaces: dict = {}
+    non_empty: set = set()
+    deleted: list = []
+
+    @classmethod
+    def managed_namespaces(cls) -> dict:
+        return {
+            name: namespace for name, namespace in cls.namespaces.items()
+            if namespace.metadata.labels.get(NAMESPACE_MANAGED_BY_LABEL) == NAMESPACE_MANAGED_BY_VALUE
+        }
+
+    @classmethod
+    def is_empty(cls, namespace_name: str) -> bool:
+        return namespace_name not in cls.non_empty
+
+    @classmethod
+    def delete(cls, namespace_names: list[str]) -> None:
+        cls.deleted.extend(namespace_names)
+        for namespace_name in namespace_names:
+            cls.namespaces.pop(namespace_name, None)
+
+
+class TestNamespaceReaper(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestNamespaceReaper')
+        FakeReaper.namespaces = {}
+        FakeReaper.non_empty = set()
+        FakeReaper.deleted = []
+        FakeReaper.dirty = set()
+        FakeReaper.empty_since = {}
+        FakeReaper.last_full_sweep = NOW  # no full sweep unless a test asks for one
+
+    def test_empty_namespace_is_deleted_after_grace_period(self) -> None:
+        '''
+        Test that a notified empty namespace is deleted only once it stayed empty for the grace period.
+        '''
+        print('Test: test_empty_namespace_is_deleted_after_grace_period')
+        FakeReaper.namespaces = {'user-1': make_namespace('user-1')}
+        FakeReaper.dirty = {'user-1'}
+        self.assertEqual(FakeReaper.sweep(NOW), [])
+        self.assertEqual(FakeReaper.sweep(NOW + REAPER_GRACE_SECONDS), ['user-1'])
+        self.assertEqual(FakeReaper.empty_since, {})
+
+    def test_namespace_with_resources_is_kept(self) -> None:
+        '''
+        Test that a namespace that gets a resource during the grace period is not deleted.
+        '''
+        print('Test: test_namespace_with_resources_is_kept')
+        FakeReaper.namespaces = {'user-1': make_namespace('user-1')}
+        FakeReaper.dirty = {'user-1'}
+        FakeReaper.sweep(NOW)
+        FakeReaper.non_empty = {'user-1'}
+        self.assertEqual(FakeReaper.sweep(NOW + REAPER_GRACE_SECONDS), [])
+        self.assertEqual(FakeReaper.empty_since, {})
+
+    def test_unmanaged_and_new_namespaces_are_never_deleted(self) -> None:
+        '''
+        Test that namespaces without the managed-by label, or younger than the grace period, are left alone.
+        '''
+        print('Test: test_unmanaged_and_new_namespaces_are_never_deleted')
+        FakeReaper.namespaces = {
+            'kube-system': make_namespace('kube-system', managed=False),
+            'user-new': make_namespace('user-new', age_seconds=1.0),
+        }
+        FakeReaper.dirty = {'kube-system', 'user-new'}
+        FakeReaper.last_full_sweep = 0.0
+        FakeReaper.sweep(NOW)
+        self.assertEqual(FakeReaper.sweep(NOW + REAPER_GRACE_SECONDS - 2.0), [])
+        self.assertEqual(FakeReaper.deleted, [])
+
+    def test_full_sweep_finds_leftovers_and_caps_deletes(self) -> None:
+        '''
+        Test that the periodic full sweep picks up every managed empty namespace, at most REAPER_MAX_DELETES_PER_SWEEP per sweep.
+        '''
+        print('Test: test_full_sweep_finds_leftovers_and_caps_deletes')
+        count: int = REAPER_MAX_DELETES_PER_SWEEP + 5
+        FakeReaper.namespaces = {f'user-{i:03d}': make_namespace(f'user-{i:03d}') for i in range(count)}
+        FakeReaper.last_full_sweep = 0.0
+        FakeReaper.sweep(NOW)
+        self.assertEqual(len(FakeReaper.sweep(NOW + REAPER_GRACE_SECONDS)), REAPER_MAX_DELETES_PER_SWEEP)
+        self.assertEqual(len(FakeReaper.sweep(NOW + REAPER_GRACE_SECONDS + 1.0)), 5)
+        self.assertEqual(len(FakeReaper.deleted), count)
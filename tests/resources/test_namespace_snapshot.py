@@ -0,0 +1,78 @@
+# built-in
+from unittest import TestCase
+
+# modules
+from src.resources.namespace_snapshot import NamespaceSnapshot
+
+# third party
+from kubernetes.client import V1Pod, V1ObjectMeta, V1PodSpec, V1PodStatus, V1Container
+from kubernetes.client import V1Service, V1ServiceSpec, V1ServicePort
+from kubernetes.client import V1Ingress, V1IngressSpec, V1IngressRule, V1HTTPIngressRuleValue, V1HTTPIngressPath
+from kubernetes.client import V1IngressBackend, V1IngressServiceBackend, V1ServiceBackendPort
+from kubernetes.client import V1IngressStatus, V1IngressLoadBalancerStatus
+
+NAMESPACE_NAME: str = 'test-namespace'
+
+
+def make_pod(name: str) -> V1Pod:
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, namespace=NAMESPACE_NAME, uid=f'{name}-uid', labels={'app': name}),
+        spec=V1PodSpec(containers=[V1Container(name=name, image='ubuntu')]),
+        status=V1PodStatus(phase='Running', pod_ip='10.0.0.1'),
+    )
+
+
+def make_service(name: str, pod_name: str) -> V1Service:
+    return V1Service(
+        metadata=V1ObjectMeta(name=name, namespace=NAMESPACE_NAME, uid=f'{name}-uid'),
+        spec=V1ServiceSpec(selector={'app': pod_name}, ports=[V1ServicePort(port=22)], type='ClusterIP', cluster_ip='10.1.0.1'),
+    )
+
+
+def make_ingress(name: str, service_name: str, port_count: int) -> V1Ingress:
+    paths: list = [
+        V1HTTPIngressPath(
+            path=f'/{name}/port-{index}',
+            path_type='Prefix',
+            backend=V1IngressBackend(service=V1IngressServiceBackend(name=service_name, port=V1ServiceBackendPort(number=22))),
+        )
+        for index in range(port_count)
+    ]
+    return V1Ingress(
+        metadata=V1ObjectMeta(name=name, namespace=NAMESPACE_NAME, uid=f'{name}-uid'),
+        spec=V1IngressSpec(rules=[V1IngressRule(host='localhost', http=V1HTTPIngressRuleValue(paths=paths))]),
+        status=V1IngressStatus(load_balancer=V1IngressLoadBalancerStatus(ingress=None)),
+    )
+
+
+class TestNamespaceSnapshot(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestNamespaceSnapshot')
+        self.snapshot: NamespaceSnapshot = NamespaceSnapshot(
+            namespace_name=NAMESPACE_NAME,
+            pods=[make_pod('exposed-pod'), make_pod('local-pod'), make_pod('internal-pod')],
+            services=[make_service('exposed-service', 'exposed-pod'), make_service('local-service', 'local-pod')],
+            ingresses=[make_ingress('exposed-ingress', 'exposed-service', 3)],
+        )
+
+    def test_services_are_joined_with_pods(self) -> None:
+        '''
+        Test that every service is associated with the pods its selector matches.
+        '''
+        print('Test: test_services_are_joined_with_pods')
+        associations: dict = {
+            service['service_name']: [pod['pod_name'] for pod in service['associated_resources']]
+            for service in self.snapshot.services
+        }
+        self.assertEqual(associations, {'exposed-service': ['exposed-pod'], 'local-service': ['local-pod']})
+
+    def test_ingresses_are_joined_with_services(self) -> None:
+        '''
+        Test that ingress backends are resolved from the snapshot.
+        One path per port points at the same service, so the service should appear only once.
+        '''
+        print('Test: test_ingresses_are_joined_with_services')
+        self.assertEqual(len(self.snapshot.ingresses), 1)
+        services: list = self.snapshot.ingresses[0]['associated_resources']
+        self.assertEqual([service['service_name'] for service in services], ['exposed-service'])
+        self.assertEqual([pod['pod_name'] for pod in services[0]['associated_resources']], ['exposed-pod'])
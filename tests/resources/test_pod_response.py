@@ -0,0 +1,37 @@
+# built-in
+from unittest import TestCase
+
+# modules
+from src.resources.pod_manager import PodManager
+from src.resources.resource_config import POD_IP_PENDING
+
+# third party
+from kubernetes.client import V1Pod, V1ObjectMeta, V1PodSpec, V1PodStatus, V1Container
+
+
+class TestPodResponse(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestPodResponse')
+        self.pod: V1Pod = V1Pod(
+            metadata=V1ObjectMeta(name='test-pod', namespace='test-namespace', uid='1234', labels={'app': 'test-pod'}),
+            spec=V1PodSpec(containers=[V1Container(name='test-pod', image='ubuntu')]),
+            status=V1PodStatus(phase='Pending'),
+        )
+
+    def test_pending_pod_does_not_block(self) -> None:
+        '''
+        A pod without an IP should be reported as pending without reading the API server.
+        '''
+        print('Test: test_pending_pod_does_not_block')
+        response: dict = PodManager.get_pod_response(self.pod)
+        self.assertEqual(response['pod_ip'], POD_IP_PENDING)
+        self.assertEqual(response['pod_id'], '1234')
+
+    def test_ip_taken_from_listed_pod(self) -> None:
+        '''
+        A pod that already has an IP should report it directly.
+        '''
+        print('Test: test_ip_taken_from_listed_pod')
+        self.pod.status.pod_ip = '10.0.0.5'
+        response: dict = PodManager.get_pod_response(self.pod)
+        self.assertEqual(response['pod_ip'], '10.0.0.5')
@@ -0,0 +1,50 @@
+# built-in
+from unittest import TestCase
+
+# modules
+from src.resources import KubernetesResourceManager
+from src.resources.request_context import RequestContext
+
+
+class TestRequestContext(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestRequestContext')
+        self.calls: int = 0
+
+    def read(self) -> dict:
+        self.calls += 1
+        return {'calls': self.calls}
+
+    def test_reads_are_memoized_within_a_request(self) -> None:
+        '''
+        Test that identical reads hit the API only once per request.
+        '''
+        print('Test: test_reads_are_memoized_within_a_request')
+        with RequestContext():
+            first: dict = KubernetesResourceManager.memoized_read('get', 'pod', 'test-namespace', 'test-pod', self.read)
+            second: dict = KubernetesResourceManager.memoized_read('get', 'pod', 'test-namespace', 'test-pod', self.read)
+            KubernetesResourceManager.memoized_read('get', 'pod', 'test-namespace', 'other-pod', self.read)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 2)
+
+    def test_writes_invalidate_the_namespace(self) -> None:
+        '''
+        Test that a write drops the memoized reads of its namespace only.
+        '''
+        print('Test: test_writes_invalidate_the_namespace')
+        with RequestContext():
+            KubernetesResourceManager.memoized_read('list', 'pod', 'test-namespace', None, self.read)
+            KubernetesResourceManager.memoized_read('list', 'pod', 'other-namespace', None, self.read)
+            KubernetesResourceManager.invalidate_reads('test-namespace')
+            KubernetesResourceManager.memoized_read('list', 'pod', 'test-namespace', None, self.read)
+            KubernetesResourceManager.memoized_read('list', 'pod', 'other-namespace', None, self.read)
+        self.assertEqual(self.calls, 3)
+
+    def test_no_memo_outside_a_request(self) -> None:
+        '''
+        Test that reads are not memoized without a RequestContext.
+        '''
+        print('Test: test_no_memo_outside_a_request')
+        KubernetesResourceManager.memoized_read('get', 'pod', 'test-namespace', 'test-pod', self.read)
+        KubernetesResourceManager.memoized_read('get', 'pod', 'test-namespace', 'test-pod', self.read)
+        self.assertEqual(self.calls, 2)
@@ -0,0 +1,42 @@
+# built-in
+from unittest import TestCase
+from unittest.mock import patch
+
+# modules
+from src.resources.pod_manager import PodManager
+from src.resources.service_manager import ServiceManager
+
+
+class TestServicePods(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestServicePods')
+        self.pods: list[dict] = [
+            {'pod_name': 'web-pod', 'pod_labels': {'app': 'web'}, 'status': 'Running'},
+            # pending pods are in no EndpointSlice yet.
+            {'pod_name': 'web-pod-2', 'pod_labels': {'app': 'web'}, 'status': 'Pending'},
+            {'pod_name': 'db-pod', 'pod_labels': {'app': 'db'}, 'status': 'Running'},
+        ]
+        patches: list = [
+            patch.object(PodManager, 'list', lambda data: self.pods),
+            patch.object(ServiceManager, 'endpoint_slice_informer', lambda namespace_name: self.fail('EndpointSlices were read')),
+        ]
+        for active in patches:
+            active.start()
+            self.addCleanup(active.stop)
+
+    def test_selector_associates_pods_that_are_not_ready(self) -> None:
+        '''
+        Test that a service is associated with every pod its selector matches, ready or not.
+        '''
+        print('Test: test_selector_associates_pods_that_are_not_ready')
+        service: dict = {'metadata': {'name': 'web', 'namespace': 'classroom'}, 'spec': {'selector': {'app': 'web'}}}
+        pods: list[dict] = ServiceManager.get_associated_pods(service)
+        self.assertEqual([pod['pod_name'] for pod in pods], ['web-pod', 'web-pod-2'])
+
+    def test_service_without_selector_has_no_pods(self) -> None:
+        '''
+        Test that a service without a selector is associated with no pod.
+        '''
+        print('Test: test_service_without_selector_has_no_pods')
+        service: dict = {'metadata': {'name': 'external', 'namespace': 'classroom'}, 'spec': {}}
+        self.assertEqual(ServiceManager.get_associated_pods(service), [])
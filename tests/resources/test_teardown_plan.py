@@ -0,0 +1,63 @@
+# built-in
+from unittest import TestCase
+
+# modules
+from src.containers.containers import KubernetesContainerHelper
+
+
+def make_pod(name: str) -> dict:
+    return {
+        'resource_type': 'pod',
+        'pod_name': name,
+        'associated_resources': [{'container_name': name, 'container_image': 'ubuntu'}],
+    }
+
+
+def make_service(name: str, pods: list[dict]) -> dict:
+    return {'resource_type': 'service', 'service_name': name, 'associated_resources': pods}
+
+
+class TestTeardownPlan(TestCase):
+    def test_ingress_is_torn_down_front_to_back(self) -> None:
+        '''
+        Test that an ingress is deleted before its services, and the services before their pods.
+        '''
+        print('Test: test_ingress_is_torn_down_front_to_back')
+        ingress: dict = {
+            'resource_type': 'ingress',
+            'ingress_name': 'web',
+            'associated_resources': [
+                make_service('web-a', [make_pod('pod-1'), make_pod('pod-2')]),
+                make_service('web-b', [make_pod('pod-3')]),
+            ],
+        }
+        self.assertEqual(KubernetesContainerHelper.teardown_stages(ingress), [
+            [('ingress', 'web')],
+            [('service', 'web-a'), ('service', 'web-b')],
+            [('pod', 'pod-1'), ('pod', 'pod-2'), ('pod', 'pod-3')],
+        ])
+
+    def test_shared_pods_are_deleted_once(self) -> None:
+        '''
+        Test that a pod selected by two services appears once in the plan.
+        '''
+        print('Test: test_shared_pods_are_deleted_once')
+        ingress: dict = {
+            'resource_type': 'ingress',
+            'ingress_name': 'web',
+            'associated_resources': [
+                make_service('web-a', [make_pod('pod-1')]),
+                make_service('web-b', [make_pod('pod-1')]),
+            ],
+        }
+        self.assertEqual(KubernetesContainerHelper.teardown_stages(ingress)[-1], [('pod', 'pod-1')])
+
+    def test_missing_service_plans_only_itself(self) -> None:
+        '''
+        Test that a service without a response still gets deleted by name.
+        '''
+        print('Test: test_missing_service_plans_only_itself')
+        self.assertEqual(
+            KubernetesContainerHelper.teardown_stages({'resource_type': 'service', 'service_name': 'web'}),
+            [[('service', 'web')]],
+        )
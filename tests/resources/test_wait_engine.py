@@ -0,0 +1,151 @@
+# built-in
+import threading
+from types import SimpleNamespace
+from unittest import TestCase
+
+# modules
+from src.resources.informer import KubernetesInformer
+
+
+def make_pod(name: str, phase: str) -> SimpleNamespace:
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, uid=f'{name}-uid'), status=SimpleNamespace(phase=phase))
+
+
+def is_running(event_type: str, pod: SimpleNamespace | None) -> bool:
+    return pod is not None and event_type != 'DELETED' and pod.status.phase == 'Running'
+
+
+def is_deleted(event_type: str, pod: SimpleNamespace | None) -> bool:
+    return event_type in ('DELETED', 'MISSING')
+
+
+class TestWaitEngine(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestWaitEngine')
+        self.items: list = [make_pod('pod-a', 'Pending')]
+
+        def list_function(namespace: str) -> SimpleNamespace:
+            return SimpleNamespace(items=list(self.items), metadata=SimpleNamespace(resource_version='10'))
+
+        self.informer: KubernetesInformer = KubernetesInformer('pod', 'test-namespace', list_function)
+        self.informer.relist()
+
+    def apply_later(self, event_type: str, obj: SimpleNamespace) -> threading.Timer:
+        timer: threading.Timer = threading.Timer(0.05, self.informer.apply, args=(event_type, obj))
+        timer.start()
+        return timer
+
+    def test_current_state_resolves_at_once(self) -> None:
+        '''
+        Test that a wait whose condition already holds returns without any event.
+        '''
+        print('Test: test_current_state_resolves_at_once')
+        self.assertIsNone(self.informer.wait_for('pod-x', is_deleted, timeout_seconds=1))
+        self.assertEqual(self.informer.waiters, {})
+
+    def test_many_waiters_share_one_event(self) -> None:
+        '''
+        Test that every waiter on an object is resolved by the same watch event.
+        '''
+        print('Test: test_many_waiters_share_one_event')
+        results: list = []
+        threads: list = [
+            threading.Thread(target=lambda: results.append(self.informer.wait_for('pod-a', is_running, timeout_seconds=5)))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        self.apply_later('MODIFIED', make_pod('pod-a', 'Running')).join()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(pod.status.phase == 'Running' for pod in results))
+        self.assertEqual(self.informer.waiters, {})
+
+    def test_deleted_event_resolves_deletion(self) -> None:
+        '''
+        Test that a DELETED event resolves a deletion wait.
+        '''
+        print('Test: test_deleted_event_resolves_deletion')
+        self.apply_later('DELETED', make_pod('pod-a', 'Running'))
+        self.informer.wait_for('pod-a', is_deleted, timeout_seconds=5)
+        self.assertIsNone(self.informer.get('pod-a'))
+
+    def test_relist_resolves_missed_deletion(self) -> None:
+        '''
+        Test that a relist re-checks the waiters, so a deletion missed by the watch is still seen.
+        '''
+        print('Test: test_relist_resolves_missed_deletion')
+        self.items = []
+        timer: threading.Timer = threading.Timer(0.05, self.informer.relist)
+        timer.start()
+        self.informer.wait_for('pod-a', is_deleted, timeout_seconds=5)
+
+    def test_predicate_error_fails_the_wait(self) -> None:
+        '''
+        Test that an exception raised by the predicate is raised to the waiter.
+        '''
+        print('Test: test_predicate_error_fails_the_wait')
+
+        def fail_on_failed(event_type: str, pod: SimpleNamespace | None) -> bool:
+            if pod is not None and pod.status.phase == 'Failed':
+                raise Exception('Pod entered Failed state')
+            return False
+
+        self.apply_later('MODIFIED', make_pod('pod-a', 'Failed'))
+        with self.assertRaises(Exception):
+            self.informer.wait_for('pod-a', fail_on_failed, timeout_seconds=5)
+
+    def test_timeout_raises_and_drops_waiter(self) -> None:
+        '''
+        Test that a wait raises TimeoutError and does not leave its waiter behind.
+        '''
+        print('Test: test_timeout_raises_and_drops_waiter')
+        with self.assertRaises(TimeoutError):
+            self.informer.wait_for('pod-a', is_running, timeout_seconds=0.05)
+        self.assertEqual(self.informer.waiters, {})
+
+
+def make_slice(name: str, service_name: str, ready: bool) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, uid=f'{name}-uid', labels={'kubernetes.io/service-name': service_name}),
+        endpoints=[SimpleNamespace(conditions=SimpleNamespace(ready=ready))],
+    )
+
+
+def has_ready_endpoint(event_type: str, slices: list) -> bool:
+    return any(endpoint.conditions.ready for endpoint_slice in slices for endpoint in endpoint_slice.endpoints)
+
+
+class TestGroupWait(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestGroupWait')
+
+        def list_function(namespace: str) -> SimpleNamespace:
+            return SimpleNamespace(items=[make_slice('service-a-1', 'service-a', False)], metadata=SimpleNamespace(resource_version='10'))
+
+        self.informer: KubernetesInformer = KubernetesInformer('endpointslice', 'test-namespace', list_function, group_label='kubernetes.io/service-name')
+        self.informer.relist()
+
+    def test_groups_follow_the_store(self) -> None:
+        '''
+        Test that objects are listed by the value of the group label.
+        '''
+        print('Test: test_groups_follow_the_store')
+        self.informer.apply('ADDED', make_slice('service-a-2', 'service-a', True))
+        self.informer.apply('ADDED', make_slice('service-b-1', 'service-b', True))
+        self.informer.apply('DELETED', make_slice('service-a-1', 'service-a', False))
+        self.assertEqual([obj.metadata.name for obj in self.informer.list_group('service-a')], ['service-a-2'])
+        self.assertEqual([obj.metadata.name for obj in self.informer.list_group('service-b')], ['service-b-1'])
+        self.assertEqual(self.informer.list_group('service-c'), [])
+
+    def test_group_wait_resolves_on_ready_endpoint(self) -> None:
+        '''
+        Test that a group wait resolves when any object of the group satisfies it.
+        '''
+        print('Test: test_group_wait_resolves_on_ready_endpoint')
+        timer: threading.Timer = threading.Timer(0.05, self.informer.apply, args=('MODIFIED', make_slice('service-a-1', 'service-a', True)))
+        timer.start()
+        slices: list = self.informer.wait_for_group('service-a', has_ready_endpoint, timeout_seconds=5)
+        self.assertEqual([obj.metadata.name for obj in slices], ['service-a-1'])
+        self.assertEqual(self.informer.group_waiters, {})
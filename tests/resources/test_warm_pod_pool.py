@@ -0,0 +1,188 @@
+# built-in
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+# modules
+import src.common.config as config
+from src.resources import KubernetesResourceManager
+from src.resources.dataclasses.pod.create_pod_dataclass import CreatePodDataClass, ResourceRequirementsDataClass
+from src.resources.pod_manager import PodManager
+from src.resources.resource_config import WARM_POOL_LABEL, WARM_POOL_STATE_LABEL, WARM_POOL_STATE_WARM
+from src.resources.warm_pod_pool import WarmPodPool
+
+# third party
+from kubernetes.client import V1Pod, V1ObjectMeta, V1PodStatus
+from kubernetes.client.rest import ApiException
+
+
+def make_create(
+    image_name: str = 'ubuntu',
+    memory_limit: str = '1Gi',
+    pod_name: str = 'web-pod',
+    target_ports: set[int] | None = None,
+    environment_variables: dict | None = None,
+) -> CreatePodDataClass:
+    return CreatePodDataClass(
+        pod_name=pod_name,
+        namespace_name='test-namespace',
+        image_name=image_name,
+        target_ports=target_ports if target_ports is not None else {8080},
+        environment_variables=environment_variables or {},
+        resource_requirements=ResourceRequirementsDataClass(memory_limit=memory_limit),
+    )
+
+
+def make_warm_pod(name: str, key: str, phase: str = 'Running') -> V1Pod:
+    return V1Pod(
+        metadata=V1ObjectMeta(name=name, labels={'app': name, WARM_POOL_LABEL: key, WARM_POOL_STATE_LABEL: WARM_POOL_STATE_WARM}),
+        status=V1PodStatus(phase=phase, pod_ip='10.0.0.1'),
+    )
+
+
+class TestWarmPodPool(TestCase):
+    def test_pool_key_depends_on_image_and_resources_only(self) -> None:
+        '''
+        Test that creates of the same image, ports and resource profile share a pool, whatever their name.
+        '''
+        print('Test: test_pool_key_depends_on_image_and_resources_only')
+        key: str = WarmPodPool.pool_key(make_create())
+        self.assertEqual(WarmPodPool.pool_key(make_create(pod_name='other-pod')), key)
+        self.assertNotEqual(WarmPodPool.pool_key(make_create(image_name='alpine')), key)
+        self.assertNotEqual(WarmPodPool.pool_key(make_create(target_ports={8080, 22})), key)
+        self.assertNotEqual(WarmPodPool.pool_key(make_create(memory_limit='2Gi')), key)
+        self.assertLessEqual(len(key), 63)  # label values are at most 63 characters
+
+    def test_pool_is_disabled_by_default(self) -> None:
+        '''
+        Test that nothing is pooled unless WARM_POOL_SIZE is set.
+        '''
+        print('Test: test_pool_is_disabled_by_default')
+        self.assertEqual(config.WARM_POOL_SIZE, 0)
+        self.assertFalse(WarmPodPool.enabled('test-namespace', 'ubuntu'))
+        self.assertIsNone(WarmPodPool.claim(make_create()))
+
+    def test_only_unclaimed_pool_pods_are_warm(self) -> None:
+        '''
+        Test that a pool pod stops being warm once its state label is removed by the claim.
+        '''
+        print('Test: test_only_unclaimed_pool_pods_are_warm')
+        warm: V1Pod = V1Pod(metadata=V1ObjectMeta(name='warm-1', labels={WARM_POOL_LABEL: 'key', WARM_POOL_STATE_LABEL: WARM_POOL_STATE_WARM}))
+        claimed: V1Pod = V1Pod(metadata=V1ObjectMeta(name='warm-2', labels={WARM_POOL_LABEL: 'key', 'app': 'web-pod'}))
+        self.assertTrue(PodManager.is_warm(warm))
+        self.assertFalse(PodManager.is_warm(claimed))
+        self.assertFalse(PodManager.is_warm(V1Pod(metadata=V1ObjectMeta(name='web-pod'))))
+
+
+class TestWarmPodClaim(TestCase):
+    def setUp(self) -> None:
+        print('Test: setUp TestWarmPodClaim')
+        self.key: str = WarmPodPool.pool_key(make_create())
+        # warm-1 was claimed by another create between the informer read and the patch.
+        self.pods: list[V1Pod] = [make_warm_pod('warm-1', self.key), make_warm_pod('warm-2', self.key), make_warm_pod('warm-3', 'other-key')]
+        self.patched: list[str] = []
+        self.deleted: list[str] = []
+        self.refills: list[str] = []
+        self.polled: list[str] = []
+        self.poll_error: Exception | None = None
+
+        def patch_namespaced_pod(name: str, namespace: str, body: list) -> None:
+            self.patched.append(name)
+            if name == 'warm-1':
+                raise ApiException(status=422)
+            pod: V1Pod = next(pod for pod in self.pods if pod.metadata.name == name)
+            del pod.metadata.labels[WARM_POOL_STATE_LABEL]
+            pod.metadata.labels['app'] = body[-1]['value']
+
+        def list_namespaced_pod(namespace: str, label_selector: str) -> SimpleNamespace:
+            selector: dict = dict(term.split('=') for term in label_selector.split(','))
+            return SimpleNamespace(items=[
+                pod for pod in self.pods
+                if all(pod.metadata.labels.get(key) == value for key, value in selector.items()) and not PodManager.is_warm(pod)
+            ])
+
+        def poll_status(namespace_name: str, pod_name: str, target_status: str) -> V1Pod:
+            self.polled.append(pod_name)
+            if self.poll_error is not None:
+                raise self.poll_error
+            return next(pod for pod in self.pods if pod.metadata.name == pod_name)
+
+        client: SimpleNamespace = SimpleNamespace(
+            patch_namespaced_pod=patch_namespaced_pod,
+            list_namespaced_pod=list_namespaced_pod,
+            delete_namespaced_pod=lambda name, namespace: self.deleted.append(name),
+        )
+        patches: list = [
+            patch.object(config, 'WARM_POOL_SIZE', 2),
+            patch.object(config, 'WARM_POOL_NAMESPACES', ['test-namespace']),
+            patch.object(KubernetesResourceManager, 'client', client),
+            patch.object(PodManager, 'client', client),
+            patch.object(PodManager, 'informer', lambda namespace_name: SimpleNamespace(list=lambda: self.pods)),
+            patch.object(PodManager, 'poll_status', poll_status),
+            patch.object(PodManager, 'get_pod_response', lambda pod, wait_for_ip=True: {
+                'pod_name': pod.metadata.name, 'pod_ports': [{'container_port': 8080}],
+            }),
+            patch.object(WarmPodPool, 'refill_later', lambda data: self.refills.append(data.pod_name)),
+        ]
+        for active in patches:
+            active.start()
+            self.addCleanup(active.stop)
+
+    def test_claim_takes_the_next_pod_when_one_is_taken(self) -> None:
+        '''
+        Test that a pod claimed by someone else is skipped, and that the response has the name of the claimed pod.
+        '''
+        print('Test: test_claim_takes_the_next_pod_when_one_is_taken')
+        response: dict = WarmPodPool.claim(make_create())
+        self.assertEqual(response, {'pod_name': 'warm-2', 'pod_ports': [{'container_port': 8080}]})
+        self.assertEqual(self.patched, ['warm-1', 'warm-2'])
+        self.assertEqual(self.refills, ['web-pod'])
+        # a retried create gets the same pod back once it runs, without claiming another one.
+        self.assertEqual(WarmPodPool.claim(make_create()), response)
+        self.assertEqual(self.patched, ['warm-1', 'warm-2'])
+        self.assertEqual(self.polled, ['warm-2', 'warm-2'])
+
+    def test_creates_with_environment_are_not_pooled(self) -> None:
+        '''
+        Test that a create with environment variables is never served from the pool.
+        '''
+        print('Test: test_creates_with_environment_are_not_pooled')
+        self.assertIsNone(WarmPodPool.claim(make_create(environment_variables={'TOKEN': 'secret'})))
+        self.assertEqual(self.patched, [])
+        self.assertEqual(self.refills, [])
+
+    def test_only_listed_namespaces_are_pooled(self) -> None:
+        '''
+        Test that namespaces outside of WARM_POOL_NAMESPACES, e.g. the namespace of a user, keep no pool.
+        '''
+        print('Test: test_only_listed_namespaces_are_pooled')
+        data: CreatePodDataClass = make_create()
+        data.namespace_name = 'user-namespace'
+        self.assertIsNone(WarmPodPool.claim(data))
+        self.assertEqual(self.patched, [])
+        self.assertEqual(self.refills, [])
+
+    def test_failed_claim_deletes_the_pod(self) -> None:
+        '''
+        Test that a claimed pod that does not come up is deleted, so that a retry does not pick it up.
+        '''
+        print('Test: test_failed_claim_deletes_the_pod')
+        self.poll_error = TimeoutError('pod did not start')
+        with self.assertRaises(TimeoutError):
+            WarmPodPool.claim(make_create())
+        self.assertEqual(self.deleted, ['warm-2'])
+        self.assertEqual(self.refills, ['web-pod'])
+
+    def test_refill_builds_pods_with_the_ports_of_the_create(self) -> None:
+        '''
+        Test that warm pods expose the ports of their pool, so that claimed pods report them.
+        '''
+        print('Test: test_refill_builds_pods_with_the_ports_of_the_create')
+        created: list[V1Pod] = []
+        PodManager.client.create_namespaced_pod = lambda namespace, body: created.append(body) or body
+        self.pods = []
+        WarmPodPool.refill(make_create())
+        self.assertEqual(len(created), 2)
+        for pod in created:
+            self.assertIn(8080, [port['container_port'] for port in PodManager.get_pod_ports(pod)])
+            self.assertEqual(pod.metadata.labels[WARM_POOL_LABEL], self.key)